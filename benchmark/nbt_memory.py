@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+
+# Measure the memory footprint of NBT tag objects.
+# Usage: python3 benchmark/nbt_memory.py [count]
+
+import os
+import sys
+import tracemalloc
+
+# import the nbt package directly, so MCDReforged is not required to run this script
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'packet_parser'))
+
+import nbt
+
+def make_tags(count: int):
+	return {
+		'Byte': lambda: [nbt.Byte(1) for _ in range(count)],
+		'Short': lambda: [nbt.Short(1) for _ in range(count)],
+		'Int': lambda: [nbt.Int(1) for _ in range(count)],
+		'Long': lambda: [nbt.Long(1) for _ in range(count)],
+		'Float': lambda: [nbt.Float(1.0) for _ in range(count)],
+		'Double': lambda: [nbt.Double(1.0) for _ in range(count)],
+		'String': lambda: [nbt.String('minecraft:stone') for _ in range(count)],
+		'List': lambda: [nbt.List(nbt.NBTID.End, []) for _ in range(count)],
+		'Compound': lambda: [nbt.Compound([]) for _ in range(count)],
+		'IntArray': lambda: [nbt.IntArray([]) for _ in range(count)],
+	}
+
+def measure(factory) -> float:
+	tracemalloc.start()
+	before = tracemalloc.get_traced_memory()[0]
+	tags = factory()
+	after = tracemalloc.get_traced_memory()[0]
+	tracemalloc.stop()
+	count = len(tags)
+	del tags
+	return (after - before) / count
+
+def main():
+	count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+	print(f'{"tag":<10} {"bytes/tag":>10}')
+	for name, factory in make_tags(count).items():
+		print(f'{name:<10} {measure(factory):>10.1f}')
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+
+# Measure the memory and allocation time of packet and struct objects,
+# compared with the same classes with an instance __dict__.
+# Requires loginproxy.
+# Usage: python3 benchmark/packet_alloc.py [count]
+
+import os
+import sys
+import timeit
+import tracemalloc
+import types
+import importlib
+import uuid
+
+from loginproxy import PacketBuffer
+
+# load the packet modules without the plugin entry, so MCDReforged is not required to run this script
+_root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'packet_parser')
+for _name, _path in (('packet_parser', _root), ('packet_parser.packets', os.path.join(_root, 'packets'))):
+	_module = types.ModuleType(_name)
+	_module.__path__ = [_path]
+	sys.modules[_name] = _module
+
+P = importlib.import_module('packet_parser.packets.packet_1_19')
+
+CASES = {
+	'PlayUpdateEntityPositionS2C': (P.PlayUpdateEntityPositionS2C, (1234, 10, -20, 30, True)),
+	'PlaySetPlayerPositionC2S': (P.PlaySetPlayerPositionC2S, (1.5, 64.0, -3.25, False)),
+	'PlaySpawnEntityS2C': (P.PlaySpawnEntityS2C, (1, uuid.UUID(int=1), 5, 1.0, 2.0, 3.0, 0, 0, 0, 0, 0, 0, 0)),
+	'Slot': (P.Slot, (True, 1, 64, None)),
+	'IntRange': (P.IntRange, (3, 0, 10)),
+	'Modifier': (P.Modifier, (uuid.UUID(int=1), 0.5, 0)),
+}
+
+def with_dict(cls: type) -> type:
+	# a subclass without __slots__ has an instance __dict__ like a plain class
+	return type(cls.__name__, (cls,), {})
+
+def measure(cls: type, args: tuple, count: int) -> float:
+	tracemalloc.start()
+	before = tracemalloc.get_traced_memory()[0]
+	objs = [cls(*args) for _ in range(count)]
+	after = tracemalloc.get_traced_memory()[0]
+	tracemalloc.stop()
+	del objs
+	return (after - before) / count
+
+def timing(call, number: int = 20000) -> float:
+	return min(timeit.repeat(call, number=number, repeat=5)) / number * 1e9
+
+def main():
+	count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+	print(f'{"class":<28} {"bytes/obj":>10} {"dict":>8} {"new ns":>8} {"dict":>8} {"decode ns":>10} {"dict":>8}')
+	for name, (cls, args) in CASES.items():
+		dcls = with_dict(cls)
+		row = [measure(cls, args, count), measure(dcls, args, count),
+			timing(lambda: cls(*args)), timing(lambda: dcls(*args))]
+		if getattr(cls, '_LAYOUT', None) is not None:
+			b = PacketBuffer()
+			cls(*args).to_bytes(b)
+			data = bytes(b.data)
+			dunpack = dcls.unpack_from
+			row += [timing(lambda: cls.unpack_from(data)), timing(lambda: dunpack(data))]
+			print(f'{name:<28} {row[0]:>10.1f} {row[1]:>8.1f} {row[2]:>8.0f} {row[3]:>8.0f} {row[4]:>10.0f} {row[5]:>8.0f}')
+		else:
+			print(f'{name:<28} {row[0]:>10.1f} {row[1]:>8.1f} {row[2]:>8.0f} {row[3]:>8.0f} {"-":>10} {"-":>8}')
+
+if __name__ == '__main__':
+	main()
@@ -110,6 +110,27 @@ _wiki_reader_map = {
 	'2048 BYTES': '{}.read(2048)',
 }
 
+# the FieldType of the plain wiki types, see packet_parser/fields.py
+_wiki_field_map = {
+	'BOOLEAN': 'BOOL',
+	'BYTE': 'BYTE',
+	'UNSIGNED BYTE': 'UBYTE',
+	'SHORT': 'SHORT',
+	'UNSIGNED SHORT': 'USHORT',
+	'INT': 'INT',
+	'LONG': 'LONG',
+	'FLOAT': 'FLOAT',
+	'DOUBLE': 'DOUBLE',
+	'STRING': 'STRING',
+	'CHAT': 'JSON',
+	'IDENTIFIER': 'STRING',
+	'VARINT': 'VARINT',
+	'VARLONG': 'VARLONG',
+	'POSITION': 'POSITION',
+	'ANGLE': 'ANGLE',
+	'UUID': 'UUID',
+}
+
 def wiki_type_to_python(typ: str) -> str:
 	typ = typ.upper()
 	optional = typ.startswith('OPTIONAL ')
@@ -175,6 +196,28 @@ def wiki_type_to_reader(typ: str, r: str) -> str:
 	t = t.format(r)
 	return t
 
+def wiki_type_to_field(typ: str, last: bool) -> str | None:
+	"""
+	Return the FieldType of a plain wiki type, or None if the field needs hand-written code
+	"""
+	typ = typ.upper()
+	if typ.startswith('OPTIONAL ') or typ.startswith('ARRAY OF '):
+		return None
+	if typ.endswith(' ENUM'):
+		typ = typ[:-len(' ENUM')]
+	if typ.endswith(')'):
+		typ = typ[:typ.index('(') - 1]
+	if typ == 'BYTE ARRAY' and last:
+		# a trailing byte array takes the rest of the packet
+		return 'REST'
+	return _wiki_field_map.get(typ, None)
+
+def write_fields(fd, attr: str, fields: list[tuple[str, str]]):
+	fd.write(f'\t{attr} = (\n')
+	for name, field in fields:
+		fd.write(f"\t\t('{name}', {field}),\n")
+	fd.write('\t)\n\n')
+
 def generate_packets(target: str, id, fd):
 	target = target.format(id=id)
 	fd.write(f'# Generate from <{target}>\n\n')
@@ -264,22 +307,42 @@ def generate_packets(target: str, id, fd):
 					name = name1 + ':' + name2
 					typ = typ1 + ' OF ' + typ2
 				fields.append((name.replace(' ', '_').replace('-', '_').lower(), typ, note))
+			slots = ', '.join(f"'{name}'" for name, _, _ in fields)
+			if len(fields) == 1:
+				slots += ','
+			fd.write(f'\t__slots__ = ({slots})\n\n')
+			# plain layouts are decoded from a FIELDS table,
+			# the others get hand-written methods and a HEAD_FIELDS table of their leading plain fields
+			table = []
+			for i, (name, typ, _) in enumerate(fields):
+				field = wiki_type_to_field(typ, i == len(fields) - 1)
+				if field is None:
+					break
+				table.append((name, field))
+			plain = len(table) == len(fields)
+			if plain:
+				write_fields(fd, 'FIELDS', table)
+			elif table:
+				write_fields(fd, 'HEAD_FIELDS', table)
 			fd.write('\tdef __init__(self,\n')
 			for name, typ, note in fields:
 				fd.write(f'\t\t{name}: {wiki_type_to_python(typ)}, # {typ}\n')
 			fd.write('\t):\n')
 			for name, typ, note in fields:
 				fd.write(f'\t\tself.{name} = {name} # {note}\n')
-			fd.write('\n')
-			fd.write('\tdef to_bytes(self, b: PacketBuffer) -> None:\n')
-			for name, typ, _ in fields:
-				fd.write(f'\t\t{wiki_type_to_writter(typ, "b", f"self.{name}")}\n')
-			fd.write('\n')
-			fd.write('\t@classmethod\n')
-			fd.write('\tdef parse_from(cls, r: PacketReader) -> Self:\n')
-			for name, typ, _ in fields:
-				fd.write(f'\t\t{name} = {wiki_type_to_reader(typ, "r")}\n')
-			fd.write('\t\treturn cls(' + ', '.join(name for name, _, _ in fields) + ')\n')
+			if not fields:
+				fd.write('\t\tpass\n')
+			if not plain:
+				fd.write('\n')
+				fd.write('\tdef to_bytes(self, b: PacketBuffer) -> None:\n')
+				for name, typ, _ in fields:
+					fd.write(f'\t\t{wiki_type_to_writter(typ, "b", f"self.{name}")}\n')
+				fd.write('\n')
+				fd.write('\t@classmethod\n')
+				fd.write('\tdef parse_from(cls, r: PacketReader) -> Self:\n')
+				for name, typ, _ in fields:
+					fd.write(f'\t\t{name} = {wiki_type_to_reader(typ, "r")}\n')
+				fd.write('\t\treturn cls(' + ', '.join(name for name, _, _ in fields) + ')\n')
 		except Exception as e:
 			fd.write('\t# ' + '=' * 16 + 'ERROR' + '=' * 16 + '\n')
 			fd.write('\t# ' + str(e) + '\n')
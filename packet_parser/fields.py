@@ -0,0 +1,431 @@
+
+import json
+import operator
+import struct
+import uuid
+from typing import final, Any, Callable, Iterable
+
+from loginproxy import PacketBuffer, PacketReader
+
+__all__ = [
+	'FieldType', 'Layout', 'LazyFields',
+	'BOOL', 'BYTE', 'UBYTE', 'SHORT', 'USHORT', 'INT', 'LONG', 'FLOAT', 'DOUBLE', 'ANGLE',
+	'UUID', 'POSITION',
+	'VARINT', 'VARLONG', 'STRING', 'JSON', 'BYTES', 'REST',
+	'optional', 'array_of',
+	'unpack_varint', 'pack_varint',
+]
+
+def unpack_varint(buf: bytes | bytearray | memoryview, offset: int, bits: int = 32) -> tuple[int, int]:
+	"""
+	Decode a VarInt (or a VarLong with bits=64) at `offset`, return the value and the offset after it
+	"""
+	value = 0
+	shift = 0
+	while True:
+		b = buf[offset]
+		offset += 1
+		value |= (b & 0x7f) << shift
+		if not b & 0x80:
+			break
+		shift += 7
+		if shift >= bits:
+			raise ValueError('VarInt is too big')
+	if value >> (bits - 1):
+		value -= 1 << bits
+	return value, offset
+
+def pack_varint(value: int, bits: int = 32) -> bytes:
+	value &= (1 << bits) - 1
+	out = bytearray()
+	while value > 0x7f:
+		out.append((value & 0x7f) | 0x80)
+		value >>= 7
+	out.append(value)
+	return bytes(out)
+
+def _decode_position(v: int) -> tuple[int, int, int]:
+	# x: 26 bits, z: 26 bits, y: 12 bits, all signed
+	x = v >> 38
+	y = v & 0xfff
+	z = (v >> 12) & 0x3ffffff
+	if y >= 0x800:
+		y -= 0x1000
+	if z >= 0x2000000:
+		z -= 0x4000000
+	return x, y, z
+
+def _encode_position(pos: tuple[int, int, int]) -> int:
+	x, y, z = pos
+	v = ((x & 0x3ffffff) << 38) | ((z & 0x3ffffff) << 12) | (y & 0xfff)
+	if v >= 1 << 63:
+		v -= 1 << 64
+	return v
+
+def _decode_uuid(v: bytes) -> uuid.UUID:
+	return uuid.UUID(bytes=v)
+
+def _encode_uuid(v: uuid.UUID) -> bytes:
+	return v.bytes
+
+@final
+class FieldType:
+	"""
+	The wire type of a field.
+	Fixed-width types have a struct format and optional converters, so the Layout can merge runs of them
+	into one struct; the other types read, write and unpack themselves.
+	`skip` returns the offset after a field without decoding it, it is derived from unpack_from if not given.
+	"""
+
+	__slots__ = ('name', 'fmt', 'decode', 'encode', 'read', 'write', 'unpack_from', 'skip', 'flag', 'element')
+
+	def __init__(self, name: str, *,
+		fmt: str | None = None,
+		decode: Callable[[Any], Any] | None = None,
+		encode: Callable[[Any], Any] | None = None,
+		read: Callable[[PacketReader], Any] | None = None,
+		write: Callable[[PacketBuffer, Any], None] | None = None,
+		unpack_from: Callable[[Any, int], tuple[Any, int]] | None = None,
+		skip: Callable[[Any, int], int] | None = None,
+		flag: str | None = None,
+		element: 'FieldType | None' = None,
+	):
+		self.name = name
+		self.fmt = fmt
+		self.decode = decode
+		self.encode = encode
+		self.flag = flag
+		self.element = element
+		if fmt is not None:
+			st = struct.Struct('>' + fmt)
+			size = st.size
+			if decode is None:
+				def read_raw(r: PacketReader) -> Any:
+					return st.unpack(r.read(size))[0]
+				def unpack_raw(buf, offset: int) -> tuple[Any, int]:
+					return st.unpack_from(buf, offset)[0], offset + size
+				read, unpack_from = read_raw, unpack_raw
+			else:
+				dec = decode
+				def read_decoded(r: PacketReader) -> Any:
+					return dec(st.unpack(r.read(size))[0])
+				def unpack_decoded(buf, offset: int) -> tuple[Any, int]:
+					return dec(st.unpack_from(buf, offset)[0]), offset + size
+				read, unpack_from = read_decoded, unpack_decoded
+			if encode is None:
+				def write_raw(b: PacketBuffer, v: Any) -> None:
+					b.write(st.pack(v))
+				write = write_raw
+			else:
+				enc = encode
+				def write_encoded(b: PacketBuffer, v: Any) -> None:
+					b.write(st.pack(enc(v)))
+				write = write_encoded
+			def skip_fixed(buf, offset: int) -> int:
+				return offset + size
+			skip = skip_fixed
+		assert read is not None and write is not None and unpack_from is not None
+		if skip is None:
+			unpack = unpack_from
+			def skip_unpacked(buf, offset: int) -> int:
+				return unpack(buf, offset)[1]
+			skip = skip_unpacked
+		self.read = read
+		self.write = write
+		self.unpack_from = unpack_from
+		self.skip = skip
+
+	@property
+	def fixed(self) -> bool:
+		return self.fmt is not None
+
+	def __repr__(self) -> str:
+		return self.name
+
+BOOL   = FieldType('Boolean', fmt='?')
+BYTE   = FieldType('Byte', fmt='b')
+UBYTE  = FieldType('Unsigned Byte', fmt='B')
+SHORT  = FieldType('Short', fmt='h')
+USHORT = FieldType('Unsigned Short', fmt='H')
+INT    = FieldType('Int', fmt='i')
+LONG   = FieldType('Long', fmt='q')
+FLOAT  = FieldType('Float', fmt='f')
+DOUBLE = FieldType('Double', fmt='d')
+ANGLE  = FieldType('Angle', fmt='b')
+UUID   = FieldType('UUID', fmt='16s', decode=_decode_uuid, encode=_encode_uuid)
+POSITION = FieldType('Position', fmt='q', decode=_decode_position, encode=_encode_position)
+
+def _unpack_string(buf, offset: int) -> tuple[str, int]:
+	n, offset = unpack_varint(buf, offset)
+	end = offset + n
+	if n < 0 or end > len(buf):
+		raise ValueError(f'Invalid string length {n}')
+	return bytes(buf[offset:end]).decode('utf8'), end
+
+def _unpack_json(buf, offset: int) -> tuple[Any, int]:
+	s, offset = _unpack_string(buf, offset)
+	return json.loads(s), offset
+
+def _unpack_bytes(buf, offset: int) -> tuple[bytes, int]:
+	n, offset = unpack_varint(buf, offset)
+	end = offset + n
+	if n < 0 or end > len(buf):
+		raise ValueError(f'Invalid byte array length {n}')
+	return bytes(buf[offset:end]), end
+
+def _skip_varint(buf, offset: int) -> int:
+	while buf[offset] & 0x80:
+		offset += 1
+	return offset + 1
+
+def _skip_sized(buf, offset: int) -> int:
+	n, offset = unpack_varint(buf, offset)
+	if n < 0:
+		raise ValueError(f'Invalid length {n}')
+	return offset + n
+
+def _write_bytes(b: PacketBuffer, v: bytes) -> None:
+	b.write_varint(len(v))
+	b.write(v)
+
+VARINT  = FieldType('VarInt', read=lambda r: r.read_varint(), write=lambda b, v: b.write_varint(v),
+	unpack_from=unpack_varint, skip=_skip_varint)
+VARLONG = FieldType('VarLong', read=lambda r: r.read_varlong(), write=lambda b, v: b.write_varlong(v),
+	unpack_from=lambda buf, offset: unpack_varint(buf, offset, 64), skip=_skip_varint)
+STRING  = FieldType('String', read=lambda r: r.read_string(), write=lambda b, v: b.write_string(v),
+	unpack_from=_unpack_string, skip=_skip_sized)
+JSON    = FieldType('Chat', read=lambda r: r.read_json(), write=lambda b, v: b.write_json(v),
+	unpack_from=_unpack_json, skip=_skip_sized)
+# a byte array prefixed with its VarInt length
+BYTES   = FieldType('Byte Array', read=lambda r: r.read(r.read_varint()), write=_write_bytes,
+	unpack_from=_unpack_bytes, skip=_skip_sized)
+# the remaining bytes of the packet, only valid as the last field
+REST    = FieldType('Remaining Bytes', read=lambda r: r.read(), write=lambda b, v: b.write(v),
+	unpack_from=lambda buf, offset: (bytes(buf[offset:]), len(buf)), skip=lambda buf, offset: len(buf))
+
+def optional(element: FieldType, flag: str) -> FieldType:
+	"""
+	A field which is present only if the earlier Boolean field `flag` is true, it is None otherwise
+	"""
+	return FieldType(f'Optional {element.name}', read=element.read, write=element.write,
+		unpack_from=element.unpack_from, skip=element.skip, flag=flag, element=element)
+
+def array_of(element: FieldType) -> FieldType:
+	"""
+	A list prefixed with its VarInt length
+	"""
+	read_element = element.read
+	write_element = element.write
+	unpack_element = element.unpack_from
+	def read(r: PacketReader) -> list:
+		return [read_element(r) for _ in range(r.read_varint())]
+	def write(b: PacketBuffer, v: list) -> None:
+		b.write_varint(len(v))
+		for e in v:
+			write_element(b, e)
+	def unpack_from(buf, offset: int) -> tuple[list, int]:
+		n, offset = unpack_varint(buf, offset)
+		if n < 0:
+			raise ValueError(f'Invalid array length {n}')
+		values = []
+		for _ in range(n):
+			e, offset = unpack_element(buf, offset)
+			values.append(e)
+		return values, offset
+	return FieldType(f'Array of {element.name}', read=read, write=write, unpack_from=unpack_from, element=element)
+
+# a step reads or unpacks its fields and appends them to the value list
+_ReadStep = Callable[[PacketReader, list], None]
+_UnpackStep = Callable[[Any, int, list], int]
+_WriteStep = Callable[[PacketBuffer, tuple], None]
+
+@final
+class Layout:
+	"""
+	The compiled wire layout of a packet: a table of (field name, FieldType).
+	Runs of fixed-width fields are merged into one precompiled struct, so e.g. three Doubles
+	and a Boolean are read with a single unpack.
+	"""
+
+	__slots__ = ('fields', 'names', 'index', 'flags', 'runs', '_getter', '_read', '_unpack', '_write')
+
+	def __init__(self, fields: Iterable[tuple[str, FieldType]]):
+		self.fields: tuple[tuple[str, FieldType], ...] = tuple(fields)
+		self.names: tuple[str, ...] = tuple(name for name, _ in self.fields)
+		if len(set(self.names)) != len(self.names):
+			raise ValueError(f'Duplicated field names in {self.names}')
+		index = self.index = {name: i for i, name in enumerate(self.names)}
+		for i, (name, typ) in enumerate(self.fields):
+			if typ.flag is not None and index.get(typ.flag, i) >= i:
+				raise ValueError(f'Flag {repr(typ.flag)} of field {repr(name)} must be an earlier field')
+			if typ is REST and i != len(self.fields) - 1:
+				raise ValueError(f'Field {repr(name)} takes the remaining bytes, so it must be the last field')
+		# the index of the flag field of each field, or -1
+		self.flags: tuple[int, ...] = tuple(-1 if typ.flag is None else index[typ.flag] for _, typ in self.fields)
+		# [(first field index, fields)], a run is either fixed-width fields or one variable field
+		self.runs: list[tuple[int, tuple[FieldType, ...]]] = []
+		for i, (_, typ) in enumerate(self.fields):
+			if typ.fixed and self.runs and self.runs[-1][1][-1].fixed:
+				start, types = self.runs[-1]
+				self.runs[-1] = (start, types + (typ,))
+			else:
+				self.runs.append((i, (typ,)))
+		getter = operator.attrgetter(*self.names) if self.names else (lambda obj: ())
+		self._getter: Callable[[Any], Any] = getter if len(self.names) != 1 else (lambda obj: (getter(obj),))
+		self._read: list[_ReadStep] = []
+		self._unpack: list[_UnpackStep] = []
+		self._write: list[_WriteStep] = []
+		for start, types in self.runs:
+			if types[0].fixed:
+				self._compile_fixed(start, types)
+			else:
+				flag = types[0].flag
+				self._compile_variable(start, types[0], None if flag is None else index[flag])
+
+	def _compile_fixed(self, start: int, types: tuple[FieldType, ...]) -> None:
+		st = struct.Struct('>' + ''.join(t.fmt for t in types)) # type: ignore[misc]
+		size = st.size
+		end = start + len(types)
+		decoders = tuple((start + i, t.decode) for i, t in enumerate(types) if t.decode is not None)
+		encoders = tuple((i, t.encode) for i, t in enumerate(types) if t.encode is not None)
+		if decoders:
+			def read(r: PacketReader, values: list) -> None:
+				values.extend(st.unpack(r.read(size)))
+				for i, decode in decoders:
+					values[i] = decode(values[i])
+			def unpack(buf, offset: int, values: list) -> int:
+				values.extend(st.unpack_from(buf, offset))
+				for i, decode in decoders:
+					values[i] = decode(values[i])
+				return offset + size
+		else:
+			def read(r: PacketReader, values: list) -> None:
+				values.extend(st.unpack(r.read(size)))
+			def unpack(buf, offset: int, values: list) -> int:
+				values.extend(st.unpack_from(buf, offset))
+				return offset + size
+		if encoders:
+			def write(b: PacketBuffer, values: tuple) -> None:
+				run = list(values[start:end])
+				for i, encode in encoders:
+					run[i] = encode(run[i])
+				b.write(st.pack(*run))
+		else:
+			def write(b: PacketBuffer, values: tuple) -> None:
+				b.write(st.pack(*values[start:end]))
+		self._read.append(read)
+		self._unpack.append(unpack)
+		self._write.append(write)
+
+	def _compile_variable(self, i: int, typ: FieldType, flag: int | None) -> None:
+		read_field = typ.read
+		unpack_field = typ.unpack_from
+		write_field = typ.write
+		if flag is None:
+			def read(r: PacketReader, values: list) -> None:
+				values.append(read_field(r))
+			def unpack(buf, offset: int, values: list) -> int:
+				v, offset = unpack_field(buf, offset)
+				values.append(v)
+				return offset
+			def write(b: PacketBuffer, values: tuple) -> None:
+				write_field(b, values[i])
+		else:
+			def read(r: PacketReader, values: list) -> None:
+				values.append(read_field(r) if values[flag] else None)
+			def unpack(buf, offset: int, values: list) -> int:
+				if values[flag]:
+					v, offset = unpack_field(buf, offset)
+					values.append(v)
+				else:
+					values.append(None)
+				return offset
+			def write(b: PacketBuffer, values: tuple) -> None:
+				if values[flag]:
+					v = values[i]
+					if v is None:
+						raise ValueError(f'Field {repr(self.names[i])} must be set when {repr(self.names[flag])} is true')
+					write_field(b, v)
+		self._read.append(read)
+		self._unpack.append(unpack)
+		self._write.append(write)
+
+	def values_of(self, obj: Any) -> tuple:
+		"""
+		Return the field values of an object in layout order
+		"""
+		return self._getter(obj)
+
+	def read(self, r: PacketReader) -> list:
+		values: list = []
+		for step in self._read:
+			step(r, values)
+		return values
+
+	def unpack_from(self, buf: bytes | bytearray | memoryview, offset: int = 0) -> tuple[list, int]:
+		"""
+		Decode the fields from a buffer at `offset`, return the values and the offset after them
+		"""
+		values: list = []
+		try:
+			for step in self._unpack:
+				offset = step(buf, offset, values)
+		except (IndexError, struct.error):
+			raise ValueError('Truncated packet data') from None
+		return values, offset
+
+	def write(self, b: PacketBuffer, values: tuple) -> None:
+		for step in self._write:
+			step(b, values)
+
+	def __repr__(self) -> str:
+		return 'Layout(' + ', '.join(f'{name}: {typ.name}' for name, typ in self.fields) + ')'
+
+@final
+class LazyFields:
+	"""
+	Decodes single fields of an encoded payload on demand.
+	The offsets of the fields are indexed as they are reached, so a field is found by skipping
+	over the fields before it once, without decoding them.
+	"""
+
+	__slots__ = ('layout', 'buf', 'offsets', 'values')
+
+	def __init__(self, layout: Layout, buf: bytes | bytearray | memoryview):
+		self.layout = layout
+		self.buf = memoryview(buf)
+		self.offsets: list[int] = [0]
+		self.values: dict[int, Any] = {}
+
+	def _offset(self, i: int) -> int:
+		offsets = self.offsets
+		fields = self.layout.fields
+		flags = self.layout.flags
+		buf = self.buf
+		while len(offsets) <= i:
+			j = len(offsets) - 1
+			offset = offsets[j]
+			if flags[j] < 0 or self.get(flags[j]):
+				offset = fields[j][1].skip(buf, offset)
+				if offset > len(buf):
+					raise ValueError('Truncated packet data')
+			offsets.append(offset)
+		return offsets[i]
+
+	def get(self, i: int) -> Any:
+		"""
+		Return the value of the i-th field, decoding it if it was not decoded yet
+		"""
+		values = self.values
+		if i in values:
+			return values[i]
+		flag = self.layout.flags[i]
+		try:
+			if flag >= 0 and not self.get(flag):
+				value = None
+			else:
+				value, _ = self.layout.fields[i][1].unpack_from(self.buf, self._offset(i))
+		except (IndexError, struct.error):
+			raise ValueError('Truncated packet data') from None
+		values[i] = value
+		return value
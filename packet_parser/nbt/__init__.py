@@ -1,20 +1,45 @@
 
 from typing import Any
 
-from .nbt import NBT, NBTID
+from .buffer import BytesReader, BytesBuffer
+from .nbt import NBT, NBTID, NameCache, name_cache
 from .compound import End, Compound
 from .lists import List, String, ByteArray, IntArray, LongArray
 from .numbers import Byte, Short, Int, Long, Float, Double
+from .raw import RawNBT
+from .plain import Schema, parse_python, write_python, from_python
+from .stream import EventKind, NBTEvent, iter_events
+from .path import NBTPath
+from .snbt import parse_snbt, write_snbt, to_snbt
+from .nbtfile import Compression, load_file, save_file
+from .region import RegionFile
+from .validate import Spec, Validator
+from .parser import ParseLimits
+from .diff import PatchOp, PatchEntry, Patch
 
 __all__ = [
+	'BytesReader', 'BytesBuffer',
 	'NBT', 'NBTID',
+	'NameCache', 'name_cache',
 	'Byte', 'Short', 'Int', 'Long', 'Float', 'Double',
 	'End', 'Compound', 'List', 'String',
 	'ByteArray', 'IntArray', 'LongArray',
+	'RawNBT',
+	'Schema', 'parse_python', 'write_python', 'from_python',
+	'EventKind', 'NBTEvent', 'iter_events',
+	'NBTPath',
+	'parse_snbt', 'write_snbt', 'to_snbt',
+	'Compression', 'load_file', 'save_file',
+	'RegionFile',
+	'Spec', 'Validator',
+	'ParseLimits',
+	'PatchOp', 'PatchEntry', 'Patch',
 	'nbt_to_chat_object', 'chat_object_to_nbt',
 ]
 
 def nbt_to_chat_object(tag: NBT) -> Any:
+	if isinstance(tag, RawNBT):
+		tag = tag.decode()
 	if isinstance(tag, Byte):
 		return tag.value != 0
 	if isinstance(tag, String):
@@ -23,9 +48,11 @@ def nbt_to_chat_object(tag: NBT) -> Any:
 		return [nbt_to_chat_object(v) for v in tag.children]
 	if isinstance(tag, Compound):
 		data: dict[str, Any] = {}
-		for v in tag:
+		for v in tag.values():
 			data[v.name] = nbt_to_chat_object(v)
 		return data
+	if isinstance(tag, (Short, Int, Long, Float, Double)):
+		return tag.value
 	raise TypeError(f'Unexpected NBT tag: {repr(tag)}')
 
 def chat_object_to_nbt(data: Any) -> NBT:
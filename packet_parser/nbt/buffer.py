@@ -0,0 +1,120 @@
+
+import struct
+
+__all__ = [
+	'BytesReader',
+	'BytesBuffer',
+]
+
+_BOOL = struct.Struct('>?')
+_BYTE = struct.Struct('>b')
+_UBYTE = struct.Struct('>B')
+_SHORT = struct.Struct('>h')
+_USHORT = struct.Struct('>H')
+_INT = struct.Struct('>i')
+_LONG = struct.Struct('>q')
+_FLOAT = struct.Struct('>f')
+_DOUBLE = struct.Struct('>d')
+
+class BytesReader:
+	"""
+	A reader over an in-memory buffer, implements the part of loginproxy.PacketReader that NBT uses.
+	The buffer is kept as a memoryview so slices of it do not copy.
+	"""
+
+	__slots__ = ('buf', 'offset')
+
+	def __init__(self, data: bytes | bytearray | memoryview, offset: int = 0):
+		self.buf = data if isinstance(data, memoryview) else memoryview(data)
+		self.offset = offset
+
+	@property
+	def remain(self) -> int:
+		return len(self.buf) - self.offset
+
+	def read(self, n: int | None = None) -> bytes:
+		start = self.offset
+		if n is None:
+			n = len(self.buf) - start
+		end = start + n
+		if n < 0 or end > len(self.buf):
+			raise EOFError(f'Trying to read {n} bytes, but only {len(self.buf) - start} bytes remain')
+		self.offset = end
+		return self.buf[start:end].tobytes()
+
+	def _unpack(self, st: struct.Struct):
+		offset = self.offset
+		if offset + st.size > len(self.buf):
+			raise EOFError(f'Trying to read {st.size} bytes, but only {len(self.buf) - offset} bytes remain')
+		self.offset = offset + st.size
+		return st.unpack_from(self.buf, offset)[0]
+
+	def read_bool(self) -> bool:
+		return self._unpack(_BOOL)
+
+	def read_byte(self) -> int:
+		return self._unpack(_BYTE)
+
+	def read_ubyte(self) -> int:
+		return self._unpack(_UBYTE)
+
+	def read_short(self) -> int:
+		return self._unpack(_SHORT)
+
+	def read_ushort(self) -> int:
+		return self._unpack(_USHORT)
+
+	def read_int(self) -> int:
+		return self._unpack(_INT)
+
+	def read_long(self) -> int:
+		return self._unpack(_LONG)
+
+	def read_float(self) -> float:
+		return self._unpack(_FLOAT)
+
+	def read_double(self) -> float:
+		return self._unpack(_DOUBLE)
+
+class BytesBuffer:
+	"""
+	An in-memory writer, implements the part of loginproxy.PacketBuffer that NBT uses
+	"""
+
+	__slots__ = ('data',)
+
+	def __init__(self):
+		self.data = bytearray()
+
+	def getvalue(self) -> bytes:
+		return bytes(self.data)
+
+	def write(self, data: bytes | bytearray | memoryview) -> None:
+		self.data += data
+
+	def write_bool(self, value: bool) -> None:
+		self.data += _BOOL.pack(value)
+
+	def write_byte(self, value: int) -> None:
+		self.data += _BYTE.pack(value)
+
+	def write_ubyte(self, value: int) -> None:
+		self.data += _UBYTE.pack(value)
+
+	def write_short(self, value: int) -> None:
+		self.data += _SHORT.pack(value)
+
+	def write_ushort(self, value: int) -> None:
+		self.data += _USHORT.pack(value)
+
+	def write_int(self, value: int) -> None:
+		self.data += _INT.pack(value)
+
+	def write_long(self, value: int) -> None:
+		self.data += _LONG.pack(value)
+
+	def write_float(self, value: float) -> None:
+		self.data += _FLOAT.pack(value)
+
+	def write_double(self, value: float) -> None:
+		self.data += _DOUBLE.pack(value)
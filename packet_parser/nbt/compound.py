@@ -1,9 +1,18 @@
 
-from typing import final, Self
+import struct
+from typing import final, Any, Iterable, Iterator, Self, TextIO
 
-from loginproxy import PacketBuffer, PacketReader
+from loginproxy import PacketReader
 
-from .nbt import NBT, NBTID
+from .nbt import NBT, NBTID, name_cache, _FROZEN, _MAX_RECURSION, _blake2b
+from .mutf8 import *
+from .buffer import BytesReader
+from .scan import skip_payload
+from .diff import diff, Patch
+from .parser import parse_payload
+
+_USHORT = struct.Struct('>H')
+_HEAD = struct.Struct('>BH')
 
 __all__ = [
 	'End',
@@ -12,18 +21,27 @@ __all__ = [
 
 @final
 class End(NBT, id=NBTID.End):
+	__slots__ = ()
+
 	_INSTANCE = None
 	def __new__(cls):
 		if cls._INSTANCE is None:
 			cls._INSTANCE = super().__new__(cls)
 			super().__init__(cls._INSTANCE, None)
+			cls._INSTANCE._parent = _FROZEN
 		return cls._INSTANCE
 
 	def __init__(self):
 		pass
 
-	def to_bytes_value(self, b: PacketBuffer):
-		pass
+	def _payload_size(self) -> int:
+		return 0
+
+	def _pack_payload(self, buf: bytearray, offset: int) -> int:
+		return offset
+
+	def to_python(self) -> None:
+		return None
 
 	@classmethod
 	def parse_from(cls, r: PacketReader, name: str | None = None) -> Self:
@@ -32,40 +50,222 @@ class End(NBT, id=NBTID.End):
 
 @final
 class Compound(NBT, id=NBTID.Compound):
+	__slots__ = ('_children', '_raw', '_spans', '_digest', '_source')
+
+	_CONTAINER = True
+
 	def __init__(self, children: list[NBT] | dict[str, NBT], name: str | None = None):
 		super().__init__(name)
+		self._digest: bytes | None = None
+		self._source: tuple[memoryview, int, int] | None = None
+		# A lazily parsed compound keeps None for the children which are not decoded yet,
+		# their (start, end) offsets in self._raw are stored in self._spans
+		self._children: dict[str, NBT | None]
+		self._raw: memoryview | None = None
+		self._spans: dict[str, tuple[int, int]] | None = None
 		if isinstance(children, dict):
 			for key, tag in children.items():
 				tag.name = key
-			self._children = children
+				children[key] = self._adopt(tag)
+			self._children = children # type: ignore[assignment]
 		else:
 			self._children = {}
 			for tag in children:
-				self._children[tag.name] = tag
+				self._children[tag.name] = self._adopt(tag)
+
+	def _load(self, name: str) -> NBT:
+		assert self._raw is not None and self._spans is not None
+		start, _ = self._spans.pop(name)
+		tag = NBT.parse(BytesReader(self._raw, start), lazy=True)
+		if self._parent is _FROZEN:
+			tag.freeze()
+		else:
+			tag._parent = self
+		self._children[name] = tag
+		return tag
+
+	def _raw_child(self, name: str) -> memoryview | None:
+		"""
+		Return the encoded bytes of a child which is not decoded yet, or None
+		"""
+		if self._children.get(name, 0) is not None:
+			return None
+		assert self._raw is not None and self._spans is not None
+		start, end = self._spans[name]
+		return self._raw[start:end]
+
+	def _peek(self, name: str) -> NBT:
+		"""
+		Return a child without the copy on write of __getitem__
+		"""
+		tag = self._children[name]
+		return self._load(name) if tag is None else tag
+
+	def _load_all(self) -> None:
+		if self._spans:
+			for name in list(self._spans.keys()):
+				self._load(name)
+
+	def _freeze_children(self) -> list[NBT]:
+		# children which are not decoded yet are frozen when they are loaded
+		return [tag for tag in self._children.values() if tag is not None]
+
+	def thaw(self) -> 'Compound':
+		if self._parent is not _FROZEN:
+			return self
+		clone = self.__class__([], self._name)
+		clone._children = self._children.copy()
+		clone._raw = self._raw
+		clone._spans = None if self._spans is None else self._spans.copy()
+		clone._digest = self._digest
+		clone._source = self._source
+		return clone
+
+	def _nested(self) -> list[NBT]:
+		nested = []
+		for name, tag in self._children.items():
+			if tag is None:
+				raw = self._raw_child(name)
+				assert raw is not None
+				if raw[0] != NBTID.List.value and raw[0] != NBTID.Compound.value:
+					continue
+			elif not tag._CONTAINER:
+				continue
+			nested.append(self._peek(name))
+		return nested
+
+	def digest(self) -> bytes:
+		if self._digest is None:
+			self._digest_nested()
+			h = _blake2b(b'\x0a')
+			for name in sorted(self._children):
+				raw = self._raw_child(name)
+				if raw is not None and raw[0] != NBTID.List.value and raw[0] != NBTID.Compound.value:
+					# leaf children which are not decoded yet are hashed from their payload
+					d = _blake2b(raw[0:1].tobytes() + raw[3 + _USHORT.unpack_from(raw, 1)[0]:]).digest()
+				else:
+					d = self._peek(name).digest()
+				data = encode_mutf8(name)
+				h.update(_USHORT.pack(len(data)) + data + d)
+			self._digest = h.digest()
+		return self._digest
 
 	@property
 	def children(self) -> list[NBT]:
-		return list(self._children.values())
+		self._load_all()
+		return list(self._children.values()) # type: ignore[arg-type]
+
+	def to_python(self) -> dict[str, Any]:
+		return self._container_to_python()
+
+	def _python_items(self) -> tuple[dict[str, Any], Iterable[tuple[str, NBT]]]:
+		return {}, ((name, self._peek(name)) for name in self._children)
+
+	def _payload_size(self) -> int:
+		return self._nested_size()
+
+	def _size_into(self, depth: int, deeper: list[NBT]) -> int:
+		if self._source is not None:
+			_, start, end = self._source
+			return end - start
+		size = 1
+		spans = self._spans
+		cached = name_cache._encoded.get
+		for name, tag in self._children.items():
+			if tag is None:
+				assert spans is not None
+				start, end = spans[name]
+				size += end - start
+				continue
+			data = cached(name) or name_cache.encode(name)
+			size += 3 + len(data)
+			if not tag._CONTAINER:
+				size += tag._payload_size()
+			elif depth < _MAX_RECURSION:
+				size += tag._size_into(depth + 1, deeper)
+			else:
+				deeper.append(tag)
+		return size
 
-	def to_bytes_value(self, b: PacketBuffer) -> None:
-		for tag in self._children.values():
-			tag.to_bytes(b)
-		End().to_bytes(b)
+	def _pack_payload(self, buf: bytearray, offset: int) -> int:
+		return self._pack_nested(buf, offset)
+
+	def _pack_from(self, buf: bytearray, offset: int, it: Iterator[tuple[str, NBT | None]] | None,
+		depth: int) -> tuple[int, NBT | None, Iterator[tuple[str, NBT | None]] | None]:
+		if it is None:
+			if self._source is not None:
+				# nothing changed since the compound was parsed
+				src, start, end = self._source
+				buf[offset:offset + end - start] = src[start:end]
+				return offset + end - start, None, None
+			it = iter(self._children.items())
+		spans = self._spans
+		raw = self._raw
+		cached = name_cache._encoded.get
+		pack_head = _HEAD.pack_into
+		for name, tag in it:
+			if tag is None:
+				# children which are not decoded yet are copied from the parsed bytes
+				assert raw is not None and spans is not None
+				start, end = spans[name]
+				buf[offset:offset + end - start] = raw[start:end]
+				offset += end - start
+				continue
+			data = cached(name) or name_cache.encode(name)
+			n = len(data)
+			pack_head(buf, offset, tag._TID, n)
+			offset += 3
+			buf[offset:offset + n] = data
+			offset += n
+			if not tag._CONTAINER:
+				offset = tag._pack_payload(buf, offset)
+			elif depth < _MAX_RECURSION:
+				offset, child, sub = tag._pack_from(buf, offset, None, depth + 1)
+				if child is not None:
+					offset = tag._pack_deeper(buf, offset, child, sub)
+			else:
+				return offset, tag, it
+		buf[offset] = 0x00
+		return offset + 1, None, None
 
 	@classmethod
 	def parse_from(cls, r: PacketReader, name: str | None = None) -> Self:
-		children: list[NBT] = []
-		while True:
-			tag = NBT.parse(r)
-			if tag.ID == NBTID.End:
-				break
-			children.append(tag)
-		return cls(children, name=name)
+		return parse_payload(r, NBTID.Compound.value, name) # type: ignore[return-value]
+
+	@classmethod
+	def parse_lazy(cls, r: BytesReader, name: str | None = None) -> Self:
+		buf = r.buf
+		offset = begin = r.offset
+		children: dict[str, NBT | None] = {}
+		spans: dict[str, tuple[int, int]] = {}
+		try:
+			while True:
+				tid = buf[offset]
+				if tid == NBTID.End.value:
+					offset += 1
+					break
+				start = offset
+				offset += 3 + _USHORT.unpack_from(buf, offset + 1)[0]
+				key = name_cache.decode(buf[start + 3:offset].tobytes())
+				offset = skip_payload(buf, offset, tid)
+				children[key] = None
+				spans[key] = (start, offset)
+		except (IndexError, struct.error):
+			raise ValueError('Truncated NBT data') from None
+		r.offset = offset
+		self = cls([], name=name)
+		self._children = children
+		self._raw = buf
+		self._spans = spans
+		self._source = (buf, begin, offset)
+		return self
 
 	def add(self, tag: NBT):
+		self._check_mutable()
 		if tag.name in self._children:
 			raise ValueError(f'Name {tag.name} already exists')
-		self._children[tag.name] = tag
+		self._children[tag.name] = self._adopt(tag)
+		self._changed()
 
 	def remove(self, tag: NBT) -> bool:
 		t = self.get(tag.name, None)
@@ -75,12 +275,28 @@ class Compound(NBT, id=NBTID.Compound):
 		return False
 
 	def pop(self, name: str, default: NBT | None = None) -> NBT | None:
-		return self._children.pop(name, None)
+		if name not in self._children:
+			return default
+		tag = self[name]
+		del self[name]
+		return tag
 
 	def get(self, name: str, default: NBT | None = None) -> NBT | None:
-		return self._children.get(name, default)
+		if name not in self._children:
+			return default
+		return self[name]
+
+	def diff(self, other: 'Compound') -> Patch:
+		"""
+		Return the patch which turns this compound into `other`
+		"""
+		return diff(self, other)
+
+	def apply(self, patch: Patch) -> None:
+		patch.apply(self)
 
 	def values(self):
+		self._load_all()
 		return self._children.values()
 
 	def __len__(self) -> int:
@@ -90,27 +306,40 @@ class Compound(NBT, id=NBTID.Compound):
 		return iter(self._children)
 
 	def __getitem__(self, name: str) -> NBT:
-		return self._children[name]
+		tag = self._children[name]
+		if tag is None:
+			tag = self._load(name)
+		elif tag._parent is _FROZEN and tag._CONTAINER and self._parent is not _FROZEN:
+			# copy on write, the clone has the same content so no digest is dropped
+			tag = tag.thaw()
+			tag._parent = self
+			self._children[name] = tag
+		return tag
 
 	def __setitem__(self, name: str, tag: NBT):
+		self._check_mutable()
 		tag.name = name
-		self._children[name] = tag
+		if self._spans:
+			self._spans.pop(name, None)
+		self._children[name] = self._adopt(tag)
+		self._changed()
 
 	def __delitem__(self, name: str):
-		del self._children[name]
+		self._check_mutable()
+		tag = self._children.pop(name)
+		if tag is not None and tag._parent is self:
+			tag._parent = None
+		if self._spans:
+			self._spans.pop(name, None)
+		self._changed()
 
 	def __contains__(self, obj: str | NBT) -> bool:
 		if isinstance(obj, NBT):
-			return obj in self._children.values()
+			return obj in self.values()
 		return obj in self._children
 
-	def as_str(self, *, indent: int = 0) -> str:
-		ind = '  ' * indent
-		s = super().as_str(indent=indent) + ': ' + \
-			('1 entry' if len(self) == 1 else '{} entries\n'.format(len(self))) + \
-			ind + '{\n'
-		indent += 1
-		for e in sorted(self.values(), key=lambda v: v.name):
-			s += e.as_str(indent=indent) + '\n'
-		s += ind + '}'
-		return s
+	def _str_entries(self) -> tuple[Iterable[NBT], int]:
+		return (self._peek(k) for k in sorted(self._children)), len(self._children)
+
+	def _write_str(self, out: TextIO, indent: int) -> None:
+		self._write_entries(out, indent)
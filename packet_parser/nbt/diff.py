@@ -0,0 +1,210 @@
+
+import enum
+from typing import final, Iterator, NamedTuple, Self, TYPE_CHECKING
+
+from loginproxy import PacketBuffer, PacketReader
+
+from .nbt import NBT, NBTID
+from .buffer import BytesReader, BytesBuffer
+from .mutf8 import *
+from .raw import RawNBT
+
+if TYPE_CHECKING:
+	from .compound import Compound
+
+__all__ = [
+	'PatchOp',
+	'PatchEntry',
+	'Patch',
+	'diff',
+]
+
+class PatchOp(enum.IntEnum):
+	ADD    = 1 # the key does not exist in the old tree
+	REMOVE = 2 # the key does not exist in the new tree
+	CHANGE = 3 # the key or list index exists in both trees, but the value is replaced
+
+class PatchEntry(NamedTuple):
+	op: PatchOp
+	# keys and list indexes from the root compound to the changed tag
+	path: tuple[str | int, ...]
+	# the new tag for ADD and CHANGE, None for REMOVE
+	tag: NBT | None
+
+def _payload(tag: NBT) -> bytes:
+	b = BytesBuffer()
+	tag.to_bytes_value(b)
+	return b.getvalue()
+
+def _diff_list(old, new, path: tuple[str | int, ...], entries: list[PatchEntry]) -> None:
+	if old.element != new.element or len(old) != len(new):
+		entries.append(PatchEntry(PatchOp.CHANGE, path, new))
+		return
+	for i, (a, b) in enumerate(zip(old._elements(), new._elements())):
+		_diff_tag(a, b, path + (i,), entries)
+
+def _decoded(tag: NBT) -> NBT:
+	# a RawNBT compound or list is decoded lazily, so its children can be compared
+	return tag.decode(lazy=True) if isinstance(tag, RawNBT) else tag
+
+def _diff_tag(old: NBT, new: NBT, path: tuple[str | int, ...], entries: list[PatchEntry]) -> None:
+	if old.ID != new.ID:
+		entries.append(PatchEntry(PatchOp.CHANGE, path, new))
+	elif old.ID == NBTID.Compound:
+		_diff_compound(_decoded(old), _decoded(new), path, entries) # type: ignore[arg-type]
+	elif old.ID == NBTID.List:
+		_diff_list(_decoded(old), _decoded(new), path, entries)
+	elif _payload(old) != _payload(new):
+		entries.append(PatchEntry(PatchOp.CHANGE, path, new))
+
+def _diff_compound(old: 'Compound', new: 'Compound', path: tuple[str | int, ...],
+	entries: list[PatchEntry]) -> None:
+	for key in old:
+		if key not in new:
+			entries.append(PatchEntry(PatchOp.REMOVE, path + (key,), None))
+	for key in new:
+		if key not in old:
+			entries.append(PatchEntry(PatchOp.ADD, path + (key,), new[key]))
+			continue
+		# children of lazily parsed compounds are compared as raw bytes before decoding them
+		a, b = old._raw_child(key), new._raw_child(key)
+		if a is not None and b is not None and a == b:
+			continue
+		_diff_tag(old[key], new[key], path + (key,), entries)
+
+def diff(old: 'Compound', new: 'Compound') -> 'Patch':
+	"""
+	Compare two compounds and return the patch which turns `old` into `new`.
+	Compounds and lists of the same type and length are compared recursively,
+	any other changed tag is replaced as a whole. The names of the roots are not compared.
+	The patch refers to the tags of `new` until it is encoded.
+	"""
+	entries: list[PatchEntry] = []
+	_diff_compound(old, new, (), entries)
+	return Patch(entries)
+
+_KEY = NBTID.String.value
+_INDEX = NBTID.Int.value
+
+@final
+class Patch:
+	"""
+	A list of changes produced by `Compound.diff`, which can be applied to a compound with `Compound.apply`.
+
+	The binary form is an int entry count, then for each entry
+	the ubyte op, the ushort path length, and each path component as either a String (0x08) key
+	or an Int (0x03) list index; ADD and CHANGE entries end with the tag id and payload of the new tag.
+	"""
+
+	__slots__ = ('entries',)
+
+	def __init__(self, entries: list[PatchEntry] | None = None):
+		self.entries: list[PatchEntry] = [] if entries is None else entries
+
+	def __len__(self) -> int:
+		return len(self.entries)
+
+	def __iter__(self) -> Iterator[PatchEntry]:
+		return iter(self.entries)
+
+	def apply(self, root: 'Compound') -> None:
+		"""
+		Apply the patch in place, raise ValueError if `root` does not match the tree the patch was made from.
+		The tags in the patch are copied, so the same patch can be applied to many trees.
+		"""
+		for op, path, tag in self.entries:
+			if len(path) == 0:
+				raise ValueError('Patch entry must have a non-empty path')
+			node: NBT = root
+			try:
+				for key in path[:-1]:
+					node = node[key] # type: ignore[index]
+			except (KeyError, IndexError, TypeError):
+				raise ValueError(f'Path {path} does not exist') from None
+			key = path[-1]
+			if isinstance(key, int):
+				if op != PatchOp.CHANGE or node.ID != NBTID.List:
+					raise ValueError(f'Cannot {op.name} list index at {path}')
+				assert tag is not None
+				if tag.ID != node.element: # type: ignore[attr-defined]
+					raise ValueError(f'Element type must be {node.element}, but got {tag.ID}') # type: ignore[attr-defined]
+				if not -len(node) <= key < len(node): # type: ignore[arg-type]
+					raise ValueError(f'Path {path} does not exist')
+				new = tag.copy()
+				new._name = None
+				node[key] = new # type: ignore[index]
+				continue
+			if node.ID != NBTID.Compound:
+				raise ValueError(f'Path {path[:-1]} is not a compound')
+			exists = key in node # type: ignore[operator]
+			if op == PatchOp.REMOVE:
+				if not exists:
+					raise ValueError(f'Path {path} does not exist')
+				del node[key] # type: ignore[attr-defined]
+				continue
+			if exists != (op == PatchOp.CHANGE):
+				raise ValueError(f'Path {path} already exists' if exists else f'Path {path} does not exist')
+			assert tag is not None
+			node[key] = tag.copy() # type: ignore[index]
+
+	def to_bytes(self, b: PacketBuffer) -> None:
+		b.write_int(len(self.entries))
+		for op, path, tag in self.entries:
+			b.write_ubyte(op.value)
+			b.write_ushort(len(path))
+			for key in path:
+				if isinstance(key, int):
+					b.write_byte(_INDEX)
+					b.write_int(key)
+				else:
+					data = encode_mutf8(key)
+					b.write_byte(_KEY)
+					b.write_ushort(len(data))
+					b.write(data)
+			if op != PatchOp.REMOVE:
+				assert tag is not None
+				b.write_byte(tag.ID.value)
+				tag.to_bytes_value(b)
+
+	def encode(self) -> bytes:
+		b = BytesBuffer()
+		self.to_bytes(b)
+		return b.getvalue()
+
+	@classmethod
+	def parse_from(cls, r: PacketReader) -> Self:
+		count = r.read_int()
+		if count < 0:
+			raise ValueError(f'Patch length must not be negative, but got {count}')
+		entries = []
+		for _ in range(count):
+			op = PatchOp(r.read_ubyte())
+			path: list[str | int] = []
+			for _ in range(r.read_ushort()):
+				kind = r.read_byte()
+				if kind == _INDEX:
+					path.append(r.read_int())
+				elif kind == _KEY:
+					path.append(decode_mutf8(r.read(r.read_ushort())))
+				else:
+					raise ValueError(f'Unexpected path component type {kind}')
+			tag = None
+			if op != PatchOp.REMOVE:
+				tid = NBTID(r.read_byte())
+				if tid == NBTID.End:
+					raise ValueError('Patch tag must not be End')
+				name = path[-1] if path and isinstance(path[-1], str) else None
+				tag = NBT._nbt_cls[tid].parse_from(r, name)
+			entries.append(PatchEntry(op, tuple(path), tag))
+		return cls(entries)
+
+	@classmethod
+	def decode(cls, data: bytes | bytearray | memoryview) -> Self:
+		r = BytesReader(data)
+		self = cls.parse_from(r) # type: ignore[arg-type]
+		if r.remain != 0:
+			raise ValueError(f'{r.remain} trailing bytes after patch')
+		return self
+
+	def __repr__(self) -> str:
+		return f'<Patch: {len(self.entries)} entries>'
@@ -1,80 +1,469 @@
 
-from typing import final, Self
+import array
+import functools
+import struct
+import sys
+from typing import final, Any, ClassVar, Iterable, Iterator, Self, TextIO, Type
 
-from loginproxy import PacketBuffer, PacketReader
+from loginproxy import PacketReader
 
-from .nbt import NBT, NBTID
-from .numbers import Byte, Int, Long
+from .nbt import NBT, NBTID, _FROZEN, _MAX_RECURSION, _blake2b
+from .numbers import _Numbers, _Integers, Byte, Int, Long
 from .mutf8 import *
+from .parser import parse_payload
+
+_NATIVE_LITTLE = sys.byteorder == 'little'
+
+_USHORT = struct.Struct('>H')
+_INT = struct.Struct('>i')
+_LIST_HEAD = struct.Struct('>bi')
 
 __all__ = [
 	'List', 'String',
 	'ByteArray', 'IntArray', 'LongArray',
 ]
 
+def _writes(method):
+	"""
+	Wrap a method which modifies a tracked container, so it drops the caches of the tag which owns the container
+	"""
+	@functools.wraps(method)
+	def write(self, *args, **kwargs):
+		tag = self._tag
+		tag._check_mutable()
+		result = method(self, *args, **kwargs)
+		tag._changed()
+		return result
+	return write
+
+class _TrackedArray(array.array):
+	"""
+	The array.array handed out by a mutable tag, writes through it drop the cached digests and source bytes
+	"""
+	__slots__ = ('_tag',)
+
+	_tag: NBT
+
+	def __new__(cls, tag: NBT, values: array.array):
+		self = super().__new__(cls, values.typecode, values)
+		self._tag = tag
+		return self
+
+	def __reduce_ex__(self, protocol):
+		return array.array, (self.typecode, self.tolist())
+
+	__setitem__ = _writes(array.array.__setitem__)
+	__delitem__ = _writes(array.array.__delitem__)
+	__iadd__ = _writes(array.array.__iadd__)
+	__imul__ = _writes(array.array.__imul__)
+	append = _writes(array.array.append)
+	extend = _writes(array.array.extend)
+	insert = _writes(array.array.insert)
+	pop = _writes(array.array.pop)
+	remove = _writes(array.array.remove)
+	reverse = _writes(array.array.reverse)
+	byteswap = _writes(array.array.byteswap)
+	frombytes = _writes(array.array.frombytes)
+	fromlist = _writes(array.array.fromlist)
+	fromfile = _writes(array.array.fromfile)
+
+class _TrackedBytes(bytearray):
+	"""
+	The bytearray handed out by a mutable ByteArray, writes through it drop the cached digests and source bytes
+	"""
+	__slots__ = ('_tag',)
+
+	_tag: NBT
+
+	def __init__(self, tag: NBT, data: bytearray):
+		super().__init__(data)
+		self._tag = tag
+
+	def __reduce_ex__(self, protocol):
+		return bytearray, (bytes(self),)
+
+	__setitem__ = _writes(bytearray.__setitem__)
+	__delitem__ = _writes(bytearray.__delitem__)
+	__iadd__ = _writes(bytearray.__iadd__)
+	__imul__ = _writes(bytearray.__imul__)
+	append = _writes(bytearray.append)
+	extend = _writes(bytearray.extend)
+	insert = _writes(bytearray.insert)
+	pop = _writes(bytearray.pop)
+	remove = _writes(bytearray.remove)
+	reverse = _writes(bytearray.reverse)
+	clear = _writes(bytearray.clear)
+
+class _Children(list):
+	"""
+	The list handed out by `List.children`. Elements stored through it are checked and adopted by the List,
+	and writes drop the cached digests and source bytes
+	"""
+	__slots__ = ('_tag',)
+
+	_tag: 'List'
+
+	def __init__(self, tag: 'List', children: Iterable[NBT]):
+		super().__init__(children)
+		self._tag = tag
+
+	def __reduce_ex__(self, protocol):
+		return list, (list(self),)
+
+	def _take(self, tags: Iterable[NBT]) -> list[NBT]:
+		owner = self._tag
+		owner._check_mutable()
+		return [owner._take(tag) for tag in tags]
+
+	def _release(self, tags: Iterable[NBT]) -> None:
+		owner = self._tag
+		for tag in tags:
+			if tag._parent is owner:
+				tag._parent = None
+
+	def __setitem__(self, index, value):
+		if isinstance(index, slice):
+			value = self._take(value)
+			self._release(self[index])
+		else:
+			value = self._take((value,))[0]
+			self._release((self[index],))
+		super().__setitem__(index, value)
+		self._tag._changed()
+
+	def __delitem__(self, index):
+		self._tag._check_mutable()
+		self._release(self[index] if isinstance(index, slice) else (self[index],))
+		super().__delitem__(index)
+		self._tag._changed()
+
+	def __iadd__(self, tags):
+		self.extend(tags)
+		return self
+
+	def __imul__(self, count):
+		if count <= 0:
+			self.clear()
+		else:
+			# the repeated elements are copies, a tag has only one parent
+			self.extend(list(self) * (count - 1))
+		return self
+
+	def append(self, tag: NBT):
+		super().append(self._take((tag,))[0])
+		self._tag._changed()
+
+	def extend(self, tags: Iterable[NBT]):
+		super().extend(self._take(tags))
+		self._tag._changed()
+
+	def insert(self, index, tag: NBT):
+		super().insert(index, self._take((tag,))[0])
+		self._tag._changed()
+
+	def pop(self, index=-1) -> NBT:
+		self._tag._check_mutable()
+		tag = super().pop(index)
+		self._release((tag,))
+		self._tag._changed()
+		return tag
+
+	def remove(self, tag: NBT):
+		del self[self.index(tag)]
+
+	def clear(self):
+		del self[:]
+
+	reverse = _writes(list.reverse)
+	sort = _writes(list.sort)
+
 @final
 class List(NBT, id=NBTID.List):
+	"""
+	A list of tags of the same type.
+	Lists of numbers which are parsed or built with `from_values` keep the values in an array.array,
+	the element tags are only created when they are accessed as tags, e.g. with [] or `children`.
+	`values` reads and writes the numbers without creating any tag.
+	"""
+
+	__slots__ = ('_element', '_children', '_values', '_digest', '_source')
+
+	_CONTAINER = True
+
 	def __init__(self, element: NBTID, children: list[NBT], name: str | None = None):
 		super().__init__(name)
-		for tag in children:
-			if tag.__class__.ID != element:
-				raise ValueError(f'Element type must be {element}, but got {tag.__class__.ID}')
-			if tag._name is not None:
-				raise ValueError(f'Element name must be None, but got {tag.name}')
 		self._element = element
-		self._children = children
+		for i, tag in enumerate(children):
+			if tag._parent is not None:
+				children[i] = self._take(tag)
+			else:
+				self._check_element(tag)
+				tag._parent = self
+		self._children: list[NBT] | tuple[NBT, ...] = children
+		# the numbers of a numeric list whose tags are not created yet, self._children is empty then
+		self._values: array.array | None = None
+		self._digest: bytes | None = None
+		self._source: tuple[memoryview, int, int] | None = None
+
+	@classmethod
+	def from_values(cls, element: NBTID, values: Any, name: str | None = None) -> Self:
+		"""
+		Create a list of Byte, Short, Int, Long, Float or Double from numbers, without creating any element tag
+		"""
+		eletyp = NBT._nbt_cls[element]
+		if not issubclass(eletyp, _Numbers):
+			raise ValueError(f'Element type must be a number type, but got {element}')
+		try:
+			values = array.array(eletyp.TYPECODE, values)
+		except OverflowError:
+			raise ValueError(f'Value out of range of {element.name}') from None
+		return cls._from_array(element, values, name)
+
+	@classmethod
+	def _from_array(cls, element: NBTID, values: array.array, name: str | None = None) -> Self:
+		self = cls(element, [], name)
+		self._values = values
+		return self
 
 	@property
 	def element(self) -> NBTID:
 		return self._element
 
+	def _check_element(self, tag: NBT) -> None:
+		if tag.ID != self._element:
+			raise ValueError(f'Element type must be {self._element}, but got {tag.ID}')
+		if tag._name is not None:
+			raise ValueError(f'Element name must be None, but got {tag.name}')
+
+	def _take(self, tag: NBT) -> NBT:
+		"""
+		Check a new element and return the tag to store
+		"""
+		self._check_element(tag)
+		return self._adopt(tag)
+
+	@property
+	def values(self) -> array.array:
+		"""
+		The numbers of a numeric list as an array.array, which may be modified in place unless the tag is frozen.
+		Element tags which were created before are dropped, later accesses create new ones.
+		Reading the array keeps the cached digest and source bytes, only writes drop them.
+		"""
+		eletyp = NBT._nbt_cls[self._element]
+		if not issubclass(eletyp, _Numbers):
+			raise TypeError(f'List of {self._element.name} has no numeric values')
+		values = self._values
+		if values is None:
+			values = array.array(eletyp.TYPECODE, [c._value for c in self._children]) # type: ignore[attr-defined]
+		if self._parent is _FROZEN:
+			return array.array(values.typecode, values)
+		if self._values is None:
+			for c in self._children:
+				if c._parent is self:
+					c._parent = None
+			self._children = []
+		if values.__class__ is not _TrackedArray:
+			values = _TrackedArray(self, values)
+		self._values = values
+		return values
+
+	def _materialize(self) -> list[NBT] | tuple[NBT, ...]:
+		"""
+		Replace the array of numbers by element tags
+		"""
+		values = self._values
+		if values is not None:
+			trusted = NBT._nbt_cls[self._element]._trusted # type: ignore[attr-defined]
+			children = [trusted(v) for v in values]
+			if self._parent is _FROZEN:
+				self._children = tuple(c.freeze() for c in children)
+			else:
+				for c in children:
+					c._parent = self
+				self._children = children
+			self._values = None
+		return self._children
+
+	def _elements(self) -> Iterable[NBT]:
+		"""
+		Iterate the element tags without storing them, for read-only walks
+		"""
+		if self._values is not None:
+			return map(NBT._nbt_cls[self._element]._trusted, self._values) # type: ignore[attr-defined]
+		return self._children
+
 	@property
 	def children(self) -> list[NBT]:
+		"""
+		The list of elements, it may be modified in place unless the tag is frozen.
+		Elements stored through it are checked and adopted like the elements passed to the constructor.
+		Reading the list keeps the cached digest and source bytes, only writes drop them.
+		"""
+		children = self._materialize()
+		if self._parent is _FROZEN:
+			return children # type: ignore[return-value]
+		if children.__class__ is not _Children:
+			children = self._children = _Children(self, children)
+		return children # type: ignore[return-value]
+
+	def _freeze_children(self) -> tuple[NBT, ...]:
+		children = self._children = tuple(self._children)
+		return children
+
+	def thaw(self) -> 'List':
+		if self._parent is not _FROZEN:
+			return self
+		clone = self.__class__(self._element, list(self._children), self._name)
+		if self._values is not None:
+			clone._values = array.array(self._values.typecode, self._values)
+		clone._digest = self._digest
+		clone._source = self._source
+		return clone
+
+	def _packed_values(self) -> bytes:
+		values = self._values
+		assert values is not None
+		if _NATIVE_LITTLE and values.itemsize > 1:
+			values = array.array(values.typecode, values)
+			values.byteswap()
+		return values.tobytes()
+
+	def _nested(self) -> Iterable[NBT]:
+		if self._element != NBTID.List and self._element != NBTID.Compound:
+			return ()
 		return self._children
 
+	def digest(self) -> bytes:
+		if self._digest is None:
+			self._digest_nested()
+			element = self._element
+			h = _blake2b(bytes((NBTID.List.value, element.value)) + _INT.pack(len(self)))
+			eletyp = NBT._nbt_cls[element]
+			if self._values is not None:
+				h.update(self._packed_values())
+			elif issubclass(eletyp, _Numbers):
+				children = self._children
+				h.update(struct.pack(f'>{len(children)}{eletyp.FORMAT}', *(c._value for c in children))) # type: ignore[attr-defined]
+			else:
+				for c in self._children:
+					h.update(c.digest())
+			self._digest = h.digest()
+		return self._digest
+
 	def __len__(self) -> int:
-		return len(self.children)
+		if self._values is not None:
+			return len(self._values)
+		return len(self._children)
 
 	def __iter__(self):
-		return iter(self._children)
+		return iter(self._materialize())
 
 	def __contains__(self, tag: NBT) -> bool:
-		return tag in self._children
+		return tag in self._materialize()
 
 	def __getitem__(self, index: int) -> NBT:
-		return self._children[index]
+		tag = self._materialize()[index]
+		if isinstance(index, int) and tag._parent is _FROZEN and tag._CONTAINER and self._parent is not _FROZEN:
+			tag = tag.thaw()
+			tag._parent = self
+			children = self._children
+			assert isinstance(children, list)
+			# the clone has the same content, so the write bypasses the tracking of _Children
+			list.__setitem__(children, index, tag)
+		return tag
 
 	def __setitem__(self, index: int, tag: NBT):
-		self._children[index] = tag
-
-	def to_bytes_value(self, b: PacketBuffer) -> None:
-		b.write_byte(self.element.value)
-		b.write_int(len(self.children))
-		for c in self.children:
-			c.to_bytes_value(b)
+		self._check_mutable()
+		children = self._materialize()
+		assert isinstance(children, list)
+		tag = self._take(tag)
+		old = children[index]
+		if old._parent is self:
+			old._parent = None
+		list.__setitem__(children, index, tag)
+		self._changed()
+
+	def to_python(self) -> list[Any]:
+		return self._container_to_python()
+
+	def _python_items(self) -> tuple[list[Any], Iterable[tuple[None, NBT]]]:
+		if self._values is not None:
+			return self._values.tolist(), ()
+		return [], ((None, c) for c in self._children)
+
+	def _payload_size(self) -> int:
+		return self._nested_size()
+
+	def _size_into(self, depth: int, deeper: list[NBT]) -> int:
+		if self._source is not None:
+			_, start, end = self._source
+			return end - start
+		if self._values is not None:
+			return 5 + len(self._values) * self._values.itemsize
+		children = self._children
+		if children and isinstance(children[0], _Numbers):
+			return 5 + len(children) * children[0]._STRUCT.size
+		size = 5
+		for c in children:
+			if not c._CONTAINER:
+				size += c._payload_size()
+			elif depth < _MAX_RECURSION:
+				size += c._size_into(depth + 1, deeper)
+			else:
+				deeper.append(c)
+		return size
+
+	def _pack_payload(self, buf: bytearray, offset: int) -> int:
+		return self._pack_nested(buf, offset)
+
+	def _pack_from(self, buf: bytearray, offset: int, it: Iterator[NBT] | None,
+		depth: int) -> tuple[int, NBT | None, Iterator[NBT] | None]:
+		if it is None:
+			if self._source is not None:
+				src, start, end = self._source
+				buf[offset:offset + end - start] = src[start:end]
+				return offset + end - start, None, None
+			_LIST_HEAD.pack_into(buf, offset, self._element.value, len(self))
+			offset += 5
+			if self._values is not None:
+				data = self._packed_values()
+				buf[offset:offset + len(data)] = data
+				return offset + len(data), None, None
+			children = self._children
+			if children and isinstance(children[0], _Numbers):
+				# fixed-width elements are packed in one call
+				eletyp = children[0].__class__
+				struct.pack_into(f'>{len(children)}{eletyp.FORMAT}', buf, offset, *[c._value for c in children]) # type: ignore[attr-defined]
+				return offset + len(children) * eletyp._STRUCT.size, None, None
+			it = iter(children)
+		for c in it:
+			if not c._CONTAINER:
+				offset = c._pack_payload(buf, offset)
+			elif depth < _MAX_RECURSION:
+				offset, child, sub = c._pack_from(buf, offset, None, depth + 1)
+				if child is not None:
+					offset = c._pack_deeper(buf, offset, child, sub)
+			else:
+				return offset, c, it
+		return offset, None, None
 
 	@classmethod
 	def parse_from(cls, r: PacketReader, name: str | None = None) -> Self:
-		element = NBTID(r.read_byte())
-		eletyp = NBT._nbt_cls[element]
-		children = [eletyp.parse_from(r) for _ in range(r.read_int())]
-		return cls(element, children, name=name)
-
-	def as_str(self, *, indent: int = 0) -> str:
-		ind = '  ' * indent
-		s = super().as_str(indent=indent) + ': ' + \
-			('1 entry' if len(self) == 1 else '{} entries\n'.format(len(self))) + \
-			ind + '{\n'
-		indent += 1
-		for e in self:
-			s += e.as_str(indent=indent) + '\n'
-		s += ind + '}'
-		return s
+		return parse_payload(r, NBTID.List.value, name) # type: ignore[return-value]
+
+	def _str_entries(self) -> tuple[Iterable[NBT], int]:
+		return self._elements(), len(self)
+
+	def _write_str(self, out: TextIO, indent: int) -> None:
+		self._write_entries(out, indent)
 
 class String(NBT, id=NBTID.String):
+	__slots__ = ('_value', '_encoded')
+
 	def __init__(self, value: str, name: str | None = None):
 		super().__init__(name)
 		self._value = value
+		self._encoded: bytes | None = None
 
 	@property
 	def value(self) -> str:
@@ -83,22 +472,49 @@ class String(NBT, id=NBTID.String):
 	def __len__(self) -> int:
 		return len(self.value)
 
-	def to_bytes_value(self, b: PacketBuffer) -> None:
-		bts = utf8s_to_utf8m(self.value.encode('utf8'))
-		b.write_ushort(len(bts))
-		b.write(bts)
+	def to_python(self) -> str:
+		return self._value
+
+	def _encode(self) -> bytes:
+		# the value cannot change, so the encoded bytes are kept once they are known
+		data = self._encoded
+		if data is None:
+			data = self._encoded = encode_mutf8(self._value)
+		return data
+
+	def _payload_size(self) -> int:
+		return 2 + len(self._encode())
+
+	def _pack_payload(self, buf: bytearray, offset: int) -> int:
+		data = self._encode()
+		_USHORT.pack_into(buf, offset, len(data))
+		offset += 2
+		buf[offset:offset + len(data)] = data
+		return offset + len(data)
 
 	@classmethod
 	def parse_from(cls, r: PacketReader, name: str | None = None) -> Self:
-		value = utf8m_to_utf8s(r.read(r.read_ushort())).decode('utf8')
-		return cls(value, name)
+		return cls._from_raw(r.read(r.read_ushort()), name)
 
-	def as_str(self, *, indent: int = 0) -> str:
-		return super().as_str(indent=indent) + ': ' + repr(self.value)
+	@classmethod
+	def _from_raw(cls, raw: bytes, name: str | None = None) -> Self:
+		"""
+		Create a tag from its modified UTF-8 bytes, which are kept for encoding it again
+		"""
+		self = cls(decode_mutf8(raw), name)
+		self._encoded = raw
+		return self
+
+	def _write_str(self, out: TextIO, indent: int) -> None:
+		super()._write_str(out, indent)
+		out.write(': ' + repr(self._value))
 
 class ByteArray(NBT, id=NBTID.ByteArray):
+	__slots__ = ('_value', '_digest')
+
 	def __init__(self, value: list[Byte] | list[int] | bytes | bytearray, name: str | None = None):
 		super().__init__(name)
+		self._digest: bytes | None = None
 		if isinstance(value, (bytes, bytearray)):
 			self._value = bytearray(value)
 		else:
@@ -114,85 +530,176 @@ class ByteArray(NBT, id=NBTID.ByteArray):
 					self._value.append(tag.value)
 
 	@property
-	def value(self) -> bytearray:
-		return self._value
+	def value(self) -> bytearray | bytes:
+		"""
+		The bytearray which may be modified in place, or a bytes copy if the tag is frozen.
+		Reading it keeps the cached digests and source bytes, only writes drop them.
+		"""
+		if self._parent is _FROZEN:
+			return bytes(self._value)
+		value = self._value
+		if value.__class__ is not _TrackedBytes:
+			value = self._value = _TrackedBytes(self, value)
+		return value
+
+	def digest(self) -> bytes:
+		if self._digest is None:
+			self._digest = super().digest()
+		return self._digest
 
 	def __len__(self) -> int:
-		return len(self.value)
+		return len(self._value)
 
-	def to_bytes_value(self, b: PacketBuffer) -> None:
-		b.write_int(len(self.value))
-		b.write(bytes(self.value))
+	def to_python(self) -> bytes:
+		return bytes(self._value)
 
-	@classmethod
-	def parse_from(cls, r: PacketReader, name: str | None = None) -> Self:
-		value = r.read(r.read_int())
-		return cls(value, name)
+	def _payload_size(self) -> int:
+		return 4 + len(self._value)
 
-	def as_str(self, *, indent: int = 0) -> str:
-		return super().as_str(indent=indent) + ': {}'.format(list(self.value))
-
-class IntArray(NBT, id=NBTID.IntArray):
-	def __init__(self, value: list[Int] | list[int], name: str | None = None):
-		super().__init__(name)
-		self._value: list[int] = []
-		for tag in value:
-			if isinstance(tag, int):
-				self._value.append(tag)
-			else:
-				if tag.__class__.ID != NBTID.Int:
-					raise ValueError(f'Element type must be nbt.Int, but got {tag.__class__.ID}')
-				if tag._name is not None:
-					raise ValueError(f'Element name must be None, but got {tag.name}')
-				self._value.append(tag.value)
-
-	@property
-	def value(self) -> list[int]:
-		return self._value
-
-	def __len__(self) -> int:
-		return len(self.value)
-
-	def to_bytes_value(self, b: PacketBuffer) -> None:
-		b.write_int(len(self.value))
-		for v in self.value:
-			b.write_int(v)
+	def _pack_payload(self, buf: bytearray, offset: int) -> int:
+		n = len(self._value)
+		_INT.pack_into(buf, offset, n)
+		offset += 4
+		buf[offset:offset + n] = self._value
+		return offset + n
 
 	@classmethod
 	def parse_from(cls, r: PacketReader, name: str | None = None) -> Self:
-		value = [r.read_int() for _ in range(r.read_int())]
-		return cls(value, name)
+		count = r.read_int()
+		if count < 0:
+			raise ValueError(f'Array length must not be negative, but got {count}')
+		return cls._from_raw(r.read(count), name)
 
-class LongArray(NBT, id=NBTID.LongArray):
-	def __init__(self, value: list[Long] | list[int], name: str | None = None):
+	@classmethod
+	def _from_raw(cls, raw: bytes, name: str | None = None) -> Self:
+		return cls(raw, name)
+
+	def _write_str(self, out: TextIO, indent: int) -> None:
+		super()._write_str(out, indent)
+		out.write(': {}'.format(list(self._value)))
+
+class _NumberArray(NBT):
+	"""
+	Base of IntArray and LongArray, the elements are stored in an array.array.
+	A parsed tag keeps the raw big-endian payload and only decodes it when the value is accessed.
+	"""
+	__slots__ = ('_array', '_raw', '_digest')
+
+	ELEMENT: ClassVar[Type[_Numbers]]
+	TYPECODE: ClassVar[str]
+
+	def __init_subclass__(cls, *, element: Type[_Numbers] | None = None, **kwargs):
+		super().__init_subclass__(**kwargs)
+		if element is not None:
+			cls.ELEMENT = element
+			itemsize = element._STRUCT.size
+			cls.TYPECODE = next(c for c in 'ilq' if array.array(c).itemsize == itemsize)
+
+	def __init__(self, value: list[_Integers] | list[int] | array.array, name: str | None = None):
 		super().__init__(name)
-		self._value: list[int] = []
+		self._raw: bytes | None = None
+		self._digest: bytes | None = None
+		if isinstance(value, array.array):
+			self._array = array.array(self.TYPECODE, value)
+			return
+		element = self.ELEMENT.ID
+		self._array = array.array(self.TYPECODE)
 		for tag in value:
 			if isinstance(tag, int):
-				self._value.append(tag)
+				self._array.append(tag)
 			else:
-				if tag.__class__.ID != NBTID.Long:
-					raise ValueError(f'Element type must be nbt.Long, but got {tag.__class__.ID}')
+				if tag.__class__.ID != element:
+					raise ValueError(f'Element type must be nbt.{element.name}, but got {tag.__class__.ID}')
 				if tag._name is not None:
 					raise ValueError(f'Element name must be None, but got {tag.name}')
-				self._value.append(tag.value)
+				self._array.append(tag.value)
+
+	def _decoded(self) -> array.array:
+		if self._raw is not None:
+			arr = array.array(self.TYPECODE)
+			arr.frombytes(self._raw)
+			if _NATIVE_LITTLE:
+				arr.byteswap()
+			self._array = arr
+			self._raw = None
+		return self._array
 
 	@property
-	def value(self) -> list[int]:
-		return self._value
+	def value(self) -> array.array:
+		"""
+		The array which may be modified in place, or a copy if the tag is frozen.
+		Reading it keeps the cached digests and source bytes, only writes drop them.
+		"""
+		value = self._decoded()
+		if self._parent is _FROZEN:
+			return array.array(self.TYPECODE, value)
+		if value.__class__ is not _TrackedArray:
+			value = self._array = _TrackedArray(self, value)
+		return value
+
+	def digest(self) -> bytes:
+		if self._digest is None:
+			self._digest = super().digest()
+		return self._digest
 
 	def __len__(self) -> int:
-		return len(self.value)
+		if self._raw is not None:
+			return len(self._raw) // self.ELEMENT._STRUCT.size
+		return len(self._array)
 
-	def to_bytes_value(self, b: PacketBuffer) -> None:
-		b.write_int(len(self.value))
-		for v in self.value:
-			b.write_long(v)
+	def __iter__(self):
+		return iter(self._decoded())
+
+	def __getitem__(self, index: int) -> int:
+		return self._decoded()[index]
+
+	def to_python(self) -> array.array:
+		return array.array(self.TYPECODE, self._decoded())
+
+	def _payload_size(self) -> int:
+		if self._raw is not None:
+			return 4 + len(self._raw)
+		return 4 + len(self._array) * self._array.itemsize
+
+	def _pack_payload(self, buf: bytearray, offset: int) -> int:
+		_INT.pack_into(buf, offset, len(self))
+		offset += 4
+		data = self._raw
+		if data is None:
+			arr = self._array
+			if _NATIVE_LITTLE:
+				arr = array.array(self.TYPECODE, arr)
+				arr.byteswap()
+			data = arr.tobytes()
+		buf[offset:offset + len(data)] = data
+		return offset + len(data)
 
 	@classmethod
 	def parse_from(cls, r: PacketReader, name: str | None = None) -> Self:
-		value = [r.read_long() for _ in range(r.read_int())]
-		return cls(value, name)
+		count = r.read_int()
+		if count < 0:
+			raise ValueError(f'Array length must not be negative, but got {count}')
+		return cls._from_raw(r.read(count * cls.ELEMENT._STRUCT.size), name)
 
-	def as_str(self, *, indent: int = 0) -> str:
-		return super().as_str(indent=indent) + ': {}'.format(list(self.value))
+	@classmethod
+	def _from_raw(cls, raw: bytes, name: str | None = None) -> Self:
+		"""
+		Create a tag from its big-endian elements, which are decoded when the value is accessed
+		"""
+		self = object.__new__(cls)
+		self._name = name
+		self._parent = None
+		self._digest = None
+		self._array = array.array(cls.TYPECODE)
+		self._raw = raw
+		return self
+
+	def _write_str(self, out: TextIO, indent: int) -> None:
+		super()._write_str(out, indent)
+		out.write(': {}'.format(list(self._decoded())))
+
+class IntArray(_NumberArray, id=NBTID.IntArray, element=Int):
+	__slots__ = ()
+
+class LongArray(_NumberArray, id=NBTID.LongArray, element=Long):
+	__slots__ = ()
@@ -1,117 +1,73 @@
-# translated from: http://hg.openjdk.java.net/jdk8/jdk8/jdk/file/94cc251d0c45/src/share/npt/utf.c
-# Copied from: https://gist.github.com/BarelyAliveMau5/000e7e453b6d4ebd0cb06f39bc2e7aec
+
+# Java's modified UTF-8 differs from standard UTF-8 only in two ways:
+# - U+0000 is encoded as the two bytes C0 80
+# - supplementary characters are encoded as a surrogate pair, each half as a 3 byte sequence (ED ...)
+# Both cases are handled with the native codecs and bytes.replace / re.sub instead of per-byte loops.
+
+import re
 
 __all__ = [
 	'utf8s_to_utf8m',
-	'utf8m_to_utf8s'
+	'utf8m_to_utf8s',
+	'encode_mutf8',
+	'decode_mutf8',
 ]
 
-def utf8s_to_utf8m(string):
+_SUPPLEMENTARY = re.compile('[\U00010000-\U0010ffff]')
+
+def _to_surrogates(m: re.Match) -> str:
+	c = ord(m.group()) - 0x10000
+	return chr(0xD800 | (c >> 10)) + chr(0xDC00 | (c & 0x3FF))
+
+def encode_mutf8(string: str) -> bytes:
 	"""
-	:param string: utf8 encoded string 
+	:param string: the string to encode
 	:return: modified utf8 encoded string
 	"""
-	new_str = bytearray([])
-	i = 0
-	while i < len(string):
-		byte1 = string[i]
-		# NULL bytes and bytes starting with 11110xxx are special
-		if (byte1 & 0x80) == 0:
-			if byte1 == 0:
-				new_str.append(0xC0)
-				new_str.append(0x80)
-			else:
-				# Single byte
-				new_str.append(byte1)
-
-		elif (byte1 & 0xE0) == 0xC0:  # 2byte encoding
-			new_str.append(byte1)
-			i += 1
-			new_str.append(string[i])
-
-		elif (byte1 & 0xF0) == 0xE0:  # 3byte encoding
-			new_str.append(byte1)
-			i += 1
-			new_str.append(string[i])
-			i += 1
-			new_str.append(string[i])
-
-		elif (byte1 & 0xF8) == 0xF0:  # 4byte encoding
-			# Beginning of 4byte encoding, turn into 2 3byte encodings
-			# Bits in: 11110xxx 10xxxxxx 10xxxxxx 10xxxxxx
-			i += 1
-			byte2 = string[i]
-			i += 1
-			byte3 = string[i]
-			i += 1
-			byte4 = string[i]
+	if string.isascii():
+		data = string.encode('ascii')
+		if b'\x00' in data:
+			data = data.replace(b'\x00', b'\xc0\x80')
+		return data
+	if max(string) >= '\U00010000':
+		string = _SUPPLEMENTARY.sub(_to_surrogates, string)
+	data = string.encode('utf8', 'surrogatepass')
+	if b'\x00' in data:
+		data = data.replace(b'\x00', b'\xc0\x80')
+	return data
 
-			# Reconstruct full 21bit value
-			u21 = (byte1 & 0x07) << 18
-			u21 += (byte2 & 0x3F) << 12
-			u21 += (byte3 & 0x3F) << 6
-			u21 += (byte4 & 0x3F)
-
-			# Bits out: 11101101 1010xxxx 10xxxxxx
-			new_str.append(0xED)
-			new_str.append((0xA0 + (((u21 >> 16) - 1) & 0x0F)))
-			new_str.append((0x80 + ((u21 >> 10) & 0x3F)))
+def decode_mutf8(data: bytes) -> str:
+	"""
+	:param data: modified utf8 encoded string
+	:return: the decoded string
+	"""
+	if data.isascii():
+		return data.decode('ascii')
+	if b'\xc0\x80' in data:
+		data = data.replace(b'\xc0\x80', b'\x00')
+	if b'\xed' not in data:
+		return data.decode('utf8')
+	# join the surrogate pairs by a round trip through UTF-16
+	return data.decode('utf8', 'surrogatepass') \
+		.encode('utf-16-le', 'surrogatepass') \
+		.decode('utf-16-le', 'surrogatepass')
 
-			# Bits out: 11101101 1011xxxx 10xxxxxx
-			new_str.append(0xED)
-			new_str.append((0xB0 + ((u21 >> 6) & 0x0F)))
-			new_str.append(byte4)
-		i += 1
-	return bytes(new_str)
+def utf8s_to_utf8m(string: bytes) -> bytes:
+	"""
+	:param string: utf8 encoded string
+	:return: modified utf8 encoded string
+	"""
+	string = bytes(string)
+	if string.isascii() and b'\x00' not in string:
+		return string
+	return encode_mutf8(string.decode('utf8'))
 
-def utf8m_to_utf8s(string):
+def utf8m_to_utf8s(string: bytes) -> bytes:
 	"""
-	:param string: modified utf8 encoded string 
+	:param string: modified utf8 encoded string
 	:return: utf8 encoded string
 	"""
-	new_string = bytearray([])
-	length = len(string)
-	i = 0
-	while i < length:
-		byte1 = string[i]
-		if (byte1 & 0x80) == 0:  # 1byte encoding
-			new_string.append(byte1)
-		elif (byte1 & 0xE0) == 0xC0:  # 2byte encoding
-			i += 1
-			byte2 = string[i]
-			if byte1 != 0xC0 or byte2 != 0x80:
-				new_string.append(byte1)
-				new_string.append(byte2)
-			else:
-				new_string.append(0)
-		elif (byte1 & 0xF0) == 0xE0:  # 3byte encoding
-			i += 1
-			byte2 = string[i]
-			i += 1
-			byte3 = string[i]
-			if i+3 < length and byte1 == 0xED and (byte2 & 0xF0) == 0xA0:
-				# See if this is a pair of 3byte encodings
-				byte4 = string[i+1]
-				byte5 = string[i+2]
-				byte6 = string[i+3]
-				if byte4 == 0xED and (byte5 & 0xF0) == 0xB0:
-					# Bits in: 11101101 1010xxxx 10xxxxxx
-					# Bits in: 11101101 1011xxxx 10xxxxxx
-					i += 3
-					# Reconstruct 21 bit code
-					u21 = ((byte2 & 0x0F) + 1) << 16
-					u21 += (byte3 & 0x3F) << 10
-					u21 += (byte5 & 0x0F) << 6
-					u21 += (byte6 & 0x3F)
-					# Bits out: 11110xxx 10xxxxxx 10xxxxxx 10xxxxxx
-					# Convert to 4byte encoding
-					new_string.append(0xF0 + ((u21 >> 18) & 0x07))
-					new_string.append(0x80 + ((u21 >> 12) & 0x3F))
-					new_string.append(0x80 + ((u21 >> 6) & 0x3F))
-					new_string.append(0x80 + (u21 & 0x3F))
-					continue 
-			new_string.append(byte1)
-			new_string.append(byte2)
-			new_string.append(byte3)
-		i += 1
-	return bytes(new_string)
+	string = bytes(string)
+	if string.isascii() or (b'\xed' not in string and b'\xc0\x80' not in string):
+		return string
+	return decode_mutf8(string).encode('utf8', 'surrogatepass')
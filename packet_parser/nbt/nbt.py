@@ -1,19 +1,29 @@
 
 import abc
 import enum
+import hashlib
+import io
+import struct
+import sys
 import uuid
+from collections import OrderedDict
 from abc import abstractmethod
-from typing import final, Self, Type
+from typing import final, Any, Iterable, Iterator, Self, TextIO, Type
 
 from loginproxy import PacketBuffer, PacketReader
 
 from .mutf8 import *
+from .buffer import BytesReader
+from .scan import read_raw, tag_end
 
 __all__ = [
 	'NBTID',
 	'NBT',
+	'NameCache', 'name_cache',
 ]
 
+_USHORT = struct.Struct('>H')
+
 class NBTID(enum.Enum):
 	Unknown   = -1
 	End       = 0x00
@@ -30,18 +40,122 @@ class NBTID(enum.Enum):
 	IntArray  = 0x0b
 	LongArray = 0x0c
 
+class NameCache:
+	"""
+	A bounded LRU cache that maps raw modified UTF-8 tag names to interned strings,
+	so the same few hundred keys are decoded once and shared by all parsed trees.
+	The encoder uses the reverse mapping, so names are not encoded again for every tag.
+	"""
+
+	__slots__ = ('maxsize', 'hits', 'misses', '_cache', '_encoded')
+
+	def __init__(self, maxsize: int = 4096):
+		self.maxsize = maxsize
+		self.hits = 0
+		self.misses = 0
+		self._cache: OrderedDict[bytes, str] = OrderedDict()
+		self._encoded: dict[str, bytes] = {}
+
+	def __len__(self) -> int:
+		return len(self._cache)
+
+	def decode(self, raw: bytes) -> str:
+		cache = self._cache
+		name = cache.get(raw, None)
+		if name is not None:
+			self.hits += 1
+			try:
+				cache.move_to_end(raw)
+			except KeyError: # evicted by another thread
+				pass
+			return name
+		self.misses += 1
+		name = sys.intern(decode_mutf8(raw))
+		cache[raw] = name
+		if len(cache) > self.maxsize:
+			try:
+				cache.popitem(last=False)
+			except KeyError:
+				pass
+		self._remember(name, raw)
+		return name
+
+	def encode(self, name: str) -> bytes:
+		"""
+		Return the modified UTF-8 encoding of a tag name
+		"""
+		raw = self._encoded.get(name, None)
+		if raw is None:
+			raw = encode_mutf8(name)
+			self._remember(name, raw)
+		return raw
+
+	def _remember(self, name: str, raw: bytes) -> None:
+		encoded = self._encoded
+		if len(encoded) >= self.maxsize and name not in encoded:
+			# the oldest entry is dropped, it is encoded again when it is used later
+			try:
+				del encoded[next(iter(encoded))]
+			except (KeyError, RuntimeError, StopIteration):
+				pass
+		encoded[name] = raw
+
+	def clear(self) -> None:
+		self._cache.clear()
+		self._encoded.clear()
+		self.hits = 0
+		self.misses = 0
+
+name_cache = NameCache()
+
+# stored as the parent of frozen tags, which do not track their parents
+_FROZEN: Any = object()
+
+_DIGEST_SIZE = 16
+
+# the nesting depth up to which containers are encoded recursively, deeper trees are walked with an explicit stack
+_MAX_RECURSION = 64
+
+def _blake2b(data: bytes | bytearray | memoryview = b''):
+	return hashlib.blake2b(data, digest_size=_DIGEST_SIZE)
+
 class NBT(abc.ABC):
+	"""
+	Tags compare equal when they have the same type and value, their own names are ignored.
+	Only frozen tags are hashable.
+
+	Frozen trees are immutable and can be shared, `thaw` returns a mutable shallow clone.
+	A mutable Compound or List replaces a frozen Compound or List child by its thawed clone
+	when the child is accessed with [], so writes deep inside a thawed tree copy only
+	the path to the changed tag, and the unchanged siblings stay shared.
+
+	Compounds and lists parsed from a BytesReader over bytes remember the bytes of their payload,
+	and are encoded by copying them until they or anything below them is modified.
+	"""
+
+	__slots__ = ('_name', '_parent')
+
 	ID: NBTID
+	# ID.value, read by the encoder without the enum lookup
+	_TID: int
 	_nbt_cls: dict[NBTID, Type['NBT']] = {}
+	# containers and arrays cache their digest in a slot of the same name
+	_digest: bytes | None = None
+	# containers cache the (buffer, start, end) of the payload they were parsed from in a slot of the same name
+	_source: tuple[memoryview, int, int] | None = None
+	# Compound and List, which are thawed on access inside a mutable container
+	_CONTAINER: bool = False
 
 	def __init_subclass__(cls, *, id: NBTID = NBTID.Unknown):
 		super().__init_subclass__()
 		if id != NBTID.Unknown:
 			cls.ID = id
+			cls._TID = id.value
 			NBT._nbt_cls[cls.ID] = cls
 
 	def __init__(self, name: str | None):
 		self._name = name
+		self._parent: NBT | None = None
 
 	@property
 	def name(self) -> str:
@@ -55,36 +169,401 @@ class NBT(abc.ABC):
 		elif name != self._name:
 			raise ValueError(f'Tag already have a name {repr(self._name)}, but trying to set to {repr(name)}')
 
+	@property
+	def frozen(self) -> bool:
+		return self._parent is _FROZEN
+
+	def freeze(self) -> Self:
+		"""
+		Make the tag and all its children immutable, then return it.
+		The tree is walked with an explicit stack, so deep nesting cannot overflow the python stack.
+		"""
+		stack: list[NBT] = [self]
+		while stack:
+			tag = stack.pop()
+			if tag._parent is not _FROZEN:
+				tag._parent = _FROZEN
+				stack.extend(tag._freeze_children())
+		return self
+
+	def _freeze_children(self) -> Iterable['NBT']:
+		"""
+		Prepare a container to be frozen and return its decoded children
+		"""
+		return ()
+
+	def thaw(self) -> 'NBT':
+		"""
+		Return a mutable version of the tag, the tag itself if it is not frozen.
+		Containers are cloned shallowly and share their frozen children.
+		"""
+		if self._parent is not _FROZEN:
+			return self
+		return self.copy()
+
+	def _check_mutable(self) -> None:
+		if self._parent is _FROZEN:
+			raise TypeError(f'Cannot modify a frozen {self.__class__.__name__}')
+
+	def _adopt(self, child: 'NBT') -> 'NBT':
+		"""
+		Return the tag to store as a child. A tag tracks only one parent, whose cached digests and source bytes
+		it drops when it changes, so a tag which already belongs to another container is copied.
+		"""
+		parent = child._parent
+		if parent is _FROZEN:
+			return child
+		if parent is not None:
+			child = child.copy()
+		child._parent = self
+		return child
+
+	def _changed(self) -> None:
+		"""
+		Drop the cached digests and source bytes of the tag and its ancestors.
+		A cache implies the same cache below it, so the walk stops at the first tag without any.
+		"""
+		if self._digest is not None:
+			self._digest = None
+		if self._source is not None:
+			self._source = None
+		node = self._parent
+		while node is not None and (node._digest is not None or node._source is not None):
+			node._digest = None
+			node._source = None
+			node = node._parent
+
+	def digest(self) -> bytes:
+		"""
+		Return a 16 bytes BLAKE2b digest of the type and value, the name of the tag itself is not included.
+		Compound keys are hashed in sorted order, so the digest does not depend on the key order.
+		"""
+		buf = bytearray(1 + self._payload_size())
+		buf[0] = self._TID
+		self._pack_payload(buf, 1)
+		return _blake2b(buf).digest()
+
+	def _nested(self) -> Iterable['NBT']:
+		"""
+		Return the Compound and List children of a container
+		"""
+		return ()
+
+	def _digest_nested(self) -> None:
+		"""
+		Compute the digests of the nested containers deepest first,
+		so the digest of each of them finds the digests of its children cached and does not recurse
+		"""
+		order: list[NBT] = []
+		stack: list[NBT] = [self]
+		while stack:
+			for tag in stack.pop()._nested():
+				if tag._digest is None:
+					order.append(tag)
+					stack.append(tag)
+		for tag in reversed(order):
+			tag.digest()
+
+	def __eq__(self, other: object) -> bool:
+		if self is other:
+			return True
+		if not isinstance(other, NBT):
+			return NotImplemented
+		return self.digest() == other.digest()
+
+	def __hash__(self) -> int:
+		if self._parent is not _FROZEN:
+			raise TypeError(f'unhashable type: mutable {self.__class__.__name__}, freeze it first')
+		return hash(self.digest())
+
 	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_byte(self.__class__.ID.value)
+		b.write(self.encode())
+
+	def to_bytes_value(self, b: PacketBuffer) -> None:
+		b.write(bytes(self._encode_payload()))
+
+	def encoded_size(self) -> int:
+		"""
+		Return the exact size of `encode()`, without encoding anything but uncached names and strings
+		"""
+		if self._name is None:
+			return 1 + self._payload_size()
+		return 3 + len(name_cache.encode(self._name)) + self._payload_size()
+
+	def pack_into(self, buf: bytearray, offset: int) -> int:
+		"""
+		Write the encoded tag into `buf` at `offset`, which must have `encoded_size()` bytes left,
+		and return the offset right after it
+		"""
+		buf[offset] = self._TID
+		offset += 1
 		if self._name is not None:
-			name = utf8s_to_utf8m(self.name.encode('utf8'))
-			b.write_ushort(len(name))
-			b.write(name)
-		self.to_bytes_value(b)
+			name = name_cache.encode(self._name)
+			_USHORT.pack_into(buf, offset, len(name))
+			offset += 2
+			buf[offset:offset + len(name)] = name
+			offset += len(name)
+		return self._pack_payload(buf, offset)
 
 	@abstractmethod
-	def to_bytes_value(self, b: PacketBuffer) -> None:
+	def _payload_size(self) -> int:
+		raise NotImplementedError()
+
+	@abstractmethod
+	def _pack_payload(self, buf: bytearray, offset: int) -> int:
+		"""
+		Write the payload at `offset` and return the offset right after it.
+		Containers write the headers of their children themselves, and pack through `_pack_nested`,
+		which bounds the recursion.
+		"""
+		raise NotImplementedError()
+
+	def _size_into(self, depth: int, deeper: list['NBT']) -> int:
+		"""
+		Return the payload size of a Compound or List at nesting `depth`. Its Compound and List children are measured
+		recursively up to _MAX_RECURSION, deeper ones are appended to `deeper` and left out of the size.
+		"""
+		raise NotImplementedError()
+
+	def _nested_size(self) -> int:
+		"""
+		Return the payload size of a Compound or List. Nesting deeper than _MAX_RECURSION is measured
+		with an explicit stack, so it cannot overflow the python stack.
+		"""
+		deeper: list[NBT] = []
+		size = self._size_into(0, deeper)
+		while deeper:
+			size += deeper.pop()._size_into(_MAX_RECURSION, deeper)
+		return size
+
+	def _pack_from(self, buf: bytearray, offset: int, it: Iterator[Any] | None,
+		depth: int) -> tuple[int, 'NBT | None', Iterator[Any] | None]:
+		"""
+		Pack the payload of a Compound or List at nesting `depth`, from the start if `it` is None,
+		otherwise from the children left in `it`. Its Compound and List children are packed recursively
+		up to _MAX_RECURSION. A deeper one stops the packing: its header is written, and it is returned
+		with the offset of its payload and the iterator to resume from.
+		Otherwise return the offset right after the payload, None and None.
+		"""
 		raise NotImplementedError()
 
+	def _pack_nested(self, buf: bytearray, offset: int) -> int:
+		"""
+		Pack a Compound or List. Nesting deeper than _MAX_RECURSION is packed with an explicit stack,
+		so it cannot overflow the python stack.
+		"""
+		offset, child, it = self._pack_from(buf, offset, None, 0)
+		if child is None:
+			return offset
+		return self._pack_deeper(buf, offset, child, it)
+
+	def _pack_deeper(self, buf: bytearray, offset: int, child: 'NBT', it: Iterator[Any] | None) -> int:
+		"""
+		Pack the payload of `child` with an explicit stack, then resume packing this container from `it`
+		"""
+		stack: list[tuple[NBT, Iterator[Any] | None]] = [(self, it)]
+		tag = child
+		it = None
+		while True:
+			offset, inner, sub = tag._pack_from(buf, offset, it, _MAX_RECURSION)
+			if inner is not None:
+				stack.append((tag, sub))
+				tag = inner
+				it = None
+			elif stack:
+				tag, it = stack.pop()
+			else:
+				return offset
+
+	def _encode_payload(self) -> bytearray:
+		buf = bytearray(self._payload_size())
+		self._pack_payload(buf, 0)
+		return buf
+
+	def encode(self) -> bytes:
+		"""
+		Return the encoded tag, the name is included only if the tag has one.
+		The size is computed first, then the tag is packed into one preallocated buffer.
+		"""
+		buf = bytearray(self.encoded_size())
+		self.pack_into(buf, 0)
+		return bytes(buf)
+
+	def copy(self) -> Self:
+		"""
+		Return a deep copy of the tag
+		"""
+		return self.__class__.parse_from(BytesReader(bytes(self._encode_payload())), self._name)
+
 	@classmethod
 	@abstractmethod
 	def parse_from(cls, r: PacketReader, name: str | None = None) -> Self:
 		raise NotImplementedError()
 
+	@classmethod
+	def parse_lazy(cls, r: BytesReader, name: str | None = None) -> Self:
+		"""
+		Parse the payload, but let containers defer decoding their children until they are accessed
+		"""
+		return cls.parse_from(r, name)
+
+	def to_python(self) -> Any:
+		"""
+		Convert the tag to plain python objects, see NBT.parse_python for the mapping
+		"""
+		raise NotImplementedError()
+
+	def _python_items(self) -> tuple[Any, Iterable[tuple[str | None, 'NBT']]]:
+		"""
+		Return the empty python container of a Compound or List and its (key, child) pairs left to convert,
+		the key is None for list elements
+		"""
+		raise NotImplementedError()
+
+	def _container_to_python(self) -> Any:
+		"""
+		Convert a Compound or List with an explicit stack, so deep nesting cannot overflow the python stack
+		"""
+		result, items = self._python_items()
+		stack = [(result, iter(items))]
+		while stack:
+			out, it = stack[-1]
+			for key, tag in it:
+				if tag._CONTAINER:
+					value, sub = tag._python_items()
+				else:
+					value, sub = tag.to_python(), None
+				if key is None:
+					out.append(value)
+				else:
+					out[key] = value
+				if sub is not None:
+					stack.append((value, iter(sub)))
+					break
+			else:
+				stack.pop()
+		return result
+
+	@staticmethod
+	def parse_python(r: PacketReader) -> Any:
+		"""
+		Decode one complete tag straight into plain python objects, without creating NBT instances
+		"""
+		from .plain import parse_python
+		return parse_python(r)
+
+	@staticmethod
+	def from_python(value: Any, schema: Any = None, name: str | None = None) -> 'NBT':
+		"""
+		Build a NBT tree from plain python objects, the schema gives the tag types of numbers,
+		e.g. {'Count': NBTID.Byte, 'Pos': [NBTID.Double]}
+		"""
+		from .plain import from_python
+		return from_python(value, schema, name)
+
+	@staticmethod
+	def measure(buf: bytes | bytearray | memoryview, offset: int = 0) -> int:
+		"""
+		Return the size in bytes of the complete tag starting at `offset`.
+		The structure is validated, but no tag is created and no string is decoded.
+		"""
+		return tag_end(buf, offset) - offset
+
 	@staticmethod
-	def parse(r: PacketReader) -> 'NBT':
+	def skip(r: PacketReader) -> bytes:
+		"""
+		Consume one complete tag from the reader and return its raw bytes, without parsing it
+		"""
+		if isinstance(r, BytesReader):
+			start = r.offset
+			r.offset = tag_end(r.buf, start)
+			return r.buf[start:r.offset].tobytes()
+		return read_raw(r)
+
+	@staticmethod
+	def parse(r: PacketReader, *, lazy: bool = False, frozen: bool = False, limits: Any = None) -> 'NBT':
+		"""
+		Parse one complete tag. Containers are parsed with an explicit stack, so deep nesting cannot
+		overflow the python stack. Untrusted data should be parsed with a ParseLimits,
+		which rejects too deep, too large or too long payloads before they are allocated.
+		"""
+		if frozen:
+			return NBT.parse(r, lazy=lazy, limits=limits).freeze()
+		if lazy:
+			if not isinstance(r, BytesReader):
+				r = BytesReader(read_raw(r))
+			if limits is not None:
+				from .parser import check_limits
+				check_limits(r.buf, r.offset, limits)
 		id = NBTID(r.read_ubyte())
 		if id == NBTID.End:
-			name = None
-		else:
-			name = utf8m_to_utf8s(r.read(r.read_ushort())).decode('utf8')
-		tag = NBT._nbt_cls[id].parse_from(r, name)
-		return tag
+			return NBT._nbt_cls[id].parse_from(r)
+		n = r.read_ushort()
+		name = name_cache.decode(r.read(n))
+		if lazy:
+			return NBT._nbt_cls[id].parse_lazy(r, name)
+		from .parser import parse_payload
+		return parse_payload(r, id.value, name, limits, 3 + n)
+
+	def to_snbt(self, *, compact: bool = False) -> str:
+		"""
+		Format the tag as SNBT, see nbt.snbt.write_snbt
+		"""
+		from .snbt import to_snbt
+		return to_snbt(self, compact=compact)
+
+	@staticmethod
+	def parse_snbt(text: str, name: str | None = None) -> 'NBT':
+		"""
+		Parse a SNBT text like `{id:"minecraft:stone",Count:1b}`
+		"""
+		from .snbt import parse_snbt
+		return parse_snbt(text, name)
 
 	def as_str(self, *, indent: int = 0) -> str:
-		ind = '  ' * indent
-		return ind + 'TAG_{0}({1})'.format(self.__class__.ID.name, repr(self._name))
+		out = io.StringIO()
+		self._write_str(out, indent)
+		return out.getvalue()
+
+	def _write_str(self, out: TextIO, indent: int) -> None:
+		out.write('  ' * indent)
+		out.write('TAG_{0}({1})'.format(self.__class__.ID.name, repr(self._name)))
+
+	def _str_entries(self) -> tuple[Iterable['NBT'], int]:
+		"""
+		Return the entries of a Compound or List in the order they are printed, and their count
+		"""
+		raise NotImplementedError()
+
+	def _write_entries(self, out: TextIO, indent: int) -> None:
+		"""
+		Print a Compound or List with an explicit stack, so deep nesting cannot overflow the python stack
+		"""
+		stack: list[Iterator[NBT]] = []
+		tag = self
+		while True:
+			level = indent + len(stack)
+			if tag._CONTAINER:
+				entries, count = tag._str_entries()
+				NBT._write_str(tag, out, level)
+				out.write(': 1 entry' if count == 1 else ': {} entries\n'.format(count))
+				out.write('  ' * level + '{\n')
+				stack.append(iter(entries))
+			else:
+				tag._write_str(out, level)
+				out.write('\n')
+			while stack:
+				for tag in stack[-1]:
+					break
+				else:
+					stack.pop()
+					out.write('  ' * (indent + len(stack)) + '}')
+					if stack:
+						out.write('\n')
+					continue
+				break
+			else:
+				return
 
 	def __repr__(self) -> str:
 		return self.as_str()
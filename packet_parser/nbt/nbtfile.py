@@ -0,0 +1,85 @@
+
+import enum
+import gzip
+import os
+import zlib
+from typing import BinaryIO, TypeAlias
+
+from .nbt import NBT
+from .buffer import BytesReader
+
+__all__ = [
+	'Compression',
+	'decompress',
+	'load_file',
+	'save_file',
+]
+
+FileLike: TypeAlias = 'str | os.PathLike[str] | BinaryIO'
+
+class Compression(enum.Enum):
+	# the values are the compression ids used by region files
+	GZIP = 1
+	ZLIB = 2
+	NONE = 3
+	LZ4  = 4
+
+def _detect(data: bytes) -> Compression:
+	if data[:2] == b'\x1f\x8b':
+		return Compression.GZIP
+	# a zlib header is 0x78 followed by a byte which makes the header a multiple of 31
+	if len(data) >= 2 and data[0] == 0x78 and (data[0] << 8 | data[1]) % 31 == 0:
+		return Compression.ZLIB
+	return Compression.NONE
+
+def decompress(data: bytes, compression: Compression | None = None) -> bytes:
+	"""
+	Decompress gzip or zlib data, the compression is detected from the header if it is None
+	"""
+	if compression is None:
+		compression = _detect(data)
+	if compression == Compression.GZIP:
+		return gzip.decompress(data)
+	if compression == Compression.ZLIB:
+		return zlib.decompress(data)
+	if compression == Compression.NONE:
+		return data
+	raise ValueError(f'{compression.name} compression is not supported')
+
+def _read(file: FileLike) -> bytes:
+	if isinstance(file, (str, os.PathLike)):
+		with open(file, 'rb') as fd:
+			return fd.read()
+	return file.read()
+
+def load_file(file: FileLike, *, compression: Compression | None = None,
+	lazy: bool = False, frozen: bool = False) -> NBT:
+	"""
+	Load a NBT file such as level.dat or a player .dat file, from a path or a binary file object.
+	The compression is detected from the header unless given.
+	"""
+	data = decompress(_read(file), compression)
+	r = BytesReader(data)
+	tag = NBT.parse(r, lazy=lazy, frozen=frozen) # type: ignore[arg-type]
+	if r.remain != 0:
+		raise ValueError(f'{r.remain} trailing bytes after the root tag')
+	return tag
+
+def save_file(tag: NBT, file: FileLike, *, compression: Compression = Compression.GZIP) -> None:
+	"""
+	Save a tag to a path or a binary file object, gzip compressed by default like the game does.
+	The root tag should be named, usually with an empty name.
+	"""
+	data = tag.encode()
+	if compression == Compression.GZIP:
+		# a zero mtime keeps the output reproducible
+		data = gzip.compress(data, mtime=0)
+	elif compression == Compression.ZLIB:
+		data = zlib.compress(data)
+	elif compression != Compression.NONE:
+		raise ValueError(f'{compression.name} compression is not supported')
+	if isinstance(file, (str, os.PathLike)):
+		with open(file, 'wb') as fd:
+			fd.write(data)
+	else:
+		file.write(data)
@@ -1,8 +1,9 @@
 
+import array
 import struct
-from typing import final, Self
+from typing import final, ClassVar, Self, TextIO
 
-from loginproxy import PacketBuffer, PacketReader
+from loginproxy import PacketReader
 
 from .nbt import NBT, NBTID
 
@@ -11,12 +12,76 @@ __all__ = [
 	'Float', 'Double',
 ]
 
-class _Integers(NBT):
+class _Numbers(NBT):
+	__slots__ = ('_value',)
+
+	_value: int | float
+	FORMAT: ClassVar[str]
+	# the array.array typecode of the same size, used by numeric lists
+	TYPECODE: ClassVar[str]
+	_STRUCT: ClassVar[struct.Struct]
+
+	def __init_subclass__(cls, *, fmt: str | None = None, **kwargs):
+		super().__init_subclass__(**kwargs)
+		if fmt is not None:
+			cls.FORMAT = fmt
+			cls._STRUCT = struct.Struct('>' + fmt)
+			if fmt in 'fd':
+				cls.TYPECODE = fmt
+			else:
+				cls.TYPECODE = next(c for c in 'bhilq' if array.array(c).itemsize == cls._STRUCT.size)
+
+	@classmethod
+	def _trusted(cls, value, name: str | None = None) -> Self:
+		"""
+		Create a tag without validating the value, only for values just unpacked with cls._STRUCT
+		"""
+		self = object.__new__(cls)
+		self._name = name
+		self._parent = None
+		self._value = value
+		return self
+
+	def _payload_size(self) -> int:
+		return self._STRUCT.size
+
+	def _pack_payload(self, buf: bytearray, offset: int) -> int:
+		st = self._STRUCT
+		st.pack_into(buf, offset, self._value)
+		return offset + st.size
+
+	@classmethod
+	def parse_from(cls, r: PacketReader, name: str | None = None) -> Self:
+		st = cls._STRUCT
+		return cls._trusted(st.unpack(r.read(st.size))[0], name)
+
+	@classmethod
+	def unpack_from(cls, buf: bytes | bytearray | memoryview, offset: int = 0,
+		name: str | None = None) -> tuple[Self, int]:
+		st = cls._STRUCT
+		return cls._trusted(st.unpack_from(buf, offset)[0], name), offset + st.size
+
+	@classmethod
+	def unpack_many(cls, data: bytes | bytearray | memoryview, count: int) -> list[Self]:
+		trusted = cls._trusted
+		return [trusted(v) for v in struct.unpack(f'>{count}{cls.FORMAT}', data)]
+
+	def to_python(self) -> int | float:
+		return self._value
+
+	def _write_str(self, out: TextIO, indent: int) -> None:
+		super()._write_str(out, indent)
+		out.write(': {}'.format(self._value))
+
+class _Integers(_Numbers):
+	__slots__ = ()
+
+	_value: int
 	MIN_VALUE: int
 	MAX_VALUE: int
-	def __init_subclass__(cls, *, byten: int, **kwargs):
+	def __init_subclass__(cls, **kwargs):
 		super().__init_subclass__(**kwargs)
-		mask = 1 << (8 * byten - 1)
+		mask = 1 << (8 * cls._STRUCT.size - 1)
 		cls.MIN_VALUE = -mask
 		cls.MAX_VALUE = mask - 1
 
@@ -33,52 +98,29 @@ class _Integers(NBT):
 
 	@value.setter
 	def value(self, value: int):
+		self._check_mutable()
 		self._value = value
-
-	def as_str(self, *, indent: int = 0) -> str:
-		return super().as_str(indent=indent) + ': {}'.format(self.value)
+		self._changed()
 
 @final
-class Byte(_Integers, id=NBTID.Byte, byten=1):
-	def to_bytes_value(self, b: PacketBuffer) -> None:
-		b.write_byte(self.value)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader, name: str | None = None) -> Self:
-		value = r.read_byte()
-		return cls(value, name)
+class Byte(_Integers, id=NBTID.Byte, fmt='b'):
+	__slots__ = ()
 
 @final
-class Short(_Integers, id=NBTID.Short, byten=2):
-	def to_bytes_value(self, b: PacketBuffer) -> None:
-		b.write_short(self.value)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader, name: str | None = None) -> Self:
-		value = r.read_short()
-		return cls(value, name)
+class Short(_Integers, id=NBTID.Short, fmt='h'):
+	__slots__ = ()
 
 @final
-class Int(_Integers, id=NBTID.Int, byten=4):
-	def to_bytes_value(self, b: PacketBuffer) -> None:
-		b.write_int(self.value)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader, name: str | None = None) -> Self:
-		value = r.read_int()
-		return cls(value, name)
+class Int(_Integers, id=NBTID.Int, fmt='i'):
+	__slots__ = ()
 
 @final
-class Long(_Integers, id=NBTID.Long, byten=8):
-	def to_bytes_value(self, b: PacketBuffer) -> None:
-		b.write_long(self.value)
+class Long(_Integers, id=NBTID.Long, fmt='q'):
+	__slots__ = ()
 
-	@classmethod
-	def parse_from(cls, r: PacketReader, name: str | None = None) -> Self:
-		value = r.read_long()
-		return cls(value, name)
+class _Decimals(_Numbers):
+	__slots__ = ()
 
-class _Decimals(NBT):
 	def __init__(self, value: float, name: str | None = None):
 		super().__init__(name)
 		self._value = value
@@ -89,27 +131,14 @@ class _Decimals(NBT):
 
 	@value.setter
 	def value(self, value: float):
+		self._check_mutable()
 		self._value = value
-
-	def as_str(self, *, indent: int = 0) -> str:
-		return super().as_str(indent=indent) + ': {}'.format(self.value)
+		self._changed()
 
 @final
-class Float(_Decimals, id=NBTID.Float):
-	def to_bytes_value(self, b: PacketBuffer) -> None:
-		b.write_float(self.value)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader, name: str | None = None) -> Self:
-		value = r.read_float()
-		return cls(value, name)
+class Float(_Decimals, id=NBTID.Float, fmt='f'):
+	__slots__ = ()
 
 @final
-class Double(_Decimals, id=NBTID.Double):
-	def to_bytes_value(self, b: PacketBuffer) -> None:
-		b.write_double(self.value)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader, name: str | None = None) -> Self:
-		value = r.read_double()
-		return cls(value, name)
+class Double(_Decimals, id=NBTID.Double, fmt='d'):
+	__slots__ = ()
@@ -0,0 +1,269 @@
+
+import array
+import struct
+import sys
+from typing import final, TYPE_CHECKING
+
+from loginproxy import PacketReader
+
+from .nbt import NBT, NBTID, name_cache
+from .buffer import BytesReader
+
+if TYPE_CHECKING:
+	from .lists import List
+
+__all__ = [
+	'ParseLimits',
+	'parse_payload',
+	'check_limits',
+]
+
+_NATIVE_LITTLE = sys.byteorder == 'little'
+
+_USHORT = struct.Struct('>H')
+_INT = struct.Struct('>i')
+_LIST_HEAD = struct.Struct('>bi')
+
+# payload size of Byte, Short, Int, Long, Float and Double, indexed by tag id
+_FIXED_SIZE = (0, 1, 2, 4, 8, 4, 8)
+# element size of ByteArray, IntArray and LongArray
+_ARRAY_ITEM = {0x07: 1, 0x0b: 4, 0x0c: 8}
+# the smallest payload of each tag id, used to reject impossible list lengths before reading them
+_MIN_SIZE = (0, 1, 2, 4, 8, 4, 8, 4, 2, 5, 1, 4, 4)
+
+@final
+class ParseLimits:
+	"""
+	Bounds for parsing untrusted NBT, None means unlimited.
+
+	`max_depth` limits the nesting of lists and compounds, `max_tags` the number of tags including list elements,
+	`max_bytes` the encoded size of the whole tag and `max_list_length` the length of lists and arrays.
+	"""
+
+	__slots__ = ('max_depth', 'max_tags', 'max_bytes', 'max_list_length')
+
+	def __init__(self, *, max_depth: int | None = 512, max_tags: int | None = None,
+		max_bytes: int | None = None, max_list_length: int | None = None):
+		self.max_depth = max_depth
+		self.max_tags = max_tags
+		self.max_bytes = max_bytes
+		self.max_list_length = max_list_length
+
+	def __repr__(self) -> str:
+		return 'ParseLimits(max_depth={}, max_tags={}, max_bytes={}, max_list_length={})'.format(
+			self.max_depth, self.max_tags, self.max_bytes, self.max_list_length)
+
+def _unpack(limits: ParseLimits | None) -> tuple[int, int, int, int]:
+	if limits is None:
+		return sys.maxsize, sys.maxsize, sys.maxsize, sys.maxsize
+	return (
+		sys.maxsize if limits.max_depth is None else limits.max_depth,
+		sys.maxsize if limits.max_tags is None else limits.max_tags,
+		sys.maxsize if limits.max_bytes is None else limits.max_bytes,
+		sys.maxsize if limits.max_list_length is None else limits.max_list_length,
+	)
+
+def _too_many_tags(max_tags: int) -> ValueError:
+	return ValueError(f'NBT has more than {max_tags} tags')
+
+def _too_large(max_bytes: int) -> ValueError:
+	return ValueError(f'NBT data is larger than {max_bytes} bytes')
+
+def _check_length(count: int, max_list: int) -> None:
+	if count < 0:
+		raise ValueError(f'Length must not be negative, but got {count}')
+	if count > max_list:
+		raise ValueError(f'Length {count} is larger than {max_list}')
+
+def parse_payload(r: PacketReader, tid: int, name: str | None = None,
+	limits: ParseLimits | None = None, used: int = 0) -> NBT:
+	"""
+	Parse the payload of a tag with an explicit stack, so nesting never recurses in python.
+	The limits are checked with counters before anything is read or allocated,
+	`used` is the size of the tag header which is already read.
+	When reading a BytesReader over bytes, compounds and lists keep the span of their payload in the buffer,
+	mutable buffers are not kept since they may change or be resized later.
+	"""
+	max_depth, max_tags, max_bytes, max_list = _unpack(limits)
+	classes = NBT._nbt_cls
+	compound_cls = classes[NBTID.Compound]
+	list_cls: 'type[List]' = classes[NBTID.List] # type: ignore[assignment]
+	src = r.buf if isinstance(r, BytesReader) and isinstance(r.buf.obj, bytes) else None
+	start = 0
+	tags = 1
+	nbytes = used
+	# [None, name, children, start] for a compound, [element id, name, children, start, length] for a list
+	stack: list[list] = []
+	while True:
+		tag: NBT | None = None
+		if tid == 0x0a or tid == 0x09:
+			if len(stack) >= max_depth:
+				raise ValueError(f'NBT is nested deeper than {max_depth}')
+			if src is not None:
+				start = r.offset # type: ignore[attr-defined]
+			if tid == 0x0a:
+				stack.append([None, name, [], start])
+			else:
+				element, count = _LIST_HEAD.unpack(r.read(5))
+				nbytes += 5
+				_check_length(count, max_list)
+				if not 0x00 <= element <= 0x0c:
+					raise ValueError(f'Unknown tag id {element}')
+				tags += count
+				if tags > max_tags:
+					raise _too_many_tags(max_tags)
+				nbytes += count * _MIN_SIZE[element]
+				if nbytes > max_bytes:
+					raise _too_large(max_bytes)
+				eletyp = classes[NBTID(element)]
+				if count == 0:
+					tag = list_cls(NBTID(element), [], name)
+					if src is not None:
+						tag._source = (src, start, r.offset) # type: ignore[attr-defined]
+				elif 0x01 <= element <= 0x06:
+					# numbers are kept in an array, their tags are created when they are accessed
+					values = array.array(eletyp.TYPECODE) # type: ignore[attr-defined]
+					values.frombytes(r.read(_FIXED_SIZE[element] * count))
+					if _NATIVE_LITTLE:
+						values.byteswap()
+					tag = list_cls._from_array(NBTID(element), values, name)
+					if src is not None:
+						tag._source = (src, start, r.offset) # type: ignore[attr-defined]
+				elif element == 0x00:
+					raise ValueError('List of End must be empty')
+				else:
+					# the minimum size is counted again when each element is read
+					nbytes -= count * _MIN_SIZE[element]
+					stack.append([NBTID(element), name, [], start, count])
+		elif 0x01 <= tid <= 0x06:
+			cls = classes[NBTID(tid)]
+			st = cls._STRUCT # type: ignore[attr-defined]
+			nbytes += st.size
+			if nbytes > max_bytes:
+				raise _too_large(max_bytes)
+			tag = cls._trusted(st.unpack(r.read(st.size))[0], name) # type: ignore[attr-defined]
+		elif tid == 0x08:
+			n = r.read_ushort()
+			nbytes += 2 + n
+			if nbytes > max_bytes:
+				raise _too_large(max_bytes)
+			tag = classes[NBTID.String]._from_raw(r.read(n), name) # type: ignore[attr-defined]
+		elif tid in _ARRAY_ITEM:
+			count = r.read_int()
+			_check_length(count, max_list)
+			nbytes += 4 + count * _ARRAY_ITEM[tid]
+			if nbytes > max_bytes:
+				raise _too_large(max_bytes)
+			tag = classes[NBTID(tid)]._from_raw(r.read(count * _ARRAY_ITEM[tid]), name) # type: ignore[attr-defined]
+		else:
+			raise ValueError(f'Unknown tag id {tid}')
+
+		while True:
+			if tag is not None:
+				if not stack:
+					return tag
+				stack[-1][2].append(tag)
+			frame = stack[-1]
+			if frame[0] is None:
+				t = r.read_ubyte()
+				if t == 0x00:
+					nbytes += 1
+					stack.pop()
+					tag = compound_cls(frame[2], frame[1]) # type: ignore[call-arg]
+					if src is not None:
+						tag._source = (src, frame[3], r.offset) # type: ignore[attr-defined]
+					continue
+				n = r.read_ushort()
+				nbytes += 3 + n
+				tags += 1
+				if tags > max_tags:
+					raise _too_many_tags(max_tags)
+				if nbytes > max_bytes:
+					raise _too_large(max_bytes)
+				name = name_cache.decode(r.read(n))
+				tid = t
+				break
+			if len(frame[2]) == frame[4]:
+				stack.pop()
+				tag = list_cls(frame[0], frame[2], frame[1])
+				if src is not None:
+					tag._source = (src, frame[3], r.offset) # type: ignore[attr-defined]
+				continue
+			tid = frame[0].value
+			name = None
+			break
+
+def check_limits(buf: bytes | bytearray | memoryview, offset: int, limits: ParseLimits) -> int:
+	"""
+	Check a complete encoded tag starting at `offset` against the limits without building any tag,
+	return the offset right after it
+	"""
+	max_depth, max_tags, max_bytes, max_list = _unpack(limits)
+	start = offset
+	tags = 1
+	# [-1, 0] for a compound, [element id, remaining] for a list
+	stack: list[list[int]] = []
+	try:
+		tid = buf[offset]
+		if tid == 0x00:
+			return offset + 1
+		offset += 3 + _USHORT.unpack_from(buf, offset + 1)[0]
+		while True:
+			if 0x01 <= tid <= 0x06:
+				offset += _FIXED_SIZE[tid]
+			elif tid == 0x08:
+				offset += 2 + _USHORT.unpack_from(buf, offset)[0]
+			elif tid in _ARRAY_ITEM:
+				count = _INT.unpack_from(buf, offset)[0]
+				_check_length(count, max_list)
+				offset += 4 + count * _ARRAY_ITEM[tid]
+			elif tid == 0x09 or tid == 0x0a:
+				if len(stack) >= max_depth:
+					raise ValueError(f'NBT is nested deeper than {max_depth}')
+				if tid == 0x0a:
+					stack.append([-1, 0])
+				else:
+					element, count = _LIST_HEAD.unpack_from(buf, offset)
+					offset += 5
+					_check_length(count, max_list)
+					tags += count
+					if count > 0:
+						if not 0x01 <= element <= 0x0c:
+							raise ValueError(f'Unexpected list element type {element}')
+						if 0x01 <= element <= 0x06:
+							offset += count * _FIXED_SIZE[element]
+						else:
+							stack.append([element, count])
+			else:
+				raise ValueError(f'Unknown tag id {tid}')
+			if tags > max_tags:
+				raise _too_many_tags(max_tags)
+			if offset - start > max_bytes:
+				raise _too_large(max_bytes)
+
+			while stack:
+				frame = stack[-1]
+				if frame[0] == -1:
+					tid = buf[offset]
+					offset += 1
+					if tid == 0x00:
+						stack.pop()
+						continue
+					tags += 1
+					offset += 2 + _USHORT.unpack_from(buf, offset)[0]
+					break
+				frame[1] -= 1
+				if frame[1] < 0:
+					stack.pop()
+					continue
+				tid = frame[0]
+				break
+			else:
+				break
+	except (IndexError, struct.error):
+		raise ValueError('Truncated NBT data') from None
+	if offset > len(buf):
+		raise ValueError('Truncated NBT data')
+	if offset - start > max_bytes:
+		raise _too_large(max_bytes)
+	return offset
@@ -0,0 +1,414 @@
+
+import array
+import struct
+from typing import final, Any, Iterator, Sequence
+
+from .nbt import NBT, NBTID
+from .mutf8 import *
+from .buffer import BytesReader
+from .raw import RawNBT
+from .scan import skip_payload, tag_end
+from .snbt import _parse_at, to_snbt
+
+__all__ = [
+	'NBTPath',
+]
+
+_USHORT = struct.Struct('>H')
+_INT = struct.Struct('>i')
+_LIST_HEAD = struct.Struct('>bi')
+
+# payload size of Byte, Short, Int, Long, Float and Double, indexed by tag id
+_FIXED_SIZE = (0, 1, 2, 4, 8, 4, 8)
+# element id of ByteArray, IntArray and LongArray
+_ARRAY_ELEMENT = {
+	NBTID.ByteArray.value: NBTID.Byte.value,
+	NBTID.IntArray.value: NBTID.Int.value,
+	NBTID.LongArray.value: NBTID.Long.value,
+}
+
+# A located payload inside a buffer: (tag id, payload offset)
+_Span = tuple[int, int]
+
+class _Node:
+	__slots__ = ()
+
+	def select(self, tags: list[NBT]) -> list[NBT]:
+		raise NotImplementedError()
+
+	def select_raw(self, buf: memoryview, spans: list[_Span]) -> list[_Span]:
+		raise NotImplementedError()
+
+@final
+class _Key(_Node):
+	__slots__ = ('name', 'raw')
+
+	def __init__(self, name: str):
+		self.name = name
+		self.raw = encode_mutf8(name)
+
+	def select(self, tags: list[NBT]) -> list[NBT]:
+		result = []
+		for tag in tags:
+			if tag.ID == NBTID.Compound:
+				child = tag.get(self.name) # type: ignore[attr-defined]
+				if child is not None:
+					result.append(child)
+		return result
+
+	def select_raw(self, buf: memoryview, spans: list[_Span]) -> list[_Span]:
+		raw = self.raw
+		size = len(raw)
+		result = []
+		for tid, offset in spans:
+			if tid != NBTID.Compound.value:
+				continue
+			while True:
+				t = buf[offset]
+				if t == 0x00:
+					break
+				n = _USHORT.unpack_from(buf, offset + 1)[0]
+				offset += 3
+				if n == size and buf[offset:offset + n] == raw:
+					result.append((t, offset + n))
+					break
+				offset = skip_payload(buf, offset + n, t)
+		return result
+
+	def __str__(self) -> str:
+		if self.name and all(c not in self.name for c in _SPECIAL):
+			return self.name
+		return '"' + self.name.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+def _numbers(tag: NBT) -> tuple[Any, Sequence[Any]] | None:
+	"""
+	Return the element constructor and the numbers of an array or a numeric list, or None.
+	They are read from the storage directly, since the accessors drop the cached digest and source bytes of the tree.
+	"""
+	tid = tag._TID
+	if tid == NBTID.List.value:
+		values = tag._values # type: ignore[attr-defined]
+		if values is None:
+			return None
+		element = tag._element # type: ignore[attr-defined]
+	elif tid == NBTID.ByteArray.value:
+		values = array.array('b')
+		values.frombytes(tag._value) # type: ignore[attr-defined]
+		element = NBTID.Byte
+	elif tid in _ARRAY_ELEMENT:
+		values = tag._decoded() # type: ignore[attr-defined]
+		element = NBTID(_ARRAY_ELEMENT[tid])
+	else:
+		return None
+	return NBT._nbt_cls[element]._trusted, values # type: ignore[attr-defined]
+
+def _elements(tag: NBT) -> Sequence[NBT]:
+	"""
+	Return the elements of a list or an array without modifying it.
+	Numbers are returned as new tags, which are not part of the tree.
+	"""
+	numbers = _numbers(tag)
+	if numbers is not None:
+		trusted, values = numbers
+		return [trusted(v) for v in values]
+	if tag._TID == NBTID.List.value:
+		return tag._children # type: ignore[attr-defined]
+	return ()
+
+def _raw_elements(buf: memoryview, tid: int, offset: int) -> tuple[int, int, int]:
+	"""
+	Return (element id, element count, offset of the first element), or element id -1 if not a list
+	"""
+	if tid == NBTID.List.value:
+		element, count = _LIST_HEAD.unpack_from(buf, offset)
+		return element, max(count, 0), offset + 5
+	element = _ARRAY_ELEMENT.get(tid, -1)
+	if element == -1:
+		return -1, 0, offset
+	return element, max(_INT.unpack_from(buf, offset)[0], 0), offset + 4
+
+def _iter_raw_elements(buf: memoryview, tid: int, offset: int) -> Iterator[_Span]:
+	element, count, offset = _raw_elements(buf, tid, offset)
+	if count == 0:
+		return
+	if 0x01 <= element <= 0x06:
+		size = _FIXED_SIZE[element]
+		for i in range(count):
+			yield element, offset + i * size
+		return
+	for _ in range(count):
+		yield element, offset
+		offset = skip_payload(buf, offset, element)
+
+@final
+class _Index(_Node):
+	__slots__ = ('index',)
+
+	def __init__(self, index: int):
+		self.index = index
+
+	def select(self, tags: list[NBT]) -> list[NBT]:
+		result = []
+		index = self.index
+		for tag in tags:
+			numbers = _numbers(tag)
+			if numbers is None:
+				elements = _elements(tag)
+				if -len(elements) <= index < len(elements):
+					result.append(elements[index])
+				continue
+			trusted, values = numbers
+			if -len(values) <= index < len(values):
+				result.append(trusted(values[index]))
+		return result
+
+	def select_raw(self, buf: memoryview, spans: list[_Span]) -> list[_Span]:
+		result = []
+		for tid, offset in spans:
+			element, count, offset = _raw_elements(buf, tid, offset)
+			index = self.index + count if self.index < 0 else self.index
+			if not 0 <= index < count:
+				continue
+			if 0x01 <= element <= 0x06:
+				result.append((element, offset + index * _FIXED_SIZE[element]))
+				continue
+			for _ in range(index):
+				offset = skip_payload(buf, offset, element)
+			result.append((element, offset))
+		return result
+
+	def __str__(self) -> str:
+		return f'[{self.index}]'
+
+@final
+class _All(_Node):
+	__slots__ = ()
+
+	def select(self, tags: list[NBT]) -> list[NBT]:
+		result: list[NBT] = []
+		for tag in tags:
+			result.extend(_elements(tag))
+		return result
+
+	def select_raw(self, buf: memoryview, spans: list[_Span]) -> list[_Span]:
+		result: list[_Span] = []
+		for tid, offset in spans:
+			result.extend(_iter_raw_elements(buf, tid, offset))
+		return result
+
+	def __str__(self) -> str:
+		return '[]'
+
+def _matches(pattern: NBT, tag: NBT) -> bool:
+	"""
+	Test a tag against a filter like the vanilla nbt_path: compounds match if every key of the pattern matches,
+	lists match if every element of the pattern matches some element, other tags must be equal
+	"""
+	if pattern.ID == NBTID.Compound:
+		if tag.ID != NBTID.Compound:
+			return False
+		for key in pattern: # type: ignore[attr-defined]
+			child = tag.get(key) # type: ignore[attr-defined]
+			if child is None or not _matches(pattern[key], child): # type: ignore[index]
+				return False
+		return True
+	if pattern.ID == NBTID.List:
+		if tag.ID != NBTID.List:
+			return False
+		if len(pattern) == 0: # type: ignore[arg-type]
+			return len(tag) == 0 # type: ignore[arg-type]
+		return all(any(_matches(p, t) for t in tag) for p in pattern) # type: ignore[attr-defined]
+	return pattern == tag
+
+@final
+class _Filter(_Node):
+	__slots__ = ('pattern',)
+
+	def __init__(self, pattern: NBT):
+		self.pattern = pattern
+
+	def select(self, tags: list[NBT]) -> list[NBT]:
+		return [tag for tag in tags if _matches(self.pattern, tag)]
+
+	def select_raw(self, buf: memoryview, spans: list[_Span]) -> list[_Span]:
+		parse_lazy = NBT._nbt_cls[NBTID.Compound].parse_lazy
+		result = []
+		for tid, offset in spans:
+			# decode the candidate lazily, so only the keys named by the pattern are decoded
+			if tid == NBTID.Compound.value and _matches(self.pattern, parse_lazy(BytesReader(buf, offset))):
+				result.append((tid, offset))
+		return result
+
+	def __str__(self) -> str:
+		return to_snbt(self.pattern, compact=True)
+
+_SPECIAL = ' .[]{}"\''
+
+def _parse_quoted(text: str, i: int) -> tuple[str, int]:
+	quote = text[i]
+	i += 1
+	chars = []
+	while i < len(text):
+		c = text[i]
+		if c == '\\':
+			if i + 1 >= len(text):
+				break
+			chars.append(text[i + 1])
+			i += 2
+			continue
+		if c == quote:
+			return ''.join(chars), i + 1
+		chars.append(c)
+		i += 1
+	raise ValueError(f'Unterminated quoted key in NBT path {repr(text)}')
+
+def _parse_filter(text: str, i: int) -> tuple[NBT, int]:
+	try:
+		return _parse_at(text, i)
+	except ValueError as e:
+		raise ValueError(f'Invalid filter in NBT path {repr(text)}: {e}') from None
+
+def _parse(text: str) -> list[_Node]:
+	nodes: list[_Node] = []
+	i = 0
+	n = len(text)
+	want_key = True # a key may appear at the beginning or after a dot
+	while i < n:
+		c = text[i]
+		if c == '[':
+			k = i + 1
+			while k < n and text[k].isspace():
+				k += 1
+			if k < n and text[k] == '{':
+				# [{...}] selects the elements which match the filter
+				pattern, j = _parse_filter(text, k)
+				while j < n and text[j].isspace():
+					j += 1
+				if j >= n or text[j] != ']':
+					raise ValueError(f'Unclosed bracket in NBT path {repr(text)}')
+				nodes.append(_All())
+				nodes.append(_Filter(pattern))
+				i = j + 1
+				want_key = False
+				continue
+			j = text.find(']', i)
+			if j == -1:
+				raise ValueError(f'Unclosed bracket in NBT path {repr(text)}')
+			content = text[i + 1:j].strip()
+			if content == '':
+				nodes.append(_All())
+			else:
+				try:
+					nodes.append(_Index(int(content)))
+				except ValueError:
+					raise ValueError(f'Invalid index {repr(content)} in NBT path {repr(text)}') from None
+			i = j + 1
+			want_key = False
+		elif c == '{':
+			# a filter may follow a key, or stand at the beginning for the root tag
+			if want_key and i != 0:
+				raise ValueError(f'Unexpected filter at {i} in NBT path {repr(text)}')
+			pattern, i = _parse_filter(text, i)
+			nodes.append(_Filter(pattern))
+			want_key = False
+		elif c == '.':
+			if want_key:
+				raise ValueError(f'Unexpected dot at {i} in NBT path {repr(text)}')
+			i += 1
+			want_key = True
+			if i == n:
+				raise ValueError(f'NBT path {repr(text)} must not end with a dot')
+		elif not want_key:
+			raise ValueError(f'Unexpected {repr(c)} at {i} in NBT path {repr(text)}')
+		elif c == '"' or c == "'":
+			key, i = _parse_quoted(text, i)
+			nodes.append(_Key(key))
+			want_key = False
+		else:
+			j = i
+			while j < n and text[j] not in _SPECIAL:
+				j += 1
+			if j == i:
+				raise ValueError(f'Unexpected {repr(c)} at {i} in NBT path {repr(text)}')
+			nodes.append(_Key(text[i:j]))
+			i = j
+			want_key = False
+	return nodes
+
+@final
+class NBTPath:
+	"""
+	A compiled NBT path in the syntax of minecraft:nbt_path, e.g. `display.Name`, `Items[].tag.id`
+	or `Items[{Slot:0b}].tag`.
+	Compile it once and reuse it: it can be evaluated on parsed trees with `select`,
+	or directly on encoded bytes with `select_bytes`,
+	which skips every unrelated subtree without decoding it.
+	"""
+
+	__slots__ = ('_nodes',)
+
+	def __init__(self, path: str):
+		self._nodes = _parse(path)
+
+	@classmethod
+	def compile(cls, path: str) -> 'NBTPath':
+		return cls(path)
+
+	def select(self, tag: NBT) -> list[NBT]:
+		tags = [tag]
+		for node in self._nodes:
+			if not tags:
+				break
+			# RawNBT compounds and lists, e.g. a passthrough Slot.nbt, are decoded lazily to walk into them
+			tags = node.select([t.decode(lazy=True) if isinstance(t, RawNBT) else t for t in tags])
+		return tags
+
+	def get(self, tag: NBT, default: NBT | None = None) -> NBT | None:
+		tags = self.select(tag)
+		return tags[0] if tags else default
+
+	def select_spans(self, data: bytes | bytearray | memoryview,
+		offset: int = 0) -> list[tuple[NBTID, int, int]]:
+		"""
+		Evaluate the path on a complete encoded tag starting at `offset`,
+		return the (tag id, start, end) of the payload of each match
+		"""
+		buf = data if isinstance(data, memoryview) else memoryview(data)
+		tag_end(buf, offset) # validate the whole tag once, so the walk below can trust it
+		tid = buf[offset]
+		if tid == 0x00:
+			return []
+		spans: list[_Span] = [(tid, offset + 3 + _USHORT.unpack_from(buf, offset + 1)[0])]
+		for node in self._nodes:
+			if not spans:
+				break
+			spans = node.select_raw(buf, spans)
+		return [(NBTID(t), start, skip_payload(buf, start, t)) for t, start in spans]
+
+	def select_bytes(self, data: bytes | bytearray | memoryview, offset: int = 0) -> list[NBT]:
+		"""
+		Evaluate the path on a complete encoded tag starting at `offset`, and only decode the matches.
+		The matched tags are decoded without their names.
+		"""
+		buf = data if isinstance(data, memoryview) else memoryview(data)
+		result = []
+		for tid, start, _ in self.select_spans(buf, offset):
+			result.append(NBT._nbt_cls[tid].parse_from(BytesReader(buf, start)))
+		return result
+
+	def __str__(self) -> str:
+		s = ''
+		nodes = self._nodes
+		for i, node in enumerate(nodes):
+			if isinstance(node, _Key) and s:
+				s += '.'
+			if isinstance(node, _All) and i + 1 < len(nodes) and isinstance(nodes[i + 1], _Filter):
+				continue
+			if isinstance(node, _Filter) and i > 0 and isinstance(nodes[i - 1], _All):
+				s += f'[{node}]'
+				continue
+			s += str(node)
+		return s
+
+	def __repr__(self) -> str:
+		return f'NBTPath({repr(str(self))})'
@@ -0,0 +1,245 @@
+
+import array
+import struct
+import sys
+from typing import Any, Callable, TypeAlias
+
+from loginproxy import PacketBuffer, PacketReader
+
+from .nbt import NBT, NBTID, name_cache
+from .mutf8 import *
+
+__all__ = [
+	'Schema',
+	'read_scalar',
+	'parse_python',
+	'write_python',
+	'from_python',
+]
+
+# A schema hint is a NBTID for a single tag, a dict of schemas for a compound,
+# or a list with one schema for the elements of a list.
+# Keys or elements which are missing from the hint are inferred from the python value.
+Schema: TypeAlias = 'NBTID | dict[str, Schema] | list[Schema] | None'
+
+_NATIVE_LITTLE = sys.byteorder == 'little'
+
+_USHORT = struct.Struct('>H')
+_INT = struct.Struct('>i')
+_LIST_HEAD = struct.Struct('>bi')
+
+# struct format of Byte, Short, Int, Long, Float and Double, indexed by tag id
+_FORMATS = ('', 'b', 'h', 'i', 'q', 'f', 'd')
+_STRUCTS = tuple(struct.Struct('>' + f) if f else None for f in _FORMATS)
+_TYPECODES = {
+	NBTID.IntArray.value: next(c for c in 'ilq' if array.array(c).itemsize == 4),
+	NBTID.LongArray.value: 'q',
+}
+
+def read_scalar(read: Callable[[int], bytes], tid: int) -> Any:
+	"""
+	Read the payload of any tag except List and Compound as a plain python object
+	"""
+	if 0x01 <= tid <= 0x06:
+		st = _STRUCTS[tid]
+		assert st is not None
+		return st.unpack(read(st.size))[0]
+	if tid == 0x08:
+		return decode_mutf8(read(_USHORT.unpack(read(2))[0]))
+	if tid == 0x07 or tid in _TYPECODES:
+		count = _INT.unpack(read(4))[0]
+		if count < 0:
+			raise ValueError(f'Array length must not be negative, but got {count}')
+		if tid == 0x07:
+			return read(count)
+		arr = array.array(_TYPECODES[tid])
+		arr.frombytes(read(count * arr.itemsize))
+		if _NATIVE_LITTLE:
+			arr.byteswap()
+		return arr
+	raise ValueError(f'Unexpected tag id {tid}')
+
+def _read_value(r: PacketReader, tid: int) -> Any:
+	"""
+	Read a payload with an explicit stack, so deep nesting cannot overflow the python stack
+	"""
+	# [dict, None, key] for a compound, [list, element id, length] for a list
+	stack: list[list] = []
+	while True:
+		if tid == 0x0a:
+			stack.append([{}, None, None])
+		elif tid == 0x09:
+			element, count = _LIST_HEAD.unpack(r.read(5))
+			if count < 0:
+				raise ValueError(f'Length must not be negative, but got {count}')
+			if count > 0 and 0x01 <= element <= 0x06:
+				st = _STRUCTS[element]
+				assert st is not None
+				# the numbers are read at once, the frame is closed right away
+				stack.append([list(struct.unpack(f'>{count}{_FORMATS[element]}', r.read(st.size * count))), element, count])
+			else:
+				stack.append([[], element, count])
+		else:
+			value = read_scalar(r.read, tid)
+			if not stack:
+				return value
+			frame = stack[-1]
+			if frame[1] is None:
+				frame[0][frame[2]] = value
+			else:
+				frame[0].append(value)
+		# find the next tag to read, and close the containers which are complete
+		while True:
+			frame = stack[-1]
+			if frame[1] is None:
+				t = r.read(1)[0]
+				if t != 0x00:
+					frame[2] = name_cache.decode(r.read(_USHORT.unpack(r.read(2))[0]))
+					tid = t
+					break
+			elif len(frame[0]) < frame[2]:
+				tid = frame[1]
+				break
+			stack.pop()
+			if not stack:
+				return frame[0]
+			parent = stack[-1]
+			if parent[1] is None:
+				parent[0][parent[2]] = frame[0]
+			else:
+				parent[0].append(frame[0])
+
+def parse_python(r: PacketReader) -> Any:
+	"""
+	Decode one complete tag straight into plain python objects, without creating NBT instances.
+	Compounds become dict, lists become list, ByteArray becomes bytes,
+	IntArray and LongArray become array.array, and the numbers become int or float.
+	The name of the root tag is dropped, End is decoded as None.
+	"""
+	tid = r.read(1)[0]
+	if tid == 0x00:
+		return None
+	r.read(_USHORT.unpack(r.read(2))[0])
+	return _read_value(r, tid)
+
+def _infer(value: Any) -> NBTID:
+	if isinstance(value, bool):
+		return NBTID.Byte
+	if isinstance(value, int):
+		return NBTID.Int if -0x80000000 <= value <= 0x7fffffff else NBTID.Long
+	if isinstance(value, float):
+		return NBTID.Double
+	if isinstance(value, str):
+		return NBTID.String
+	if isinstance(value, dict):
+		return NBTID.Compound
+	if isinstance(value, (list, tuple)):
+		return NBTID.List
+	if isinstance(value, (bytes, bytearray)):
+		return NBTID.ByteArray
+	if isinstance(value, array.array):
+		if value.typecode in 'bB':
+			return NBTID.ByteArray
+		return NBTID.IntArray if value.itemsize <= 4 else NBTID.LongArray
+	raise TypeError(f'Cannot convert {type(value)} to NBT')
+
+def _resolve(value: Any, schema: Schema) -> NBTID:
+	if isinstance(schema, NBTID):
+		return schema
+	if isinstance(schema, dict):
+		return NBTID.Compound
+	if isinstance(schema, list):
+		return NBTID.List
+	return _infer(value)
+
+# the inferred number types in the order a list of mixed numbers is widened
+_WIDENING = (NBTID.Byte, NBTID.Int, NBTID.Long, NBTID.Double)
+
+def _element_schema(values: Any, schema: Schema) -> tuple[NBTID, Schema]:
+	sub = schema[0] if isinstance(schema, list) and len(schema) > 0 else None
+	if len(values) == 0:
+		return (NBTID.End if sub is None else _resolve(None, sub)), sub
+	if sub is not None:
+		return _resolve(values[0], sub), sub
+	element = _infer(values[0])
+	for v in values:
+		e = _infer(v)
+		if e == element:
+			continue
+		if e not in _WIDENING or element not in _WIDENING:
+			raise TypeError(f'List elements must have the same type, but got {element.name} and {e.name}')
+		# widen the whole list to the widest number, e.g. [1, 2.5] to a list of Double
+		if _WIDENING.index(e) > _WIDENING.index(element):
+			element = e
+	return element, sub
+
+def _write_value(write: Callable[[bytes], Any], value: Any, tid: NBTID, schema: Schema) -> None:
+	t = tid.value
+	if 0x01 <= t <= 0x06:
+		st = _STRUCTS[t]
+		assert st is not None
+		write(st.pack(value))
+	elif t == 0x08:
+		data = encode_mutf8(value)
+		write(_USHORT.pack(len(data)))
+		write(data)
+	elif t == 0x0a:
+		for key, val in value.items():
+			sub = schema.get(key, None) if isinstance(schema, dict) else None
+			typ = _resolve(val, sub)
+			name = encode_mutf8(key)
+			write(bytes((typ.value,)) + _USHORT.pack(len(name)) + name)
+			_write_value(write, val, typ, sub)
+		write(b'\x00')
+	elif t == 0x09:
+		element, sub = _element_schema(value, schema)
+		e = element.value
+		write(_LIST_HEAD.pack(e, len(value)))
+		if 0x01 <= e <= 0x06:
+			write(struct.pack(f'>{len(value)}{_FORMATS[e]}', *value))
+		else:
+			for val in value:
+				_write_value(write, val, element, sub)
+	elif t == 0x07:
+		write(_INT.pack(len(value)))
+		write(bytes(value))
+	elif t in _TYPECODES:
+		arr = array.array(_TYPECODES[t], value)
+		if _NATIVE_LITTLE:
+			arr.byteswap()
+		write(_INT.pack(len(arr)))
+		write(arr.tobytes())
+	else:
+		raise ValueError(f'Cannot write {tid} from python value')
+
+def write_python(b: PacketBuffer, value: Any, schema: Schema = None, name: str = '') -> None:
+	"""
+	Encode plain python objects as one complete tag, without creating NBT instances.
+	`schema` chooses the tag type where the python type is ambiguous,
+	e.g. {'Count': NBTID.Byte, 'Pos': [NBTID.Float]}
+	"""
+	tid = _resolve(value, schema)
+	data = encode_mutf8(name)
+	b.write(bytes((tid.value,)) + _USHORT.pack(len(data)) + data)
+	_write_value(b.write, value, tid, schema)
+
+def from_python(value: Any, schema: Schema = None, name: str | None = None) -> NBT:
+	"""
+	Build a NBT tree from plain python objects, see write_python for the schema
+	"""
+	tid = _resolve(value, schema)
+	cls: Any = NBT._nbt_cls[tid]
+	if tid == NBTID.Compound:
+		children = []
+		for key, val in value.items():
+			sub = schema.get(key, None) if isinstance(schema, dict) else None
+			children.append(from_python(val, sub, key))
+		return cls(children, name)
+	if tid == NBTID.List:
+		element, sub = _element_schema(value, schema)
+		return cls(element, [from_python(v, element if sub is None else sub) for v in value], name)
+	if tid == NBTID.Byte and isinstance(value, bool):
+		value = int(value)
+	elif (tid == NBTID.Double or tid == NBTID.Float) and isinstance(value, int):
+		value = float(value)
+	return cls(value, name)
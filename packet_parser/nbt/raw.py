@@ -0,0 +1,105 @@
+
+import struct
+from typing import final, Any, Self, TextIO
+
+from loginproxy import PacketBuffer, PacketReader
+
+from .nbt import NBT, NBTID, _FROZEN
+from .buffer import BytesReader
+
+__all__ = [
+	'RawNBT',
+]
+
+_USHORT = struct.Struct('>H')
+
+@final
+class RawNBT(NBT):
+	"""
+	An undecoded tag which only holds its encoded bytes (type id, name and payload).
+	It is written back as is, and can be decoded with `decode` when needed.
+	RawNBT is always frozen, and compares equal to its decoded tag.
+	"""
+
+	__slots__ = ('_data',)
+
+	def __init__(self, data: bytes):
+		super().__init__(None)
+		if NBT.measure(data) != len(data):
+			raise ValueError('Data must contain exactly one tag')
+		self._parent = _FROZEN
+		self._data = data
+
+	@property
+	def data(self) -> bytes:
+		return self._data
+
+	@property
+	def tag_id(self) -> NBTID:
+		return NBTID(self._data[0])
+
+	@property
+	def ID(self) -> NBTID: # type: ignore[override]
+		return NBTID(self._data[0])
+
+	@property
+	def _TID(self) -> int: # type: ignore[override]
+		return self._data[0]
+
+	def decode(self, *, lazy: bool = False) -> NBT:
+		return NBT.parse(BytesReader(self._data), lazy=lazy)
+
+	def copy(self) -> Self:
+		return self.__class__(self._data)
+
+	def thaw(self) -> NBT:
+		return self.decode()
+
+	def digest(self) -> bytes:
+		return self.decode(lazy=True).digest()
+
+	def to_python(self) -> Any:
+		return self.decode().to_python()
+
+	def to_bytes(self, b: PacketBuffer) -> None:
+		b.write(self._data)
+
+	def encoded_size(self) -> int:
+		return len(self._data)
+
+	def pack_into(self, buf: bytearray, offset: int) -> int:
+		data = self._data
+		buf[offset:offset + len(data)] = data
+		return offset + len(data)
+
+	def encode(self) -> bytes:
+		return self._data
+
+	def _header_size(self) -> int:
+		data = self._data
+		if data[0] == NBTID.End.value:
+			return 1
+		return 3 + _USHORT.unpack_from(data, 1)[0]
+
+	def _payload_size(self) -> int:
+		return len(self._data) - self._header_size()
+
+	def _pack_payload(self, buf: bytearray, offset: int) -> int:
+		payload = self._data[self._header_size():]
+		buf[offset:offset + len(payload)] = payload
+		return offset + len(payload)
+
+	@classmethod
+	def parse_from(cls, r: PacketReader, name: str | None = None) -> Self:
+		assert name is None
+		self = object.__new__(cls)
+		self._name = None
+		self._parent = _FROZEN
+		self._data = NBT.skip(r)
+		return self
+
+	def __len__(self) -> int:
+		return len(self._data)
+
+	def _write_str(self, out: TextIO, indent: int) -> None:
+		out.write('  ' * indent + 'TAG_Raw({0}): {1} bytes'.format(self.tag_id.name, len(self._data)))
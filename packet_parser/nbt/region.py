@@ -0,0 +1,143 @@
+
+import mmap
+import os
+import struct
+from typing import final, Iterator
+
+from .nbt import NBT
+from .buffer import BytesReader
+from .nbtfile import Compression, decompress
+
+__all__ = [
+	'RegionFile',
+]
+
+_SECTOR = 4096
+_LOCATION = struct.Struct('>I')
+_CHUNK_HEAD = struct.Struct('>iB')
+# set in the compression byte when the chunk is stored in a separate c.<x>.<z>.mcc file
+_EXTERNAL = 0x80
+
+@final
+class RegionFile:
+	"""
+	A read-only Anvil region (.mca) file, which is memory-mapped so only the sectors
+	of the chunks that are read are paged in.
+	Chunk coordinates may be given as absolute chunk coordinates, only the lowest 5 bits are used.
+	"""
+
+	__slots__ = ('path', '_fd', '_map')
+
+	def __init__(self, path: str | os.PathLike[str]):
+		self.path = os.fspath(path)
+		self._fd = open(self.path, 'rb')
+		try:
+			size = os.fstat(self._fd.fileno()).st_size
+			# a new region file may be empty, it contains no chunk
+			self._map: mmap.mmap | None = None
+			if size > 0:
+				self._map = mmap.mmap(self._fd.fileno(), 0, access=mmap.ACCESS_READ)
+			if 0 < size < 2 * _SECTOR:
+				raise ValueError(f'Region file {self.path} is truncated: {size} bytes')
+		except BaseException:
+			self.close()
+			raise
+
+	def close(self) -> None:
+		if self._map is not None:
+			self._map.close()
+			self._map = None
+		self._fd.close()
+
+	def __enter__(self) -> 'RegionFile':
+		return self
+
+	def __exit__(self, *exc) -> None:
+		self.close()
+
+	@staticmethod
+	def _index(x: int, z: int) -> int:
+		return (x & 31) + (z & 31) * 32
+
+	def location(self, x: int, z: int) -> tuple[int, int]:
+		"""
+		Return the (sector offset, sector count) of a chunk, (0, 0) if the chunk is not present
+		"""
+		if self._map is None:
+			return 0, 0
+		loc = _LOCATION.unpack_from(self._map, self._index(x, z) * 4)[0]
+		return loc >> 8, loc & 0xff
+
+	def timestamp(self, x: int, z: int) -> int:
+		"""
+		Return the last modification time of a chunk in epoch seconds
+		"""
+		if self._map is None:
+			return 0
+		return _LOCATION.unpack_from(self._map, _SECTOR + self._index(x, z) * 4)[0]
+
+	def has_chunk(self, x: int, z: int) -> bool:
+		return self.location(x, z)[0] != 0
+
+	def __iter__(self) -> Iterator[tuple[int, int]]:
+		"""
+		Iterate the local (x, z) coordinates of the present chunks
+		"""
+		for i in range(1024):
+			if self.location(i & 31, i >> 5)[0] != 0:
+				yield i & 31, i >> 5
+
+	def read_sector(self, offset: int) -> bytes:
+		"""
+		Return the decompressed NBT bytes of the chunk stored at a sector offset
+		"""
+		mm = self._map
+		if mm is None or offset < 2:
+			raise ValueError(f'Invalid chunk sector offset {offset}')
+		start = offset * _SECTOR
+		if start + _CHUNK_HEAD.size > len(mm):
+			raise ValueError(f'Chunk sector offset {offset} is out of the region file')
+		length, scheme = _CHUNK_HEAD.unpack_from(mm, start)
+		if scheme & _EXTERNAL:
+			raise ValueError(f'Chunk at sector {offset} is stored externally, use read_chunk_bytes instead')
+		end = start + 4 + length
+		if length < 1 or end > len(mm):
+			raise ValueError(f'Invalid chunk length {length} at sector {offset}')
+		return decompress(mm[start + 5:end], Compression(scheme))
+
+	def read_chunk_bytes(self, x: int, z: int) -> bytes | None:
+		"""
+		Return the decompressed NBT bytes of a chunk, or None if the chunk is not present
+		"""
+		offset, _ = self.location(x, z)
+		if offset == 0:
+			return None
+		assert self._map is not None
+		scheme = self._map[offset * _SECTOR + 4]
+		if scheme & _EXTERNAL:
+			# the chunk file is named with the absolute chunk coordinates, which are unknown here
+			# when local coordinates were given, so they are derived from the region file name
+			rx, rz = self._region_pos()
+			name = f'c.{rx * 32 + (x & 31)}.{rz * 32 + (z & 31)}.mcc'
+			with open(os.path.join(os.path.dirname(self.path), name), 'rb') as fd:
+				return decompress(fd.read(), Compression(scheme & ~_EXTERNAL))
+		return self.read_sector(offset)
+
+	def read_chunk(self, x: int, z: int, *, lazy: bool = True, frozen: bool = False) -> NBT | None:
+		"""
+		Decode the NBT of a chunk, or return None if the chunk is not present.
+		The chunk is parsed lazily by default, so only the accessed sections are decoded.
+		"""
+		data = self.read_chunk_bytes(x, z)
+		if data is None:
+			return None
+		return NBT.parse(BytesReader(data), lazy=lazy, frozen=frozen) # type: ignore[arg-type]
+
+	def _region_pos(self) -> tuple[int, int]:
+		parts = os.path.basename(self.path).split('.')
+		if len(parts) != 4 or parts[0] != 'r':
+			raise ValueError(f'Cannot find the region position from the file name {repr(self.path)}')
+		return int(parts[1]), int(parts[2])
+
+	def __repr__(self) -> str:
+		return f'<RegionFile {repr(self.path)}>'
@@ -0,0 +1,182 @@
+
+import struct
+from typing import Callable
+
+__all__ = [
+	'skip_payload',
+	'tag_end',
+	'exact_reader',
+	'read_raw',
+]
+
+_USHORT = struct.Struct('>H')
+_INT = struct.Struct('>i')
+_LIST_HEAD = struct.Struct('>bi')
+
+# payload size of Byte, Short, Int, Long, Float and Double, indexed by tag id
+_FIXED_SIZE = (0, 1, 2, 4, 8, 4, 8)
+# element size of ByteArray, IntArray and LongArray, indexed by tag id
+_ARRAY_ITEM = {0x07: 1, 0x0b: 4, 0x0c: 8}
+
+# the element id of a compound frame, lists of compounds use 0x0a
+_COMPOUND = -1
+
+def _check_count(count: int) -> None:
+	if count < 0:
+		raise ValueError(f'Length must not be negative, but got {count}')
+
+def skip_payload(buf: bytes | bytearray | memoryview, offset: int, tid: int) -> int:
+	"""
+	Walk the payload of a tag with id `tid` that starts at `offset`, without building any tag.
+	Return the offset right after the payload, or raise ValueError if the data is malformed.
+	"""
+	# Each frame is [element id, remaining] for a list, or [_COMPOUND, 0] for a compound
+	stack: list[list[int]] = []
+	try:
+		while True:
+			if 0x01 <= tid <= 0x06:
+				offset += _FIXED_SIZE[tid]
+			elif tid == 0x08:
+				offset += 2 + _USHORT.unpack_from(buf, offset)[0]
+			elif tid in _ARRAY_ITEM:
+				count = _INT.unpack_from(buf, offset)[0]
+				_check_count(count)
+				offset += 4 + count * _ARRAY_ITEM[tid]
+			elif tid == 0x09:
+				element, count = _LIST_HEAD.unpack_from(buf, offset)
+				offset += 5
+				_check_count(count)
+				if count > 0:
+					if 0x01 <= element <= 0x06:
+						offset += count * _FIXED_SIZE[element]
+					elif 0x07 <= element <= 0x0c:
+						stack.append([element, count])
+					else:
+						raise ValueError(f'Unexpected list element type {element}')
+			elif tid == 0x0a:
+				stack.append([_COMPOUND, 0])
+			elif tid != 0x00:
+				raise ValueError(f'Unknown tag id {tid}')
+
+			while stack:
+				frame = stack[-1]
+				if frame[0] == _COMPOUND:
+					tid = buf[offset]
+					offset += 1
+					if tid == 0x00:
+						stack.pop()
+						continue
+					offset += 2 + _USHORT.unpack_from(buf, offset)[0]
+					break
+				frame[1] -= 1
+				if frame[1] < 0:
+					stack.pop()
+					continue
+				tid = frame[0]
+				break
+			else:
+				break
+	except (IndexError, struct.error):
+		raise ValueError('Truncated NBT data') from None
+	if offset > len(buf):
+		raise ValueError('Truncated NBT data')
+	return offset
+
+def tag_end(buf: bytes | bytearray | memoryview, offset: int = 0) -> int:
+	"""
+	Walk a complete tag (type id, name and payload) that starts at `offset`, without building any tag.
+	Return the offset right after it, or raise ValueError if the data is malformed.
+	"""
+	try:
+		tid = buf[offset]
+		if tid == 0x00:
+			return offset + 1
+		offset += 3 + _USHORT.unpack_from(buf, offset + 1)[0]
+	except (IndexError, struct.error):
+		raise ValueError('Truncated NBT data') from None
+	return skip_payload(buf, offset, tid)
+
+def exact_reader(read: Callable[[int], bytes]) -> Callable[[int], bytes]:
+	"""
+	Wrap a read function so it raises ValueError instead of returning less data than asked
+	"""
+	def read_exact(n: int) -> bytes:
+		data = read(n)
+		if len(data) != n:
+			raise ValueError('Truncated NBT data')
+		return data
+	return read_exact
+
+def read_raw(r) -> bytes:
+	"""
+	Read one complete tag (type id, name and payload) from a PacketReader or a binary file object,
+	and return its raw bytes without building any tag.
+	"""
+	read = exact_reader(r.read)
+	parts: list[bytes] = []
+	head = read(1)
+	parts.append(head)
+	tid = head[0]
+	if tid == 0x00:
+		return head
+	# the name is read together with the beginning of the payload
+	head = read(2)
+	parts.append(head)
+	pre = _USHORT.unpack_from(head)[0]
+
+	stack: list[list[int]] = []
+	while True:
+		if 0x01 <= tid <= 0x06:
+			parts.append(read(pre + _FIXED_SIZE[tid]))
+		elif tid == 0x08:
+			head = read(pre + 2)
+			parts.append(head)
+			parts.append(read(_USHORT.unpack_from(head, pre)[0]))
+		elif tid in _ARRAY_ITEM:
+			head = read(pre + 4)
+			parts.append(head)
+			count = _INT.unpack_from(head, pre)[0]
+			_check_count(count)
+			parts.append(read(count * _ARRAY_ITEM[tid]))
+		elif tid == 0x09:
+			head = read(pre + 5)
+			parts.append(head)
+			element, count = _LIST_HEAD.unpack_from(head, pre)
+			_check_count(count)
+			if count > 0:
+				if 0x01 <= element <= 0x06:
+					parts.append(read(count * _FIXED_SIZE[element]))
+				elif 0x07 <= element <= 0x0c:
+					stack.append([element, count])
+				else:
+					raise ValueError(f'Unexpected list element type {element}')
+		elif tid == 0x0a:
+			if pre:
+				parts.append(read(pre))
+			stack.append([_COMPOUND, 0])
+		else:
+			raise ValueError(f'Unknown tag id {tid}')
+		pre = 0
+
+		while stack:
+			frame = stack[-1]
+			if frame[0] == _COMPOUND:
+				head = read(1)
+				parts.append(head)
+				tid = head[0]
+				if tid == 0x00:
+					stack.pop()
+					continue
+				head = read(2)
+				parts.append(head)
+				pre = _USHORT.unpack_from(head)[0]
+				break
+			frame[1] -= 1
+			if frame[1] < 0:
+				stack.pop()
+				continue
+			tid = frame[0]
+			break
+		else:
+			break
+	return b''.join(parts)
@@ -0,0 +1,350 @@
+
+import io
+import math
+import re
+import struct
+from typing import Callable, TextIO
+
+from .nbt import NBT, NBTID
+from .compound import Compound
+from .lists import List, String, ByteArray, IntArray, LongArray
+from .numbers import Byte, Short, Int, Long, Float, Double
+from .raw import RawNBT
+
+__all__ = [
+	'parse_snbt',
+	'write_snbt',
+	'to_snbt',
+]
+
+# the nesting limit of the vanilla SNBT parser
+_MAX_DEPTH = 512
+
+_F32 = struct.Struct('>f')
+
+_UNQUOTED = re.compile(r'[0-9A-Za-z_\-.+]*')
+_SAFE_KEY = re.compile(r'[0-9A-Za-z_\-.+]+')
+
+# the number formats of the vanilla SNBT parser, tried in this order
+_FLOAT = re.compile(r'([-+]?(?:[0-9]+\.?|[0-9]*\.[0-9]+)(?:e[-+]?[0-9]+)?)f', re.I)
+_BYTE = re.compile(r'([-+]?(?:0|[1-9][0-9]*))b', re.I)
+_LONG = re.compile(r'([-+]?(?:0|[1-9][0-9]*))l', re.I)
+_SHORT = re.compile(r'([-+]?(?:0|[1-9][0-9]*))s', re.I)
+_INT = re.compile(r'[-+]?(?:0|[1-9][0-9]*)')
+_DOUBLE = re.compile(r'([-+]?(?:[0-9]+\.?|[0-9]*\.[0-9]+)(?:e[-+]?[0-9]+)?)d', re.I)
+_DOUBLE_NOSUFFIX = re.compile(r'[-+]?(?:[0-9]+\.|[0-9]*\.[0-9]+)(?:e[-+]?[0-9]+)?', re.I)
+
+_ESCAPES = {
+	'\\': '\\', "'": "'", '"': '"',
+	'b': '\b', 'f': '\f', 'n': '\n', 'r': '\r', 't': '\t',
+}
+
+_ARRAYS = {
+	'B': (ByteArray, NBTID.Byte),
+	'I': (IntArray, NBTID.Int),
+	'L': (LongArray, NBTID.Long),
+}
+
+def _scalar(token: str) -> NBT:
+	"""
+	Convert an unquoted token to a number or a String like the vanilla parser,
+	numbers which are out of range become strings as well
+	"""
+	try:
+		if (m := _FLOAT.fullmatch(token)) is not None:
+			return Float(float(m.group(1)))
+		if (m := _BYTE.fullmatch(token)) is not None:
+			return Byte(int(m.group(1)))
+		if (m := _LONG.fullmatch(token)) is not None:
+			return Long(int(m.group(1)))
+		if (m := _SHORT.fullmatch(token)) is not None:
+			return Short(int(m.group(1)))
+		if _INT.fullmatch(token) is not None:
+			return Int(int(token))
+		if (m := _DOUBLE.fullmatch(token)) is not None:
+			return Double(float(m.group(1)))
+		if _DOUBLE_NOSUFFIX.fullmatch(token) is not None:
+			return Double(float(token))
+	except ValueError:
+		pass
+	if token == 'true':
+		return Byte(1)
+	if token == 'false':
+		return Byte(0)
+	return String(token)
+
+class _Parser:
+	__slots__ = ('text', 'pos')
+
+	def __init__(self, text: str, pos: int = 0):
+		self.text = text
+		self.pos = pos
+
+	def error(self, msg: str) -> ValueError:
+		return ValueError(f'{msg} at {self.pos} in SNBT {repr(self.text[max(self.pos - 16, 0):self.pos + 16])}')
+
+	def peek(self) -> str:
+		text = self.text
+		pos = self.pos
+		while pos < len(text) and text[pos].isspace():
+			pos += 1
+		self.pos = pos
+		return text[pos] if pos < len(text) else ''
+
+	def read_quoted(self) -> str:
+		text = self.text
+		quote = text[self.pos]
+		i = self.pos + 1
+		chars: list[str] = []
+		while i < len(text):
+			c = text[i]
+			if c == quote:
+				self.pos = i + 1
+				return ''.join(chars)
+			if c == '\\':
+				e = text[i + 1:i + 2]
+				if e == 'u' and i + 6 <= len(text):
+					try:
+						chars.append(chr(int(text[i + 2:i + 6], 16)))
+					except ValueError:
+						self.pos = i
+						raise self.error('Invalid unicode escape') from None
+					i += 6
+					continue
+				if e not in _ESCAPES:
+					self.pos = i
+					raise self.error(f'Invalid escape sequence {repr(e)}')
+				chars.append(_ESCAPES[e])
+				i += 2
+				continue
+			chars.append(c)
+			i += 1
+		raise self.error('Unterminated quoted string')
+
+	def read_unquoted(self) -> str:
+		m = _UNQUOTED.match(self.text, self.pos)
+		assert m is not None
+		self.pos = m.end()
+		return m.group()
+
+	def read_key(self) -> str:
+		c = self.peek()
+		if c == '"' or c == "'":
+			key = self.read_quoted()
+		else:
+			key = self.read_unquoted()
+			if not key:
+				raise self.error('Expected key')
+		if self.peek() != ':':
+			raise self.error("Expected ':'")
+		self.pos += 1
+		return key
+
+	def read_scalar(self) -> NBT:
+		c = self.peek()
+		if c == '"' or c == "'":
+			return String(self.read_quoted())
+		token = self.read_unquoted()
+		if not token:
+			raise self.error('Expected value')
+		return _scalar(token)
+
+	def read_array(self, kind: str) -> NBT:
+		cls, element = _ARRAYS[kind]
+		values: list[int] = []
+		if self.peek() == ']':
+			self.pos += 1
+			return cls(values)
+		while True:
+			tag = self.read_scalar()
+			if tag.ID != element:
+				raise self.error(f'Cannot insert {tag.ID.name} into {cls.__name__}')
+			# ByteArray stores the bytes unsigned
+			values.append(tag.value & 0xff if kind == 'B' else tag.value) # type: ignore[attr-defined]
+			c = self.peek()
+			self.pos += 1
+			if c == ']':
+				return cls(values)
+			if c != ',':
+				raise self.error("Expected ',' or ']'")
+
+	def parse(self) -> NBT:
+		# [kind, children, key] for a compound, [kind, elements, None] for a list
+		stack: list[list] = []
+		while True:
+			c = self.peek()
+			if c == '{' or c == '[':
+				self.pos += 1
+				if len(stack) >= _MAX_DEPTH:
+					raise self.error(f'Nesting is deeper than {_MAX_DEPTH}')
+				text = self.text
+				if c == '[' and text[self.pos:self.pos + 1] in _ARRAYS and text[self.pos + 1:self.pos + 2] == ';':
+					kind = text[self.pos]
+					self.pos += 2
+					value = self.read_array(kind)
+				elif self.peek() == ('}' if c == '{' else ']'):
+					self.pos += 1
+					value = Compound([]) if c == '{' else List(NBTID.End, [])
+				else:
+					stack.append([c, {}, self.read_key()] if c == '{' else [c, [], None])
+					continue
+			else:
+				value = self.read_scalar()
+			while True:
+				if not stack:
+					return value
+				frame = stack[-1]
+				items = frame[1]
+				if frame[0] == '{':
+					items[frame[2]] = value
+					close = '}'
+				else:
+					if items and value.ID != items[0].ID:
+						raise self.error(f'Cannot insert {value.ID.name} into a list of {items[0].ID.name}')
+					items.append(value)
+					close = ']'
+				c = self.peek()
+				self.pos += 1
+				if c == ',':
+					if frame[0] == '{':
+						frame[2] = self.read_key()
+					break
+				if c != close:
+					self.pos -= 1
+					raise self.error(f"Expected ',' or {repr(close)}")
+				stack.pop()
+				value = Compound(items) if close == '}' else List(items[0].ID, items)
+
+def _parse_at(text: str, pos: int) -> tuple[NBT, int]:
+	"""
+	Parse one value starting at `pos`, and return it with the offset just after it
+	"""
+	p = _Parser(text, pos)
+	return p.parse(), p.pos
+
+def parse_snbt(text: str, name: str | None = None) -> NBT:
+	"""
+	Parse a SNBT text with the syntax and type rules of the vanilla parser,
+	e.g. `{id:"minecraft:diamond_sword",Count:1b,tag:{Damage:0,Enchantments:[{id:"sharpness",lvl:5s}]}}`
+	"""
+	p = _Parser(text)
+	tag = p.parse()
+	if p.peek() != '':
+		raise p.error('Trailing data')
+	if name is not None:
+		tag.name = name
+	return tag
+
+def _quote(s: str) -> str:
+	quote = "'" if '"' in s and "'" not in s else '"'
+	return quote + s.replace('\\', '\\\\').replace(quote, '\\' + quote) + quote
+
+def _format_float(value: float) -> str:
+	# the shortest representation which reads back to the same float32
+	for digits in range(6, 10):
+		s = '%.*g' % (digits, value)
+		if _F32.unpack(_F32.pack(float(s)))[0] == value:
+			break
+	if '.' not in s and 'e' not in s:
+		s += '.0'
+	return s
+
+_SUFFIX = {
+	NBTID.Byte: 'b',
+	NBTID.Short: 's',
+	NBTID.Int: '',
+	NBTID.Long: 'L',
+}
+
+def _write_flat(write: Callable[[str], object], tag: NBT, tid: NBTID, compact: bool) -> None:
+	"""
+	Write a tag which has no children to write, i.e. anything except a non-empty Compound or List
+	"""
+	if tid in _SUFFIX:
+		write(str(tag.value) + _SUFFIX[tid]) # type: ignore[attr-defined]
+	elif tid == NBTID.Float or tid == NBTID.Double:
+		value = tag.value # type: ignore[attr-defined]
+		if not math.isfinite(value):
+			# SNBT has no literal for them, the vanilla parser reads `Infinityf` or `NaNd` back as a String
+			raise ValueError(f'Cannot format {tid.name} {value} as SNBT')
+		write(_format_float(value) + 'f' if tid == NBTID.Float else repr(value) + 'd')
+	elif tid == NBTID.String:
+		write(_quote(tag.value)) # type: ignore[attr-defined]
+	elif tid in (NBTID.ByteArray, NBTID.IntArray, NBTID.LongArray):
+		kind = tid.name[0]
+		suffix = _SUFFIX[NBTID.Byte if kind == 'B' else NBTID.Int if kind == 'I' else NBTID.Long]
+		sep = ',' if compact else ', '
+		values = tag._decoded() if kind != 'B' else [v - 256 if v > 127 else v for v in tag._value] # type: ignore[attr-defined]
+		write(f'[{kind};' + ('' if compact or not values else ' ') + sep.join(f'{v}{suffix}' for v in values) + ']')
+	elif tid == NBTID.Compound:
+		write('{}')
+	elif tid == NBTID.List:
+		write('[]')
+	else:
+		raise ValueError(f'Cannot format {tid} as SNBT')
+
+def _write(write: Callable[[str], object], tag: NBT, compact: bool) -> None:
+	"""
+	Write a tag with an explicit stack, so deep nesting cannot overflow the python stack
+	"""
+	# [compound or None for a list, children, separator, closing text, first] for each open container
+	stack: list[list] = []
+	while True:
+		if isinstance(tag, RawNBT):
+			tag = tag.decode(lazy=True)
+		tid = tag.ID
+		if (tid == NBTID.Compound or tid == NBTID.List) and len(tag) > 0: # type: ignore[arg-type]
+			is_compound = tid == NBTID.Compound
+			inline = compact or (not is_compound and tag.element.value <= NBTID.String.value) # type: ignore[attr-defined]
+			write('{' if is_compound else '[')
+			level = len(stack) + 1
+			sep = ',' if inline else ',\n'
+			close = '}' if is_compound else ']'
+			if not compact:
+				if inline:
+					sep = ', '
+				else:
+					write('\n' + '  ' * level)
+					sep += '  ' * level
+			if not inline:
+				close = '\n' + '  ' * (level - 1) + close
+			children = tag._children if is_compound else tag._elements() # type: ignore[attr-defined]
+			stack.append([tag if is_compound else None, iter(children), sep, close, True])
+		else:
+			_write_flat(write, tag, tid, compact)
+		while stack:
+			frame = stack[-1]
+			compound = frame[0]
+			for key in frame[1]:
+				if frame[4]:
+					frame[4] = False
+				else:
+					write(frame[2])
+				if compound is not None:
+					write(key if _SAFE_KEY.fullmatch(key) else _quote(key))
+					write(':' if compact else ': ')
+					tag = compound._peek(key)
+				else:
+					tag = key
+				break
+			else:
+				write(frame[3])
+				stack.pop()
+				continue
+			break
+		else:
+			return
+
+def write_snbt(out: TextIO, tag: NBT, *, compact: bool = False) -> None:
+	"""
+	Write the tag as SNBT in one pass, the name of the tag itself is not written.
+	`compact` writes everything on one line without spaces like the vanilla formatter,
+	otherwise compounds and lists of containers are indented with two spaces.
+	Infinite and NaN Float or Double values raise ValueError, since they cannot be read back as numbers.
+	"""
+	_write(out.write, tag, compact)
+
+def to_snbt(tag: NBT, *, compact: bool = False) -> str:
+	out = io.StringIO()
+	write_snbt(out, tag, compact=compact)
+	return out.getvalue()
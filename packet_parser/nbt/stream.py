@@ -0,0 +1,87 @@
+
+import enum
+import struct
+from typing import Any, Iterator, NamedTuple
+
+from loginproxy import PacketReader
+
+from .nbt import NBTID, name_cache
+from .plain import read_scalar
+from .scan import exact_reader
+
+__all__ = [
+	'EventKind',
+	'NBTEvent',
+	'iter_events',
+]
+
+_USHORT = struct.Struct('>H')
+_LIST_HEAD = struct.Struct('>bi')
+
+class EventKind(enum.Enum):
+	START = 0 # a List or Compound begins
+	END   = 1 # a List or Compound ends
+	VALUE = 2 # any other tag, the value is decoded as in NBT.parse_python
+
+class NBTEvent(NamedTuple):
+	kind: EventKind
+	# keys and list indexes from the root tag, the root itself has an empty path
+	path: tuple[str | int, ...]
+	id: NBTID
+	# for VALUE the decoded value, for the START of a List a tuple of (element id, length),
+	# otherwise None
+	value: Any
+
+def iter_events(r: PacketReader) -> Iterator[NBTEvent]:
+	"""
+	Read one complete tag from a PacketReader or a binary file object and yield it as a stream of events.
+	Only the current path is kept in memory, so the consumer can filter huge payloads and
+	stop early; the reader is then left in the middle of the tag.
+	"""
+	read = exact_reader(r.read)
+	tid = read(1)[0]
+	if tid == 0x00:
+		return
+	read(_USHORT.unpack(read(2))[0])
+
+	path: list[str | int] = []
+	# [-1, has_key] for a compound, [element id, has_key, next index, length] for a list
+	stack: list[list[int]] = []
+	while True:
+		if tid == 0x0a:
+			yield NBTEvent(EventKind.START, tuple(path), NBTID.Compound, None)
+			stack.append([-1, 0])
+		elif tid == 0x09:
+			element, count = _LIST_HEAD.unpack(read(5))
+			if count < 0:
+				raise ValueError(f'List length must not be negative, but got {count}')
+			yield NBTEvent(EventKind.START, tuple(path), NBTID.List, (NBTID(element), count))
+			stack.append([element, 0, 0, count])
+		else:
+			yield NBTEvent(EventKind.VALUE, tuple(path), NBTID(tid), read_scalar(read, tid))
+
+		while stack:
+			frame = stack[-1]
+			if frame[1]:
+				path.pop()
+				frame[1] = 0
+			if frame[0] == -1:
+				tid = read(1)[0]
+				if tid == 0x00:
+					stack.pop()
+					yield NBTEvent(EventKind.END, tuple(path), NBTID.Compound, None)
+					continue
+				path.append(name_cache.decode(read(_USHORT.unpack(read(2))[0])))
+			else:
+				index = frame[2]
+				if index >= frame[3]:
+					stack.pop()
+					yield NBTEvent(EventKind.END, tuple(path), NBTID.List, None)
+					continue
+				path.append(index)
+				frame[2] = index + 1
+				tid = frame[0]
+			frame[1] = 1
+			break
+		else:
+			return
@@ -0,0 +1,481 @@
+
+import struct
+from typing import final, Any, Callable, ClassVar, Iterable
+
+from .nbt import NBT, NBTID, name_cache
+from .mutf8 import *
+from .raw import RawNBT
+
+__all__ = [
+	'Spec',
+	'Validator',
+]
+
+_USHORT = struct.Struct('>H')
+_INT = struct.Struct('>i')
+_LIST_HEAD = struct.Struct('>bi')
+
+# payload size of Byte, Short, Int, Long, Float and Double, indexed by tag id
+_FIXED_SIZE = (0, 1, 2, 4, 8, 4, 8)
+_FIXED_STRUCT = tuple(struct.Struct('>' + f) if f else None for f in ('', 'b', 'h', 'i', 'q', 'f', 'd'))
+# element size of ByteArray, IntArray and LongArray
+_ARRAY_ITEM = {0x07: 1, 0x0b: 4, 0x0c: 8}
+
+@final
+class Spec:
+	"""
+	A node of a validation schema, create it with the class methods, e.g.
+
+		Spec.compound({
+			'id': Spec.string(max_bytes=64),
+			'Count': Spec.number(NBTID.Byte, min=1, max=64),
+			'tag': Spec.compound(extra=True),
+		}, required=('id', 'Count'), extra=False)
+
+	A NBTID can be used anywhere a Spec is expected, it accepts any tag of that type.
+	"""
+
+	__slots__ = ('id', 'keys', 'required', 'extra', 'element', 'max_length', 'max_bytes', 'min', 'max')
+
+	ANY: ClassVar['Spec']
+
+	def __init__(self, id: NBTID | None, *,
+		keys: dict[str, 'Spec'] | None = None, required: frozenset[str] = frozenset(),
+		extra: 'Spec | None' = None, element: 'Spec | None' = None,
+		max_length: int | None = None, max_bytes: int | None = None,
+		min: float | None = None, max: float | None = None):
+		self.id = id
+		self.keys = keys
+		self.required = required
+		self.extra = extra
+		self.element = element
+		self.max_length = max_length
+		self.max_bytes = max_bytes
+		self.min = min
+		self.max = max
+
+	@staticmethod
+	def of(spec: 'Spec | NBTID') -> 'Spec':
+		if isinstance(spec, Spec):
+			return spec
+		# a bare Compound or List accepts any keys or elements
+		if spec == NBTID.Compound:
+			return Spec.compound()
+		if spec == NBTID.List:
+			return Spec.list()
+		return Spec(spec)
+
+	@classmethod
+	def compound(cls, keys: dict[str, 'Spec | NBTID'] | None = None, *,
+		required: Iterable[str] = (), extra: 'Spec | NBTID | bool' = True) -> 'Spec':
+		"""
+		`extra` is the spec of the keys which are not listed, True accepts any value, False rejects them
+		"""
+		required = frozenset(required)
+		keys = {} if keys is None else keys
+		for key in required:
+			if key not in keys:
+				raise ValueError(f'Required key {repr(key)} is not in the keys')
+		return cls(NBTID.Compound,
+			keys={k: cls.of(v) for k, v in keys.items()},
+			required=required,
+			extra=cls.ANY if extra is True else None if extra is False else cls.of(extra)) # type: ignore[arg-type]
+
+	@classmethod
+	def list(cls, element: 'Spec | NBTID | None' = None, *, max_length: int | None = None) -> 'Spec':
+		return cls(NBTID.List, element=cls.ANY if element is None else cls.of(element), max_length=max_length)
+
+	@classmethod
+	def string(cls, *, max_bytes: int | None = None) -> 'Spec':
+		"""
+		`max_bytes` limits the length of the modified UTF-8 encoding
+		"""
+		return cls(NBTID.String, max_bytes=max_bytes)
+
+	@classmethod
+	def number(cls, id: NBTID, *, min: float | None = None, max: float | None = None) -> 'Spec':
+		if not NBTID.Byte.value <= id.value <= NBTID.Double.value:
+			raise ValueError(f'{id} is not a number type')
+		return cls(id, min=min, max=max)
+
+	@classmethod
+	def array(cls, id: NBTID, *, max_length: int | None = None) -> 'Spec':
+		if id.value not in _ARRAY_ITEM:
+			raise ValueError(f'{id} is not an array type')
+		return cls(id, max_length=max_length)
+
+Spec.ANY = Spec(None)
+
+class _Invalid(Exception):
+	def __init__(self, msg: str):
+		super().__init__(msg)
+		self.msg = msg
+		# the keys and indexes from the failed tag up to the root, in reverse order
+		self.path: list[str | int] = []
+
+def _format_path(path: list[str | int]) -> str:
+	s = ''
+	for key in reversed(path):
+		if isinstance(key, int):
+			s += f'[{key}]'
+		else:
+			s += ('.' if s else '') + key
+	return s or '<root>'
+
+# the most modified UTF-8 bytes of one code point, a supplementary character is encoded as two 3 bytes surrogates
+_MAX_CHAR_BYTES = 6
+
+def _string_size(value: str) -> int:
+	if value.isascii() and '\0' not in value:
+		return len(value)
+	return len(encode_mutf8(value))
+
+_TreeCheck = Callable[[NBT, int], None]
+# (buffer, payload offset, tag id, depth) -> payload end
+_RawCheck = Callable[[memoryview, int, int, int], int]
+
+class _Compiler:
+	"""
+	Compile a Spec into closures, one for parsed trees and one for encoded bytes.
+	The generic limits apply wherever the spec does not give its own.
+	"""
+
+	def __init__(self, max_depth: int, max_list_length: int | None, max_string_bytes: int | None):
+		self.max_depth = max_depth
+		self.max_list_length = max_list_length
+		self.max_string_bytes = max_string_bytes
+		self.cache: dict[int, tuple[_TreeCheck, _RawCheck]] = {}
+
+	def compile(self, spec: Spec) -> tuple[_TreeCheck, _RawCheck]:
+		checks = self.cache.get(id(spec), None)
+		if checks is None:
+			checks = self.cache[id(spec)] = self._compile(spec)
+		return checks
+
+	def _compile(self, spec: Spec) -> tuple[_TreeCheck, _RawCheck]:
+		if spec.id is None:
+			return self._any()
+		tid = spec.id
+		t = tid.value
+		max_depth = self.max_depth
+
+		def check_type(tag: NBT) -> None:
+			if tag.ID != tid:
+				raise _Invalid(f'Expected {tid.name}, but got {tag.ID.name}')
+
+		def check_raw_type(got: int) -> None:
+			if got != t:
+				raise _Invalid(f'Expected {tid.name}, but got {NBTID(got).name if -1 <= got <= 12 else got}')
+
+		if 0x01 <= t <= 0x06:
+			lo, hi = spec.min, spec.max
+			size = _FIXED_SIZE[t]
+			st = _FIXED_STRUCT[t]
+			assert st is not None
+			def check_range(value: float) -> None:
+				if (lo is not None and value < lo) or (hi is not None and value > hi):
+					raise _Invalid(f'Value {value} out of range [{lo}, {hi}]')
+			def tree_number(tag: NBT, depth: int) -> None:
+				check_type(tag)
+				check_range(tag.value) # type: ignore[attr-defined]
+			def raw_number(buf: memoryview, offset: int, got: int, depth: int) -> int:
+				check_raw_type(got)
+				if lo is not None or hi is not None:
+					check_range(st.unpack_from(buf, offset)[0])
+				return offset + size
+			return tree_number, raw_number
+
+		if t == 0x08:
+			max_bytes = self.max_string_bytes if spec.max_bytes is None else spec.max_bytes
+			def tree_string(tag: NBT, depth: int) -> None:
+				check_type(tag)
+				if max_bytes is not None:
+					value = tag.value # type: ignore[attr-defined]
+					if len(value) * _MAX_CHAR_BYTES > max_bytes and _string_size(value) > max_bytes:
+						raise _Invalid(f'String is longer than {max_bytes} bytes')
+			def raw_string(buf: memoryview, offset: int, got: int, depth: int) -> int:
+				check_raw_type(got)
+				n = _USHORT.unpack_from(buf, offset)[0]
+				if max_bytes is not None and n > max_bytes:
+					raise _Invalid(f'String is longer than {max_bytes} bytes')
+				return offset + 2 + n
+			return tree_string, raw_string
+
+		if t in _ARRAY_ITEM:
+			max_length = self.max_list_length if spec.max_length is None else spec.max_length
+			item = _ARRAY_ITEM[t]
+			def tree_array(tag: NBT, depth: int) -> None:
+				check_type(tag)
+				if max_length is not None and len(tag) > max_length: # type: ignore[arg-type]
+					raise _Invalid(f'Array is longer than {max_length}')
+			def raw_array(buf: memoryview, offset: int, got: int, depth: int) -> int:
+				check_raw_type(got)
+				count = _INT.unpack_from(buf, offset)[0]
+				if count < 0:
+					raise _Invalid(f'Array length must not be negative, but got {count}')
+				if max_length is not None and count > max_length:
+					raise _Invalid(f'Array is longer than {max_length}')
+				return offset + 4 + count * item
+			return tree_array, raw_array
+
+		if t == 0x09:
+			max_length = self.max_list_length if spec.max_length is None else spec.max_length
+			assert spec.element is not None
+			element = spec.element
+			tree_element, raw_element = self.compile(element)
+			# elements of a fixed size without a range can be skipped at once
+			fixed = element.id is not None and 0x01 <= element.id.value <= 0x06 and element.min is None and element.max is None
+			def tree_list(tag: NBT, depth: int) -> None:
+				check_type(tag)
+				depth += 1
+				if depth > max_depth:
+					raise _Invalid(f'Nesting is deeper than {max_depth}')
+				length = len(tag) # type: ignore[arg-type]
+				if max_length is not None and length > max_length:
+					raise _Invalid(f'List is longer than {max_length}')
+				if length and element.id is not None and tag.element != element.id: # type: ignore[attr-defined]
+					raise _Invalid(f'Expected a list of {element.id.name}, but got {tag.element.name}') # type: ignore[attr-defined]
+				if fixed:
+					return
+				for i, c in enumerate(tag._elements()): # type: ignore[attr-defined]
+					try:
+						tree_element(c, depth)
+					except _Invalid as e:
+						e.path.append(i)
+						raise
+			def raw_list(buf: memoryview, offset: int, got: int, depth: int) -> int:
+				check_raw_type(got)
+				depth += 1
+				if depth > max_depth:
+					raise _Invalid(f'Nesting is deeper than {max_depth}')
+				e, count = _LIST_HEAD.unpack_from(buf, offset)
+				offset += 5
+				if count < 0:
+					raise _Invalid(f'List length must not be negative, but got {count}')
+				if max_length is not None and count > max_length:
+					raise _Invalid(f'List is longer than {max_length}')
+				if count == 0:
+					return offset
+				if fixed:
+					if e != element.id.value: # type: ignore[union-attr]
+						raise _Invalid(f'Expected a list of {element.id.name}, but got {e}') # type: ignore[union-attr]
+					return offset + count * _FIXED_SIZE[e]
+				for i in range(count):
+					try:
+						offset = raw_element(buf, offset, e, depth)
+					except _Invalid as err:
+						err.path.append(i)
+						raise
+				return offset
+			return tree_list, raw_list
+
+		if t == 0x0a:
+			assert spec.keys is not None
+			keys = {k: self.compile(v) for k, v in spec.keys.items()}
+			raw_keys = {encode_mutf8(k): c[1] for k, c in keys.items()}
+			required = spec.required
+			raw_required = frozenset(encode_mutf8(k) for k in required)
+			tree_extra, raw_extra = self.compile(spec.extra) if spec.extra is not None else (None, None)
+			def tree_compound(tag: NBT, depth: int) -> None:
+				check_type(tag)
+				depth += 1
+				if depth > max_depth:
+					raise _Invalid(f'Nesting is deeper than {max_depth}')
+				for key in required:
+					if key not in tag: # type: ignore[operator]
+						raise _Invalid(f'Missing required key {repr(key)}')
+				for key in tag: # type: ignore[attr-defined]
+					checks = keys.get(key, None)
+					if checks is None and tree_extra is None:
+						raise _Invalid(f'Unexpected key {repr(key)}')
+					try:
+						raw = tag._raw_child(key) # type: ignore[attr-defined]
+						if raw is not None:
+							# a child which is not decoded yet is checked on its bytes
+							raw_check = raw_extra if checks is None else checks[1]
+							raw_check(raw, 3 + _USHORT.unpack_from(raw, 1)[0], raw[0], depth) # type: ignore[misc]
+						else:
+							(tree_extra if checks is None else checks[0])(tag._peek(key), depth) # type: ignore[misc, attr-defined]
+					except _Invalid as e:
+						e.path.append(key)
+						raise
+			def raw_compound(buf: memoryview, offset: int, got: int, depth: int) -> int:
+				check_raw_type(got)
+				depth += 1
+				if depth > max_depth:
+					raise _Invalid(f'Nesting is deeper than {max_depth}')
+				seen: set[bytes] | None = set() if raw_required else None
+				while True:
+					tid = buf[offset]
+					if tid == 0x00:
+						break
+					n = _USHORT.unpack_from(buf, offset + 1)[0]
+					key = buf[offset + 3:offset + 3 + n].tobytes()
+					offset += 3 + n
+					check = raw_keys.get(key, raw_extra)
+					if check is None:
+						raise _Invalid(f'Unexpected key {repr(decode_mutf8(key))}')
+					try:
+						offset = check(buf, offset, tid, depth)
+					except _Invalid as e:
+						e.path.append(name_cache.decode(key))
+						raise
+					if seen is not None and key in raw_required:
+						seen.add(key)
+				if seen is not None and len(seen) != len(raw_required):
+					missing = sorted(decode_mutf8(k) for k in raw_required - seen)
+					raise _Invalid(f'Missing required key {repr(missing[0])}')
+				return offset + 1
+			return tree_compound, raw_compound
+
+		raise ValueError(f'Cannot validate {tid}')
+
+	def _any(self) -> tuple[_TreeCheck, _RawCheck]:
+		"""
+		The checks of Spec.ANY, which accept any tag within the generic limits
+		"""
+		max_depth = self.max_depth
+		max_length = self.max_list_length
+		max_bytes = self.max_string_bytes
+
+		def tree_any(tag: NBT, depth: int) -> None:
+			t = tag.ID.value
+			if t == 0x08:
+				if max_bytes is not None:
+					value = tag.value # type: ignore[attr-defined]
+					if len(value) * _MAX_CHAR_BYTES > max_bytes and _string_size(value) > max_bytes:
+						raise _Invalid(f'String is longer than {max_bytes} bytes')
+			elif t in _ARRAY_ITEM:
+				if max_length is not None and len(tag) > max_length: # type: ignore[arg-type]
+					raise _Invalid(f'Array is longer than {max_length}')
+			elif t == 0x09 or t == 0x0a:
+				depth += 1
+				if depth > max_depth:
+					raise _Invalid(f'Nesting is deeper than {max_depth}')
+				if t == 0x09:
+					if max_length is not None and len(tag) > max_length: # type: ignore[arg-type]
+						raise _Invalid(f'List is longer than {max_length}')
+					if tag.element.value <= 0x06: # type: ignore[attr-defined]
+						return
+					items: Iterable[tuple[Any, NBT]] = enumerate(tag._elements()) # type: ignore[attr-defined]
+				else:
+					items = ((k, tag._peek(k)) for k in tag) # type: ignore[attr-defined]
+				for key, child in items:
+					try:
+						tree_any(child, depth)
+					except _Invalid as e:
+						e.path.append(key)
+						raise
+
+		def raw_any(buf: memoryview, offset: int, t: int, depth: int) -> int:
+			if 0x01 <= t <= 0x06:
+				return offset + _FIXED_SIZE[t]
+			if t == 0x08:
+				n = _USHORT.unpack_from(buf, offset)[0]
+				if max_bytes is not None and n > max_bytes:
+					raise _Invalid(f'String is longer than {max_bytes} bytes')
+				return offset + 2 + n
+			if t in _ARRAY_ITEM:
+				count = _INT.unpack_from(buf, offset)[0]
+				if count < 0:
+					raise _Invalid(f'Array length must not be negative, but got {count}')
+				if max_length is not None and count > max_length:
+					raise _Invalid(f'Array is longer than {max_length}')
+				return offset + 4 + count * _ARRAY_ITEM[t]
+			if t != 0x09 and t != 0x0a:
+				raise _Invalid(f'Unknown tag id {t}')
+			depth += 1
+			if depth > max_depth:
+				raise _Invalid(f'Nesting is deeper than {max_depth}')
+			if t == 0x09:
+				e, count = _LIST_HEAD.unpack_from(buf, offset)
+				offset += 5
+				if count < 0:
+					raise _Invalid(f'List length must not be negative, but got {count}')
+				if max_length is not None and count > max_length:
+					raise _Invalid(f'List is longer than {max_length}')
+				if count == 0:
+					return offset
+				if 0x01 <= e <= 0x06:
+					return offset + count * _FIXED_SIZE[e]
+				for i in range(count):
+					try:
+						offset = raw_any(buf, offset, e, depth)
+					except _Invalid as err:
+						err.path.append(i)
+						raise
+				return offset
+			while True:
+				tid = buf[offset]
+				if tid == 0x00:
+					return offset + 1
+				n = _USHORT.unpack_from(buf, offset + 1)[0]
+				start = offset + 3
+				offset = start + n
+				try:
+					offset = raw_any(buf, offset, tid, depth)
+				except _Invalid as err:
+					err.path.append(name_cache.decode(buf[start:start + n].tobytes()))
+					raise
+
+		return tree_any, raw_any
+
+@final
+class Validator:
+	"""
+	A Spec compiled into checker functions, which raise ValueError with the path of the first invalid tag.
+
+	`max_depth` limits the nesting of lists and compounds, up to 512 like the game.
+	`max_list_length` and `max_string_bytes` apply wherever the spec does not give its own limit.
+	`max_bytes` limits the encoded size of the whole tag, it is only checked by validate_bytes.
+	"""
+
+	__slots__ = ('max_bytes', '_tree', '_raw')
+
+	def __init__(self, spec: Spec | NBTID, *, max_depth: int = 512,
+		max_list_length: int | None = None, max_string_bytes: int | None = None, max_bytes: int | None = None):
+		if not 0 <= max_depth <= 512:
+			raise ValueError(f'max_depth must be in [0, 512], but got {max_depth}')
+		self.max_bytes = max_bytes
+		self._tree, self._raw = _Compiler(max_depth, max_list_length, max_string_bytes).compile(Spec.of(spec))
+
+	def validate(self, tag: NBT) -> None:
+		if isinstance(tag, RawNBT):
+			self.validate_bytes(tag.data)
+			return
+		try:
+			self._tree(tag, 0)
+		except _Invalid as e:
+			raise ValueError(f'Invalid NBT at {_format_path(e.path)}: {e.msg}') from None
+
+	def validate_bytes(self, data: bytes | bytearray | memoryview, offset: int = 0) -> int:
+		"""
+		Check a complete encoded tag starting at `offset` without building any tag, return the offset after it.
+		A payload larger than `max_bytes` is rejected as soon as the scan reaches the limit.
+		"""
+		buf = data if isinstance(data, memoryview) else memoryview(data)
+		cut = self.max_bytes is not None and len(buf) - offset > self.max_bytes
+		if cut:
+			# reading past the limit then fails like truncated data
+			buf = buf[:offset + self.max_bytes] # type: ignore[operator]
+		try:
+			tid = buf[offset]
+			if tid == 0x00:
+				return offset + 1
+			end = self._raw(buf, offset + 3 + _USHORT.unpack_from(buf, offset + 1)[0], tid, 0)
+			if end > len(buf):
+				raise IndexError()
+		except (IndexError, struct.error):
+			if cut:
+				raise ValueError(f'NBT data is larger than {self.max_bytes} bytes') from None
+			raise ValueError('Truncated NBT data') from None
+		except _Invalid as e:
+			raise ValueError(f'Invalid NBT at {_format_path(e.path)}: {e.msg}') from None
+		return end
+
+	def is_valid(self, tag: NBT) -> bool:
+		try:
+			self.validate(tag)
+		except ValueError:
+			return False
+		return True
@@ -0,0 +1,266 @@
+
+import abc
+import os
+import sys
+from typing import final, Any, Callable, ClassVar, Iterable, Iterator, Self
+
+from loginproxy import PacketBuffer, PacketReader, ConnStatus
+
+from .fields import FieldType, Layout, LazyFields
+from .specialize import specialize, compile_peek
+
+__all__ = [
+	'Packet',
+	'PacketIdMap',
+	'PacketStatusMap',
+	'PacketRepo',
+]
+
+class Packet(abc.ABC):
+	"""
+	The base of packets and their structs.
+
+	A class which declares its wire layout in `FIELDS`, a tuple of (attribute name, FieldType) in wire order
+	which matches its constructor arguments, is decoded and encoded by the shared Layout engine.
+	Other classes implement to_bytes and parse_from themselves,
+	they may declare the leading fields of their layout in `HEAD_FIELDS` so the fields can be peeked.
+	Subclasses declare their fields in `__slots__`.
+	"""
+
+	__slots__ = ()
+
+	FIELDS: ClassVar[tuple[tuple[str, FieldType], ...] | None] = None
+	HEAD_FIELDS: ClassVar[tuple[tuple[str, FieldType], ...] | None] = None
+	_LAYOUT: ClassVar[Layout | None] = None
+	_HEAD: ClassVar[Layout | None] = None
+	# the compiled peek functions by field names
+	_peeks: ClassVar[dict[tuple[str, ...], Callable[..., tuple]]] = {}
+
+	_repos: ClassVar[dict[int, 'PacketRepo']] = {}
+
+	def __init_subclass__(cls, **kwargs) -> None:
+		super().__init_subclass__(**kwargs)
+		fields = cls.__dict__.get('FIELDS')
+		if fields is not None:
+			cls._LAYOUT = cls._HEAD = Layout(fields)
+		else:
+			head = cls.__dict__.get('HEAD_FIELDS')
+			if head is not None:
+				cls._HEAD = Layout(head)
+		cls._peeks = {}
+
+	@classmethod
+	def _layout(cls) -> Layout:
+		layout = cls._LAYOUT
+		if layout is None:
+			raise NotImplementedError(f'{cls.__name__} does not declare FIELDS')
+		return layout
+
+	def to_bytes(self, b: PacketBuffer) -> None:
+		layout = self._layout()
+		layout.write(b, layout.values_of(self))
+
+	@classmethod
+	def parse_from(cls, r: PacketReader) -> Self:
+		return cls(*cls._layout().read(r))
+
+	@classmethod
+	def unpack_from(cls, buf: bytes | bytearray | memoryview, offset: int = 0) -> tuple[Self, int]:
+		"""
+		Decode a packet from a buffer at `offset`, return the packet and the offset after it
+		"""
+		values, offset = cls._layout().unpack_from(buf, offset)
+		return cls(*values), offset
+
+	@classmethod
+	def peek(cls, field_names: Iterable[str], buf: bytes | bytearray | memoryview, offset: int = 0) -> tuple:
+		"""
+		Decode only the named fields of an encoded payload and return them as a tuple in the given order.
+		Decoding stops after the last of them, so it is cheap for fields near the start of the packet.
+		"""
+		names = field_names if isinstance(field_names, tuple) else tuple(field_names)
+		peek = cls._peeks.get(names, None)
+		if peek is None:
+			head = cls._HEAD
+			if head is None:
+				raise NotImplementedError(f'{cls.__name__} declares neither FIELDS nor HEAD_FIELDS')
+			peek = cls._peeks[names] = compile_peek(head, names)
+		return peek(buf, offset)
+
+	@classmethod
+	def parse_lazy(cls, buf: bytes | bytearray | memoryview) -> Self:
+		"""
+		Wrap the payload of a packet without decoding it, each field is decoded when it is first accessed.
+		While no field is assigned, to_bytes writes the payload back as it is.
+		The buffer is referenced, not copied, so it must not be modified while the packet is in use.
+
+		The packet is an instance of a subclass which keeps the payload, so packets which are built
+		or parsed eagerly pay nothing for the lazy mode.
+		"""
+		layout = cls._layout()
+		lazy_cls = cls.__dict__.get('_lazy_class', None)
+		if lazy_cls is None:
+			lazy_cls = type(cls.__name__, (_LazyPacket, cls), {
+				'__slots__': ('_lazy', '_dirty'),
+				'__module__': cls.__module__,
+				'__qualname__': cls.__qualname__,
+				'_packet_class': cls,
+			})
+			cls._lazy_class = lazy_cls # type: ignore[attr-defined]
+		self = lazy_cls.__new__(lazy_cls)
+		object.__setattr__(self, '_lazy', LazyFields(layout, buf))
+		object.__setattr__(self, '_dirty', False)
+		return self
+
+	@staticmethod
+	def register(repo: 'PacketRepo') -> None:
+		"""
+		Register the packets of a protocol version and specialize their decoders and encoders.
+		The generated code is cached in the __pycache__ directory beside the module which defines the packets.
+		"""
+		if repo.protocol in Packet._repos:
+			raise ValueError(f'Protocol {repo.protocol} is already registered')
+		classes = list(repo.classes())
+		cache_dir = None
+		if classes:
+			file = getattr(sys.modules.get(classes[0].__module__, None), '__file__', None)
+			if file is not None:
+				cache_dir = os.path.join(os.path.dirname(file), '__pycache__')
+		specialize(classes, repo.protocol, cache_dir)
+		Packet._repos[repo.protocol] = repo
+
+	@staticmethod
+	def get_repo(protocol: int) -> 'PacketRepo | None':
+		return Packet._repos.get(protocol, None)
+
+	def __repr__(self) -> str:
+		if self.FIELDS is None:
+			return f'<{self.__class__.__name__}>'
+		return '<{} {}>'.format(self.__class__.__name__,
+			' '.join(f'{name}={repr(getattr(self, name))}' for name, _ in self.FIELDS))
+
+class _LazyPacket:
+	"""
+	Mixed into the subclasses created by Packet.parse_lazy
+	"""
+
+	__slots__ = ()
+
+	_packet_class: ClassVar[type[Packet]]
+	_lazy: LazyFields
+	_dirty: bool
+
+	def __getattr__(self, name: str) -> Any:
+		# only called when the slot is not set, i.e. a field which is not decoded yet
+		i = self._lazy.layout.index.get(name, None)
+		if i is None:
+			raise AttributeError(f'{repr(self.__class__.__name__)} object has no attribute {repr(name)}')
+		value = self._lazy.get(i)
+		object.__setattr__(self, name, value)
+		return value
+
+	def __setattr__(self, name: str, value: Any) -> None:
+		object.__setattr__(self, name, value)
+		object.__setattr__(self, '_dirty', True)
+
+	def to_bytes(self, b: PacketBuffer) -> None:
+		lazy = self._lazy
+		if not self._dirty:
+			for v in lazy.values.values():
+				# a decoded list or dict may have been modified in place
+				if isinstance(v, (list, dict)):
+					break
+			else:
+				b.write(lazy.buf)
+				return
+		super().to_bytes(b) # type: ignore[misc]
+
+@final
+class PacketIdMap:
+	__slots__ = ('_by_id', '_by_cls')
+
+	def __init__(self):
+		self._by_id: dict[int, type[Packet]] = {}
+		self._by_cls: dict[type[Packet], int] = {}
+
+	def add(self, cls: type[Packet], pid: int) -> Self:
+		if pid in self._by_id:
+			raise ValueError(f'Packet id 0x{pid:02x} is already used by {self._by_id[pid].__name__}')
+		self._by_id[pid] = cls
+		self._by_cls[cls] = pid
+		return self
+
+	def get(self, pid: int) -> type[Packet] | None:
+		return self._by_id.get(pid, None)
+
+	def id_of(self, cls: type[Packet]) -> int | None:
+		return self._by_cls.get(getattr(cls, '_packet_class', cls), None)
+
+	def __len__(self) -> int:
+		return len(self._by_id)
+
+	def __iter__(self) -> Iterator[type[Packet]]:
+		return iter(self._by_id.values())
+
+@final
+class PacketStatusMap:
+	__slots__ = ('_maps',)
+
+	def __init__(self):
+		self._maps: dict[ConnStatus, PacketIdMap] = {}
+
+	def add(self, status: ConnStatus, ids: PacketIdMap) -> Self:
+		self._maps[status] = ids
+		return self
+
+	def get(self, status: ConnStatus) -> PacketIdMap | None:
+		return self._maps.get(status, None)
+
+	def __iter__(self) -> Iterator[PacketIdMap]:
+		return iter(self._maps.values())
+
+@final
+class PacketRepo:
+	"""
+	The packets of a protocol version, with the serverbound (C2S) and clientbound (S2C) maps
+	"""
+
+	__slots__ = ('protocol', 'c2s', 's2c')
+
+	def __init__(self, protocol: int, c2s: PacketStatusMap, s2c: PacketStatusMap):
+		self.protocol = protocol
+		self.c2s = c2s
+		self.s2c = s2c
+
+	def classes(self) -> Iterator[type[Packet]]:
+		for status_map in (self.c2s, self.s2c):
+			for ids in status_map:
+				yield from ids
+
+	def get_class(self, c2s: bool, status: ConnStatus, pid: int) -> type[Packet] | None:
+		ids = (self.c2s if c2s else self.s2c).get(status)
+		if ids is None:
+			return None
+		return ids.get(pid)
+
+	def peek(self, c2s: bool, status: ConnStatus, pid: int,
+		field_names: Iterable[str], buf: bytes | bytearray | memoryview) -> tuple | None:
+		"""
+		Peek fields of a packet payload, see Packet.peek. Return None if the packet id is unknown
+		"""
+		cls = self.get_class(c2s, status, pid)
+		if cls is None:
+			return None
+		return cls.peek(field_names, buf)
+
+	def parse(self, c2s: bool, status: ConnStatus, pid: int, r: PacketReader) -> Packet | None:
+		"""
+		Parse the payload of a packet, return None if the packet id is unknown
+		"""
+		cls = self.get_class(c2s, status, pid)
+		if cls is None:
+			return None
+		return cls.parse_from(r)
+
+	def __repr__(self) -> str:
+		return f'<PacketRepo protocol={self.protocol}>'
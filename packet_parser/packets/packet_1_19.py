@@ -9,7 +9,11 @@ from typing import final, Type, Self, Any, Callable
 from loginproxy import PacketBuffer, PacketReader, BitSet, ConnStatus
 
 from ..packet import Packet, PacketRepo, PacketStatusMap, PacketIdMap
-from ..nbt import NBT, Compound
+from ..fields import (
+	BOOL, BYTE, UBYTE, SHORT, USHORT, INT, LONG, FLOAT, DOUBLE, ANGLE, UUID, POSITION,
+	VARINT, VARLONG, STRING, JSON, REST, optional,
+)
+from ..nbt import NBT, Compound, RawNBT
 
 SIGNATURE_LENGTH = 256
 
@@ -194,6 +198,8 @@ __all__ = [
 
 @final
 class Slot:
+	__slots__ = ('present', 'item_id', 'item_count', 'nbt')
+
 	def __init__(self,
 		present: bool, # Boolean
 		item_id: int | None, # Optional VarInt
@@ -216,12 +222,15 @@ class Slot:
 			self.nbt.to_bytes(b)
 
 	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
+	def parse_from(cls, r: PacketReader, *, passthrough: bool = False) -> Self:
+		"""
+		If passthrough is True, the item NBT is kept as an undecoded RawNBT
+		"""
 		present = r.read_bool()
 		if present:
 			item_id = r.read_varint()
 			item_count = r.read_byte()
-			nbt = NBT.parse(r)
+			nbt = RawNBT.parse_from(r) if passthrough else NBT.parse(r)
 		else:
 			item_id = None
 			item_count = None
@@ -230,6 +239,14 @@ class Slot:
 
 @final
 class PlayerProperty(Packet):
+	__slots__ = ('name', 'value', 'signed', 'signature')
+
+	HEAD_FIELDS = (
+		('name', STRING),
+		('value', STRING),
+		('signed', BOOL),
+	)
+
 	def __init__(self,
 		name: str, # String (32767)
 		value: str, # String (32767)
@@ -261,6 +278,8 @@ class PlayerProperty(Packet):
 # # # # BEGIN PARTICLE # # # #
 
 class ParticleData(abc.ABC):
+	__slots__ = ()
+
 	__type_map: dict[int, Type['ParticleData']] = {}
 	__name2id_map: dict[str, int] = {}
 
@@ -298,6 +317,8 @@ class ParticleData(abc.ABC):
 		return ParticleData.parse_by_id(id, r)
 
 class EmptyParticleData(ParticleData):
+	__slots__ = ()
+
 	_INSTANCE = None
 	def __new__(cls):
 		if cls._INSTANCE is None:
@@ -318,6 +339,8 @@ class EmptyParticleData(ParticleData):
 
 @final
 class EntityMetadata:
+	__slots__ = ('index', 'type', 'value')
+
 	def __init__(self,
 		index: int, # Unsigned Byte
 		type: int | None, # Optional VarInt Enum
@@ -366,11 +389,11 @@ class EntityMetadata:
 			self.__class__.write_type(self.type, self.value, b)
 
 	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
+	def parse_from(cls, r: PacketReader, *, passthrough: bool = False) -> Self:
 		index = r.read_ubyte()
 		if index != 0xff:
 			type = r.read_varint()
-			value = cls.read_type(type, r)
+			value = cls.read_type(type, r, passthrough=passthrough)
 		else:
 			type = None
 			value = None
@@ -525,7 +548,10 @@ class EntityMetadata:
 
 
 	@staticmethod
-	def read_type(type: int, r: PacketReader) -> Any:
+	def read_type(type: int, r: PacketReader, *, passthrough: bool = False) -> Any:
+		"""
+		If passthrough is True, NBT values (including the NBT of slots) are kept as undecoded RawNBT
+		"""
 		if type == 0:
 			return r.read_byte()
 		elif type == 1:
@@ -543,7 +569,7 @@ class EntityMetadata:
 				return None
 			return r.read_json()
 		elif type == 7:
-			return Slot.parse_from(r)
+			return Slot.parse_from(r, passthrough=passthrough)
 		elif type == 8:
 			return r.read_bool()
 		elif type == 9:
@@ -568,6 +594,8 @@ class EntityMetadata:
 		elif type == 15:
 			return r.read_varint()
 		elif type == 16:
+			if passthrough:
+				return RawNBT.parse_from(r)
 			return NBT.parse(r)
 		elif type == 17:
 			return ParticleData.parse_from(r)
@@ -611,6 +639,8 @@ class EntityMetadata:
 
 @final
 class IntRange:
+	__slots__ = ('flags', 'min', 'max')
+
 	def __init__(self,
 		flags: int, # Byte
 		min: int | None, # Optional integer
@@ -638,6 +668,8 @@ class IntRange:
 
 @final
 class LongRange:
+	__slots__ = ('flags', 'min', 'max')
+
 	def __init__(self,
 		flags: int, # Byte
 		min: int | None, # Optional long
@@ -665,6 +697,8 @@ class LongRange:
 
 @final
 class FloatRange:
+	__slots__ = ('flags', 'min', 'max')
+
 	def __init__(self,
 		flags: int, # Byte
 		min: float | None, # Optional float
@@ -692,6 +726,8 @@ class FloatRange:
 
 @final
 class DoubleRange:
+	__slots__ = ('flags', 'min', 'max')
+
 	def __init__(self,
 		flags: int, # Byte
 		min: float | None, # Optional double
@@ -764,6 +800,8 @@ class NodeScoreHolderProp(enum.Enum):
 
 @final
 class Node:
+	__slots__ = ('flags', 'children', 'redirect_node', 'name', 'parser_id', 'properties', 'suggestions_type')
+
 	ID_MAP = {
 		0:  'brigadier:bool',
 		1:  'brigadier:float',
@@ -911,6 +949,8 @@ class Node:
 
 @final
 class CriterionProgress:
+	__slots__ = ('achieved', 'date_of_achieving')
+
 	def __init__(self,
 		achieved: bool, # Boolean
 		date_of_achieving: int | None, # Optional Long
@@ -932,6 +972,8 @@ class CriterionProgress:
 
 @final
 class AdvancementProgress:
+	__slots__ = ('criterias',)
+
 	def __init__(self,
 		criterias: list[
 			tuple[
@@ -959,6 +1001,8 @@ class AdvancementProgress:
 
 @final
 class AdvancementDisplay:
+	__slots__ = ('title', 'description', 'icon', 'frame_type', 'flags', 'background_texture', 'x_coord', 'y_coord')
+
 	def __init__(self,
 		title: dict, # Chat
 		description: dict, # Chat
@@ -1004,6 +1048,8 @@ class AdvancementDisplay:
 
 @final
 class Advancement:
+	__slots__ = ('has_parent', 'parent_id', 'has_display', 'display_data', 'criterias', 'requirements')
+
 	def __init__(self,
 		has_parent: bool, # Boolean
 		parent_id: str | None, # Optional Identifier
@@ -1063,6 +1109,8 @@ class Advancement:
 
 @final
 class Modifier:
+	__slots__ = ('uuid', 'amount', 'operation')
+
 	def __init__(self,
 		uuid: uuid.UUID, # UUID
 		amount: float, # Double
@@ -1093,6 +1141,8 @@ class Modifier:
 
 @final
 class Ingredient:
+	__slots__ = ('count', 'items')
+
 	def __init__(self,
 		count: int, # VarInt
 		items: list[Slot], # Array of Slot
@@ -1117,6 +1167,8 @@ class Ingredient:
 
 @final
 class Recipe:
+	__slots__ = ('type', 'recipe_id', 'data')
+
 	def __init__(self,
 		type: str, # Identifier
 		recipe_id: str, # Identifier
@@ -1295,6 +1347,8 @@ class Recipe:
 
 @final
 class Tag:
+	__slots__ = ('name', 'entries')
+
 	def __init__(self,
 		name: str, # Identifier
 		entries: list[int], # Array of VarInt
@@ -1319,6 +1373,8 @@ class Tag:
 
 @final
 class Action:
+	__slots__ = ('uuid', 'name', 'properties', 'has_signature_data', 'chat_session_id', 'public_key_expiry_time', 'encoded_public_key', 'public_key_signature', 'gamemode', 'listed', 'ping', 'has_display_name', 'display_name')
+
 	def __init__(self,
 		uuid: uuid.UUID, # UUID
 		name: str | None, # String (16)
@@ -1433,6 +1489,15 @@ class Action:
 
 @final
 class HandshakingHandshakeC2S(Packet):
+	__slots__ = ('protocol_version', 'server_address', 'server_port', 'next_state')
+
+	FIELDS = (
+		('protocol_version', VARINT),
+		('server_address', STRING),
+		('server_port', USHORT),
+		('next_state', VARINT),
+	)
+
 	def __init__(self,
 		protocol_version: int, # VarInt
 		server_address: str, # String (255)
@@ -1444,52 +1509,36 @@ class HandshakingHandshakeC2S(Packet):
 		self.server_port = server_port # Default is 25565. The Notchian server does not use this information.
 		self.next_state = next_state # 1 for Status, 2 for Login.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_varint(self.protocol_version)
-		b.write_string(self.server_address)
-		b.write_ushort(self.server_port)
-		b.write_varint(self.next_state)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		protocol_version = r.read_varint()
-		server_address = r.read_string()
-		server_port = r.read_ushort()
-		next_state = r.read_varint()
-		return cls(protocol_version, server_address, server_port, next_state)
-
 @final
 class StatusResponseS2C(Packet):
+	__slots__ = ('json_response',)
+
+	FIELDS = (
+		('json_response', JSON),
+	)
+
 	def __init__(self,
 		json_response: dict, # String (32767)
 	):
 		self.json_response = json_response # See Server List Ping#Response; as with all strings this is prefixed by its length as a VarInt.
 
-	def to_bytes(self, b: PacketBuffer):
-		b.write_json(self.json_response)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		json_response = r.read_json()
-		return cls(json_response)
-
 @final
 class StatusPingResponseS2C(Packet):
+	__slots__ = ('payload',)
+
+	FIELDS = (
+		('payload', LONG),
+	)
+
 	def __init__(self,
 		payload: int, # Long
 	):
 		self.payload = payload # Should be the same as sent by the client.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_long(self.payload)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		payload = r.read_long()
-		return cls(payload)
-
 @final
 class StatusRequestC2S(Packet):
+	__slots__ = ()
+
 	_INSTANCE = None
 	def __new__(cls):
 		if cls._INSTANCE is None:
@@ -1508,21 +1557,21 @@ class StatusRequestC2S(Packet):
 
 @final
 class StatusPingRequestC2S(Packet):
+	__slots__ = ('payload',)
+
+	FIELDS = (
+		('payload', LONG),
+	)
+
 	def __init__(self,
 		payload: int, # Long
 	):
 		self.payload = payload # May be any number. Notchian clients use a system-dependent time value which is counted in milliseconds.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_long(self.payload)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		payload = r.read_long()
-		return cls(payload)
-
 @final
 class LoginDisconnectS2C(Packet):
+	__slots__ = ('reason',)
+
 	def __init__(self,
 		reason: dict, # Chat
 	):
@@ -1539,6 +1588,12 @@ class LoginDisconnectS2C(Packet):
 
 @final
 class LoginEncryptionRequestS2C(Packet):
+	__slots__ = ('server_id', 'public_key', 'verify_token')
+
+	HEAD_FIELDS = (
+		('server_id', STRING),
+	)
+
 	def __init__(self,
 		server_id: str, # String (20)
 		public_key: bytes, # Byte Array
@@ -1564,6 +1619,13 @@ class LoginEncryptionRequestS2C(Packet):
 
 @final
 class LoginSuccessS2C(Packet):
+	__slots__ = ('uuid', 'username', 'properties')
+
+	HEAD_FIELDS = (
+		('uuid', UUID),
+		('username', STRING),
+	)
+
 	def __init__(self,
 		uuid: uuid.UUID, # UUID
 		username: str, # String (16)
@@ -1592,21 +1654,27 @@ class LoginSuccessS2C(Packet):
 
 @final
 class LoginSetCompressionS2C(Packet):
+	__slots__ = ('threshold',)
+
+	FIELDS = (
+		('threshold', VARINT),
+	)
+
 	def __init__(self,
 		threshold: int, # VarInt
 	):
 		self.threshold = threshold # Maximum size of a packet before it is compressed.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_varint(self.threshold)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		threshold = r.read_varint()
-		return cls(threshold)
-
 @final
 class LoginPluginRequestS2C(Packet):
+	__slots__ = ('message_id', 'channel', 'data')
+
+	FIELDS = (
+		('message_id', VARINT),
+		('channel', STRING),
+		('data', REST),
+	)
+
 	def __init__(self,
 		message_id: int, # VarInt
 		channel: str, # Identifier
@@ -1616,20 +1684,15 @@ class LoginPluginRequestS2C(Packet):
 		self.channel = channel # Name of the plugin channel used to send the data.
 		self.data = data # Any data, depending on the channel. The length of this array must be inferred from the packet length.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_varint(self.message_id)
-		b.write_string(self.channel)
-		b.write(self.data)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		message_id = r.read_varint()
-		channel = r.read_string()
-		data = r.read()
-		return cls(message_id, channel, data)
-
 @final
 class LoginStartC2S(Packet):
+	__slots__ = ('name', 'has_player_uuid', 'player_uuid')
+
+	HEAD_FIELDS = (
+		('name', STRING),
+		('has_player_uuid', BOOL),
+	)
+
 	def __init__(self,
 		name: str, # String (16)
 		has_player_uuid: bool, # Boolean
@@ -1655,6 +1718,8 @@ class LoginStartC2S(Packet):
 
 @final
 class LoginEncryptionResponseC2S(Packet):
+	__slots__ = ('shared_secret', 'verify_token')
+
 	def __init__(self,
 		shared_secret: bytes, # Byte Array
 		verify_token: bytes, # Byte Array
@@ -1676,6 +1741,13 @@ class LoginEncryptionResponseC2S(Packet):
 
 @final
 class LoginPluginResponseC2S(Packet):
+	__slots__ = ('message_id', 'successful', 'data')
+
+	HEAD_FIELDS = (
+		('message_id', VARINT),
+		('successful', BOOL),
+	)
+
 	def __init__(self,
 		message_id: int, # VarInt
 		successful: bool, # Boolean
@@ -1701,6 +1773,8 @@ class LoginPluginResponseC2S(Packet):
 
 @final
 class PlayBundleDelimiterS2C(Packet):
+	__slots__ = ()
+
 	_INSTANCE = None
 	def __new__(cls):
 		if cls._INSTANCE is None:
@@ -1719,6 +1793,24 @@ class PlayBundleDelimiterS2C(Packet):
 
 @final
 class PlaySpawnEntityS2C(Packet):
+	__slots__ = ('entity_id', 'entity_uuid', 'type', 'x', 'y', 'z', 'pitch', 'yaw', 'head_yaw', 'data', 'velocity_x', 'velocity_y', 'velocity_z')
+
+	FIELDS = (
+		('entity_id', VARINT),
+		('entity_uuid', UUID),
+		('type', VARINT),
+		('x', DOUBLE),
+		('y', DOUBLE),
+		('z', DOUBLE),
+		('pitch', ANGLE),
+		('yaw', ANGLE),
+		('head_yaw', ANGLE),
+		('data', VARINT),
+		('velocity_x', SHORT),
+		('velocity_y', SHORT),
+		('velocity_z', SHORT),
+	)
+
 	def __init__(self,
 		entity_id: int, # VarInt
 		entity_uuid: uuid.UUID, # UUID
@@ -1748,40 +1840,18 @@ class PlaySpawnEntityS2C(Packet):
 		self.velocity_y = velocity_y # Same units as Set Entity Velocity.
 		self.velocity_z = velocity_z # Same units as Set Entity Velocity.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_varint(self.entity_id)
-		b.write_uuid(self.entity_uuid)
-		b.write_varint(self.type)
-		b.write_double(self.x)
-		b.write_double(self.y)
-		b.write_double(self.z)
-		b.write_byte(self.pitch)
-		b.write_byte(self.yaw)
-		b.write_byte(self.head_yaw)
-		b.write_varint(self.data)
-		b.write_short(self.velocity_x)
-		b.write_short(self.velocity_y)
-		b.write_short(self.velocity_z)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		entity_id = r.read_varint()
-		entity_uuid = r.read_uuid()
-		type = r.read_varint()
-		x = r.read_double()
-		y = r.read_double()
-		z = r.read_double()
-		pitch = r.read_byte()
-		yaw = r.read_byte()
-		head_yaw = r.read_byte()
-		data = r.read_varint()
-		velocity_x = r.read_short()
-		velocity_y = r.read_short()
-		velocity_z = r.read_short()
-		return cls(entity_id, entity_uuid, type, x, y, z, pitch, yaw, head_yaw, data, velocity_x, velocity_y, velocity_z)
-
 @final
 class PlaySpawnExperienceOrbS2C(Packet):
+	__slots__ = ('entity_id', 'x', 'y', 'z', 'count')
+
+	FIELDS = (
+		('entity_id', VARINT),
+		('x', DOUBLE),
+		('y', DOUBLE),
+		('z', DOUBLE),
+		('count', SHORT),
+	)
+
 	def __init__(self,
 		entity_id: int, # VarInt
 		x: float, # Double
@@ -1795,24 +1865,20 @@ class PlaySpawnExperienceOrbS2C(Packet):
 		self.z = z # 
 		self.count = count # The amount of experience this orb will reward once collected.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_varint(self.entity_id)
-		b.write_double(self.x)
-		b.write_double(self.y)
-		b.write_double(self.z)
-		b.write_short(self.count)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		entity_id = r.read_varint()
-		x = r.read_double()
-		y = r.read_double()
-		z = r.read_double()
-		count = r.read_short()
-		return cls(entity_id, x, y, z, count)
-
 @final
 class PlaySpawnPlayerS2C(Packet):
+	__slots__ = ('entity_id', 'player_uuid', 'x', 'y', 'z', 'yaw', 'pitch')
+
+	FIELDS = (
+		('entity_id', VARINT),
+		('player_uuid', UUID),
+		('x', DOUBLE),
+		('y', DOUBLE),
+		('z', DOUBLE),
+		('yaw', ANGLE),
+		('pitch', ANGLE),
+	)
+
 	def __init__(self,
 		entity_id: int, # VarInt
 		player_uuid: uuid.UUID, # UUID
@@ -1830,28 +1896,15 @@ class PlaySpawnPlayerS2C(Packet):
 		self.yaw = yaw # 
 		self.pitch = pitch # 
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_varint(self.entity_id)
-		b.write_uuid(self.player_uuid)
-		b.write_double(self.x)
-		b.write_double(self.y)
-		b.write_double(self.z)
-		b.write_byte(self.yaw)
-		b.write_byte(self.pitch)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		entity_id = r.read_varint()
-		player_uuid = r.read_uuid()
-		x = r.read_double()
-		y = r.read_double()
-		z = r.read_double()
-		yaw = r.read_byte()
-		pitch = r.read_byte()
-		return cls(entity_id, player_uuid, x, y, z, yaw, pitch)
-
 @final
 class PlayEntityAnimationS2C(Packet):
+	__slots__ = ('entity_id', 'animation')
+
+	FIELDS = (
+		('entity_id', VARINT),
+		('animation', UBYTE),
+	)
+
 	def __init__(self,
 		entity_id: int, # VarInt
 		animation: int, # Unsigned Byte
@@ -1859,18 +1912,10 @@ class PlayEntityAnimationS2C(Packet):
 		self.entity_id = entity_id # Player ID.
 		self.animation = animation # Animation ID (see below).
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_varint(self.entity_id)
-		b.write_ubyte(self.animation)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		entity_id = r.read_varint()
-		animation = r.read_ubyte()
-		return cls(entity_id, animation)
-
 @final
 class PlayAwardStatisticsS2C(Packet):
+	__slots__ = ('statistics',)
+
 	def __init__(self,
 		statistics: list[
 			tuple[
@@ -1901,21 +1946,27 @@ class PlayAwardStatisticsS2C(Packet):
 
 @final
 class PlayAcknowledgeBlockChangeS2C(Packet):
+	__slots__ = ('sequence_id',)
+
+	FIELDS = (
+		('sequence_id', VARINT),
+	)
+
 	def __init__(self,
 		sequence_id: int, # VarInt
 	):
 		self.sequence_id = sequence_id # Represents the sequence to acknowledge, this is used for properly syncing block changes to the client after interactions.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_varint(self.sequence_id)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		sequence_id = r.read_varint()
-		return cls(sequence_id)
-
 @final
 class PlaySetBlockDestroyStageS2C(Packet):
+	__slots__ = ('entity_id', 'location', 'destroy_stage')
+
+	FIELDS = (
+		('entity_id', VARINT),
+		('location', POSITION),
+		('destroy_stage', BYTE),
+	)
+
 	def __init__(self,
 		entity_id: int, # VarInt
 		location: tuple[int, int, int], # Position
@@ -1925,20 +1976,15 @@ class PlaySetBlockDestroyStageS2C(Packet):
 		self.location = location # Block Position.
 		self.destroy_stage = destroy_stage # 0–9 to set it, any other value to remove it.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_varint(self.entity_id)
-		b.write_pos_1_14(self.location)
-		b.write_byte(self.destroy_stage)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		entity_id = r.read_varint()
-		location = r.read_pos_1_14()
-		destroy_stage = r.read_byte()
-		return cls(entity_id, location, destroy_stage)
-
 @final
 class PlayBlockEntityDataS2C(Packet):
+	__slots__ = ('location', 'type', 'nbt_data')
+
+	HEAD_FIELDS = (
+		('location', POSITION),
+		('type', VARINT),
+	)
+
 	def __init__(self,
 		location: tuple[int, int, int], # Position
 		type: int, # VarInt
@@ -1962,6 +2008,15 @@ class PlayBlockEntityDataS2C(Packet):
 
 @final
 class PlayBlockActionS2C(Packet):
+	__slots__ = ('location', 'action_id', 'action_parameter', 'block_type')
+
+	FIELDS = (
+		('location', POSITION),
+		('action_id', UBYTE),
+		('action_parameter', UBYTE),
+		('block_type', VARINT),
+	)
+
 	def __init__(self,
 		location: tuple[int, int, int], # Position
 		action_id: int, # Unsigned Byte
@@ -1973,22 +2028,15 @@ class PlayBlockActionS2C(Packet):
 		self.action_parameter = action_parameter # Varies depending on block — see Block Actions.
 		self.block_type = block_type # The block type ID for the block.  This must match the block at the given coordinates.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_pos_1_14(self.location)
-		b.write_ubyte(self.action_id)
-		b.write_ubyte(self.action_parameter)
-		b.write_varint(self.block_type)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		location = r.read_pos_1_14()
-		action_id = r.read_ubyte()
-		action_parameter = r.read_ubyte()
-		block_type = r.read_varint()
-		return cls(location, action_id, action_parameter, block_type)
-
 @final
 class PlayBlockUpdateS2C(Packet):
+	__slots__ = ('location', 'block_id')
+
+	FIELDS = (
+		('location', POSITION),
+		('block_id', VARINT),
+	)
+
 	def __init__(self,
 		location: tuple[int, int, int], # Position
 		block_id: int, # VarInt
@@ -1996,18 +2044,15 @@ class PlayBlockUpdateS2C(Packet):
 		self.location = location # Block Coordinates.
 		self.block_id = block_id # The new block state ID for the block as given in the global palette. See that section for more information.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_pos_1_14(self.location)
-		b.write_varint(self.block_id)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		location = r.read_pos_1_14()
-		block_id = r.read_varint()
-		return cls(location, block_id)
-
 @final
 class PlayBossBarS2C(Packet):
+	__slots__ = ('uuid', 'action', 'title', 'health', 'color', 'division', 'flags')
+
+	HEAD_FIELDS = (
+		('uuid', UUID),
+		('action', VARINT),
+	)
+
 	def __init__(self,
 		uuid: uuid.UUID, # UUID
 		action: int, # VarInt Enum
@@ -2060,6 +2105,13 @@ class PlayBossBarS2C(Packet):
 
 @final
 class PlayChangeDifficultyS2C(Packet):
+	__slots__ = ('difficulty', 'difficulty_locked')
+
+	FIELDS = (
+		('difficulty', UBYTE),
+		('difficulty_locked', BOOL),
+	)
+
 	def __init__(self,
 		difficulty: int, # Unsigned Byte
 		difficulty_locked: bool, # Boolean
@@ -2067,18 +2119,10 @@ class PlayChangeDifficultyS2C(Packet):
 		self.difficulty = difficulty # 0: peaceful, 1: easy, 2: normal, 3: hard.
 		self.difficulty_locked = difficulty_locked # 
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_ubyte(self.difficulty)
-		b.write_bool(self.difficulty_locked)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		difficulty = r.read_ubyte()
-		difficulty_locked = r.read_bool()
-		return cls(difficulty, difficulty_locked)
-
 @final
 class PlayChunkBiomesS2C(Packet):
+	__slots__ = ('chunk_biome_datas',)
+
 	def __init__(self,
 		chunk_biome_datas: list[
 			tuple[
@@ -2110,21 +2154,27 @@ class PlayChunkBiomesS2C(Packet):
 
 @final
 class PlayClearTitlesS2C(Packet):
+	__slots__ = ('reset',)
+
+	FIELDS = (
+		('reset', BOOL),
+	)
+
 	def __init__(self,
 		reset: bool, # Boolean
 	):
 		self.reset = reset # 
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_bool(self.reset)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		reset = r.read_bool()
-		return cls(reset)
-
 @final
 class PlayCommandSuggestionsResponseS2C(Packet):
+	__slots__ = ('id', 'start', 'length', 'matches')
+
+	HEAD_FIELDS = (
+		('id', VARINT),
+		('start', VARINT),
+		('length', VARINT),
+	)
+
 	def __init__(self,
 		id: int, # VarInt
 		start: int, # VarInt
@@ -2169,6 +2219,8 @@ class PlayCommandSuggestionsResponseS2C(Packet):
 
 @final
 class PlayCommandsS2C(Packet):
+	__slots__ = ('nodes', 'root_index')
+
 	def __init__(self,
 		nodes: list[Node], # Array of Node
 		root_index: int, # VarInt
@@ -2193,21 +2245,21 @@ class PlayCommandsS2C(Packet):
 
 @final
 class PlayCloseContainerS2C(Packet):
+	__slots__ = ('window_id',)
+
+	FIELDS = (
+		('window_id', UBYTE),
+	)
+
 	def __init__(self,
 		window_id: int, # Unsigned Byte
 	):
 		self.window_id = window_id # This is the ID of the window that was closed. 0 for inventory.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_ubyte(self.window_id)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		window_id = r.read_ubyte()
-		return cls(window_id)
-
 @final
 class PlaySetContainerContentS2C(Packet):
+	__slots__ = ('window_id', 'state_id', 'slot_data', 'carried_item')
+
 	def __init__(self,
 		window_id: int, # Unsigned Byte
 		state_id: int, # VarInt
@@ -2228,15 +2280,23 @@ class PlaySetContainerContentS2C(Packet):
 		self.carried_item.to_bytes(b)
 
 	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
+	def parse_from(cls, r: PacketReader, *, passthrough: bool = False) -> Self:
 		window_id = r.read_ubyte()
 		state_id = r.read_varint()
-		slot_data = [Slot.parse_from(r) for _ in range(r.read_varint())]
-		carried_item = Slot.parse_from(r)
+		slot_data = [Slot.parse_from(r, passthrough=passthrough) for _ in range(r.read_varint())]
+		carried_item = Slot.parse_from(r, passthrough=passthrough)
 		return cls(window_id, state_id, slot_data, carried_item)
 
 @final
 class PlaySetContainerPropertyS2C(Packet):
+	__slots__ = ('window_id', 'property', 'value')
+
+	FIELDS = (
+		('window_id', UBYTE),
+		('property', SHORT),
+		('value', SHORT),
+	)
+
 	def __init__(self,
 		window_id: int, # Unsigned Byte
 		property: int, # Short
@@ -2246,20 +2306,10 @@ class PlaySetContainerPropertyS2C(Packet):
 		self.property = property # The property to be updated, see below.
 		self.value = value # The new value for the property, see below.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_ubyte(self.window_id)
-		b.write_short(self.property)
-		b.write_short(self.value)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		window_id = r.read_ubyte()
-		property = r.read_short()
-		value = r.read_short()
-		return cls(window_id, property, value)
-
 @final
 class PlaySetContainerSlotS2C(Packet):
+	__slots__ = ('window_id', 'state_id', 'slot', 'slot_data')
+
 	def __init__(self,
 		window_id: int, # Byte
 		state_id: int, # VarInt
@@ -2278,15 +2328,22 @@ class PlaySetContainerSlotS2C(Packet):
 		self.slot_data.to_bytes(b)
 
 	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
+	def parse_from(cls, r: PacketReader, *, passthrough: bool = False) -> Self:
 		window_id = r.read_byte()
 		state_id = r.read_varint()
 		slot = r.read_short()
-		slot_data = Slot.parse_from(r)
+		slot_data = Slot.parse_from(r, passthrough=passthrough)
 		return cls(window_id, state_id, slot, slot_data)
 
 @final
 class PlaySetCooldownS2C(Packet):
+	__slots__ = ('item_id', 'cooldown_ticks')
+
+	FIELDS = (
+		('item_id', VARINT),
+		('cooldown_ticks', VARINT),
+	)
+
 	def __init__(self,
 		item_id: int, # VarInt
 		cooldown_ticks: int, # VarInt
@@ -2294,18 +2351,14 @@ class PlaySetCooldownS2C(Packet):
 		self.item_id = item_id # Numeric ID of the item to apply a cooldown to.
 		self.cooldown_ticks = cooldown_ticks # Number of ticks to apply a cooldown for, or 0 to clear the cooldown.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_varint(self.item_id)
-		b.write_varint(self.cooldown_ticks)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		item_id = r.read_varint()
-		cooldown_ticks = r.read_varint()
-		return cls(item_id, cooldown_ticks)
-
 @final
 class PlayChatSuggestionsS2C(Packet):
+	__slots__ = ('action', 'entries')
+
+	HEAD_FIELDS = (
+		('action', VARINT),
+	)
+
 	def __init__(self,
 		action: int, # VarInt Enum
 		entries: list[str], # Array of String
@@ -2327,25 +2380,35 @@ class PlayChatSuggestionsS2C(Packet):
 
 @final
 class PlayPluginMessageS2C(Packet):
-	def __init__(self,
+	__slots__ = ('channel', 'data')
+
+	FIELDS = (
+		('channel', STRING),
+		('data', REST),
+	)
+
+	def __init__(self,
 		channel: str, # Identifier
 		data: bytes, # Byte Array (1048576)
 	):
 		self.channel = channel # Name of the plugin channel used to send the data.
 		self.data = data # Any data. The length of this array must be inferred from the packet length.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_string(self.channel)
-		b.write(self.data)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		channel = r.read_string()
-		data = r.read()
-		return cls(channel, data)
-
 @final
 class PlayDamageEventS2C(Packet):
+	__slots__ = ('entity_id', 'source_type_id', 'source_cause_id', 'source_direct_id', 'has_source_position', 'source_position_x', 'source_position_y', 'source_position_z')
+
+	FIELDS = (
+		('entity_id', VARINT),
+		('source_type_id', VARINT),
+		('source_cause_id', VARINT),
+		('source_direct_id', VARINT),
+		('has_source_position', BOOL),
+		('source_position_x', optional(DOUBLE, 'has_source_position')),
+		('source_position_y', optional(DOUBLE, 'has_source_position')),
+		('source_position_z', optional(DOUBLE, 'has_source_position')),
+	)
+
 	def __init__(self,
 		entity_id: int, # VarInt
 		source_type_id: int, # VarInt
@@ -2365,39 +2428,10 @@ class PlayDamageEventS2C(Packet):
 		self.source_position_y = source_position_y # Only present if Has Source Position is true
 		self.source_position_z = source_position_z # Only present if Has Source Position is true
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_varint(self.entity_id)
-		b.write_varint(self.source_type_id)
-		b.write_varint(self.source_cause_id)
-		b.write_varint(self.source_direct_id)
-		b.write_bool(self.has_source_position)
-		if self.has_source_position:
-			assert self.source_position_x is not None
-			assert self.source_position_y is not None
-			assert self.source_position_z is not None
-			b.write_double(self.source_position_x)
-			b.write_double(self.source_position_y)
-			b.write_double(self.source_position_z)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		entity_id = r.read_varint()
-		source_type_id = r.read_varint()
-		source_cause_id = r.read_varint()
-		source_direct_id = r.read_varint()
-		has_source_position = r.read_bool()
-		if has_source_position:
-			source_position_x = r.read_double()
-			source_position_y = r.read_double()
-			source_position_z = r.read_double()
-		else:
-			source_position_x = None
-			source_position_y = None
-			source_position_z = None
-		return cls(entity_id, source_type_id, source_cause_id, source_direct_id, has_source_position, source_position_x, source_position_y, source_position_z)
-
 @final
 class PlayDeleteMessageS2C(Packet):
+	__slots__ = ('signature',)
+
 	def __init__(self,
 		signature: bytes, # Byte Array
 	):
@@ -2414,21 +2448,28 @@ class PlayDeleteMessageS2C(Packet):
 
 @final
 class PlayDisconnectS2C(Packet):
+	__slots__ = ('reason',)
+
+	FIELDS = (
+		('reason', JSON),
+	)
+
 	def __init__(self,
 		reason: dict, # Chat
 	):
 		self.reason = reason # Displayed to the client when the connection terminates.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_json(self.reason)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		reason = r.read_json()
-		return cls(reason)
-
 @final
 class PlayDisguisedChatMessageS2C(Packet):
+	__slots__ = ('message', 'chat_type', 'chat_type_name', 'has_target_name', 'target_name')
+
+	HEAD_FIELDS = (
+		('message', JSON),
+		('chat_type', VARINT),
+		('chat_type_name', JSON),
+		('has_target_name', BOOL),
+	)
+
 	def __init__(self,
 		message: dict, # Chat
 		chat_type: int, # VarInt
@@ -2462,6 +2503,13 @@ class PlayDisguisedChatMessageS2C(Packet):
 
 @final
 class PlayEntityEventS2C(Packet):
+	__slots__ = ('entity_id', 'entity_status')
+
+	FIELDS = (
+		('entity_id', INT),
+		('entity_status', BYTE),
+	)
+
 	def __init__(self,
 		entity_id: int, # Int
 		entity_status: int, # Byte Enum
@@ -2469,18 +2517,17 @@ class PlayEntityEventS2C(Packet):
 		self.entity_id = entity_id # 
 		self.entity_status = entity_status # See Entity statuses for a list of which statuses are valid for each type of entity.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_int(self.entity_id)
-		b.write_byte(self.entity_status)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		entity_id = r.read_int()
-		entity_status = r.read_byte()
-		return cls(entity_id, entity_status)
-
 @final
 class PlayExplosionS2C(Packet):
+	__slots__ = ('x', 'y', 'z', 'strength', 'records', 'player_motion_x', 'player_motion_y', 'player_motion_z')
+
+	HEAD_FIELDS = (
+		('x', DOUBLE),
+		('y', DOUBLE),
+		('z', DOUBLE),
+		('strength', FLOAT),
+	)
+
 	def __init__(self,
 		x: float, # Double
 		y: float, # Double
@@ -2535,6 +2582,13 @@ class PlayExplosionS2C(Packet):
 
 @final
 class PlayUnloadChunkS2C(Packet):
+	__slots__ = ('chunk_x', 'chunk_z')
+
+	FIELDS = (
+		('chunk_x', INT),
+		('chunk_z', INT),
+	)
+
 	def __init__(self,
 		chunk_x: int, # Int
 		chunk_z: int, # Int
@@ -2542,18 +2596,15 @@ class PlayUnloadChunkS2C(Packet):
 		self.chunk_x = chunk_x # Block coordinate divided by 16, rounded down.
 		self.chunk_z = chunk_z # Block coordinate divided by 16, rounded down.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_int(self.chunk_x)
-		b.write_int(self.chunk_z)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		chunk_x = r.read_int()
-		chunk_z = r.read_int()
-		return cls(chunk_x, chunk_z)
-
 @final
 class PlayGameEventS2C(Packet):
+	__slots__ = ('event', 'value')
+
+	FIELDS = (
+		('event', UBYTE),
+		('value', FLOAT),
+	)
+
 	def __init__(self,
 		event: int, # Unsigned Byte
 		value: float, # Float
@@ -2561,18 +2612,16 @@ class PlayGameEventS2C(Packet):
 		self.event = event # See below.
 		self.value = value # Depends on Event.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_ubyte(self.event)
-		b.write_float(self.value)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		event = r.read_ubyte()
-		value = r.read_float()
-		return cls(event, value)
-
 @final
 class PlayOpenHorseScreenS2C(Packet):
+	__slots__ = ('window_id', 'slot_count', 'entity_id')
+
+	FIELDS = (
+		('window_id', UBYTE),
+		('slot_count', VARINT),
+		('entity_id', INT),
+	)
+
 	def __init__(self,
 		window_id: int, # Unsigned Byte
 		slot_count: int, # VarInt
@@ -2582,20 +2631,15 @@ class PlayOpenHorseScreenS2C(Packet):
 		self.slot_count = slot_count # 
 		self.entity_id = entity_id # 
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_ubyte(self.window_id)
-		b.write_varint(self.slot_count)
-		b.write_int(self.entity_id)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		window_id = r.read_ubyte()
-		slot_count = r.read_varint()
-		entity_id = r.read_int()
-		return cls(window_id, slot_count, entity_id)
-
 @final
 class PlayHurtAnimationS2C(Packet):
+	__slots__ = ('entity_id', 'yaw')
+
+	FIELDS = (
+		('entity_id', VARINT),
+		('yaw', FLOAT),
+	)
+
 	def __init__(self,
 		entity_id: int, # VarInt
 		yaw: float, # Float
@@ -2603,18 +2647,21 @@ class PlayHurtAnimationS2C(Packet):
 		self.entity_id = entity_id # The ID of the entity taking damage
 		self.yaw = yaw # The direction the damage is coming from in relation to the entity
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_varint(self.entity_id)
-		b.write_float(self.yaw)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		entity_id = r.read_varint()
-		yaw = r.read_float()
-		return cls(entity_id, yaw)
-
 @final
 class PlayInitializeWorldBorderS2C(Packet):
+	__slots__ = ('x', 'z', 'old_diameter', 'new_diameter', 'speed', 'portal_teleport_boundary', 'warning_blocks', 'warning_time')
+
+	FIELDS = (
+		('x', DOUBLE),
+		('z', DOUBLE),
+		('old_diameter', DOUBLE),
+		('new_diameter', DOUBLE),
+		('speed', VARLONG),
+		('portal_teleport_boundary', VARINT),
+		('warning_blocks', VARINT),
+		('warning_time', VARINT),
+	)
+
 	def __init__(self,
 		x: float, # Double
 		z: float, # Double
@@ -2634,45 +2681,28 @@ class PlayInitializeWorldBorderS2C(Packet):
 		self.warning_blocks = warning_blocks # In meters.
 		self.warning_time = warning_time # In seconds as set by /worldborder warning time.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_double(self.x)
-		b.write_double(self.z)
-		b.write_double(self.old_diameter)
-		b.write_double(self.new_diameter)
-		b.write_varlong(self.speed)
-		b.write_varint(self.portal_teleport_boundary)
-		b.write_varint(self.warning_blocks)
-		b.write_varint(self.warning_time)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		x = r.read_double()
-		z = r.read_double()
-		old_diameter = r.read_double()
-		new_diameter = r.read_double()
-		speed = r.read_varlong()
-		portal_teleport_boundary = r.read_varint()
-		warning_blocks = r.read_varint()
-		warning_time = r.read_varint()
-		return cls(x, z, old_diameter, new_diameter, speed, portal_teleport_boundary, warning_blocks, warning_time)
-
 @final
 class PlayKeepAliveS2C(Packet):
+	__slots__ = ('keep_alive_id',)
+
+	FIELDS = (
+		('keep_alive_id', LONG),
+	)
+
 	def __init__(self,
 		keep_alive_id: int, # Long
 	):
 		self.keep_alive_id = keep_alive_id # 
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_long(self.keep_alive_id)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		keep_alive_id = r.read_long()
-		return cls(keep_alive_id)
-
 @final
 class PlayChunkDataandUpdateLightS2C(Packet):
+	__slots__ = ('chunk_x', 'chunk_z', 'heightmaps', 'data', 'block_entities', 'trust_edges', 'sky_light_mask', 'block_light_mask', 'empty_sky_light_mask', 'empty_block_light_mask', 'sky_light_arrays', 'block_light_arrays')
+
+	HEAD_FIELDS = (
+		('chunk_x', INT),
+		('chunk_z', INT),
+	)
+
 	def __init__(self,
 		chunk_x: int, # Int
 		chunk_z: int, # Int
@@ -2773,6 +2803,15 @@ class PlayChunkDataandUpdateLightS2C(Packet):
 
 @final
 class PlayWorldEventS2C(Packet):
+	__slots__ = ('event', 'location', 'data', 'disable_relative_volume')
+
+	FIELDS = (
+		('event', INT),
+		('location', POSITION),
+		('data', INT),
+		('disable_relative_volume', BOOL),
+	)
+
 	def __init__(self,
 		event: int, # Int
 		location: tuple[int, int, int], # Position
@@ -2784,22 +2823,10 @@ class PlayWorldEventS2C(Packet):
 		self.data = data # Extra data for certain events, see below.
 		self.disable_relative_volume = disable_relative_volume # See above.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_int(self.event)
-		b.write_pos_1_14(self.location)
-		b.write_int(self.data)
-		b.write_bool(self.disable_relative_volume)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		event = r.read_int()
-		location = r.read_pos_1_14()
-		data = r.read_int()
-		disable_relative_volume = r.read_bool()
-		return cls(event, location, data, disable_relative_volume)
-
 @final
 class PlayParticleS2C(Packet):
+	__slots__ = ('particle_id', 'long_distance', 'x', 'y', 'z', 'offset_x', 'offset_y', 'offset_z', 'max_speed', 'particles')
+
 	def __init__(self,
 		particle_id: int, # VarInt
 		long_distance: bool, # Boolean
@@ -2825,6 +2852,14 @@ class PlayParticleS2C(Packet):
 
 @final
 class PlayUpdateLightS2C(Packet):
+	__slots__ = ('chunk_x', 'chunk_z', 'trust_edges', 'sky_light_mask', 'block_light_mask', 'empty_sky_light_mask', 'empty_block_light_mask', 'sky_light_arrays', 'block_light_arrays')
+
+	HEAD_FIELDS = (
+		('chunk_x', VARINT),
+		('chunk_z', VARINT),
+		('trust_edges', BOOL),
+	)
+
 	def __init__(self,
 		chunk_x: int, # VarInt
 		chunk_z: int, # VarInt
@@ -2894,6 +2929,15 @@ class PlayUpdateLightS2C(Packet):
 
 @final
 class PlayLoginS2C(Packet):
+	__slots__ = ('entity_id', 'is_hardcore', 'gamemode', 'previous_gamemode', 'dimension_names', 'registry_codec', 'dimension_type', 'dimension_name', 'hashed_seed', 'max_players', 'view_distance', 'simulation_distance', 'reduced_debug_info', 'enable_respawn_screen', 'is_debug', 'is_flat', 'has_death_location', 'death_dimension_name', 'death_location')
+
+	HEAD_FIELDS = (
+		('entity_id', INT),
+		('is_hardcore', BOOL),
+		('gamemode', UBYTE),
+		('previous_gamemode', BYTE),
+	)
+
 	def __init__(self,
 		entity_id: int, # Int
 		is_hardcore: bool, # Boolean
@@ -2994,6 +3038,15 @@ class PlayLoginS2C(Packet):
 
 @final
 class PlayMapDataS2C(Packet):
+	__slots__ = ('map_id', 'scale', 'locked', 'has_icons', 'icons', 'columns', 'rows', 'x', 'z', 'length', 'data')
+
+	HEAD_FIELDS = (
+		('map_id', VARINT),
+		('scale', BYTE),
+		('locked', BOOL),
+		('has_icons', BOOL),
+	)
+
 	def __init__(self,
 		map_id: int, # VarInt
 		scale: int, # Byte
@@ -3098,6 +3151,12 @@ class PlayMapDataS2C(Packet):
 
 @final
 class PlayMerchantOffersS2C(Packet):
+	__slots__ = ('window_id', 'trades', 'villager_level', 'experience', 'is_regular_villager', 'can_restock')
+
+	HEAD_FIELDS = (
+		('window_id', VARINT),
+	)
+
 	def __init__(self,
 		window_id: int, # VarInt
 		trades: list[
@@ -3169,6 +3228,16 @@ class PlayMerchantOffersS2C(Packet):
 
 @final
 class PlayUpdateEntityPositionS2C(Packet):
+	__slots__ = ('entity_id', 'delta_x', 'delta_y', 'delta_z', 'on_ground')
+
+	FIELDS = (
+		('entity_id', VARINT),
+		('delta_x', SHORT),
+		('delta_y', SHORT),
+		('delta_z', SHORT),
+		('on_ground', BOOL),
+	)
+
 	def __init__(self,
 		entity_id: int, # VarInt
 		delta_x: int, # Short
@@ -3182,24 +3251,20 @@ class PlayUpdateEntityPositionS2C(Packet):
 		self.delta_z = delta_z # Change in Z position as (currentZ * 32 - prevZ * 32) * 128.
 		self.on_ground = on_ground # 
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_varint(self.entity_id)
-		b.write_short(self.delta_x)
-		b.write_short(self.delta_y)
-		b.write_short(self.delta_z)
-		b.write_bool(self.on_ground)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		entity_id = r.read_varint()
-		delta_x = r.read_short()
-		delta_y = r.read_short()
-		delta_z = r.read_short()
-		on_ground = r.read_bool()
-		return cls(entity_id, delta_x, delta_y, delta_z, on_ground)
-
 @final
 class PlayUpdateEntityPositionandRotationS2C(Packet):
+	__slots__ = ('entity_id', 'delta_x', 'delta_y', 'delta_z', 'yaw', 'pitch', 'on_ground')
+
+	FIELDS = (
+		('entity_id', VARINT),
+		('delta_x', SHORT),
+		('delta_y', SHORT),
+		('delta_z', SHORT),
+		('yaw', ANGLE),
+		('pitch', ANGLE),
+		('on_ground', BOOL),
+	)
+
 	def __init__(self,
 		entity_id: int, # VarInt
 		delta_x: int, # Short
@@ -3217,28 +3282,17 @@ class PlayUpdateEntityPositionandRotationS2C(Packet):
 		self.pitch = pitch # New angle, not a delta.
 		self.on_ground = on_ground # 
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_varint(self.entity_id)
-		b.write_short(self.delta_x)
-		b.write_short(self.delta_y)
-		b.write_short(self.delta_z)
-		b.write_byte(self.yaw)
-		b.write_byte(self.pitch)
-		b.write_bool(self.on_ground)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		entity_id = r.read_varint()
-		delta_x = r.read_short()
-		delta_y = r.read_short()
-		delta_z = r.read_short()
-		yaw = r.read_byte()
-		pitch = r.read_byte()
-		on_ground = r.read_bool()
-		return cls(entity_id, delta_x, delta_y, delta_z, yaw, pitch, on_ground)
-
 @final
 class PlayUpdateEntityRotationS2C(Packet):
+	__slots__ = ('entity_id', 'yaw', 'pitch', 'on_ground')
+
+	FIELDS = (
+		('entity_id', VARINT),
+		('yaw', ANGLE),
+		('pitch', ANGLE),
+		('on_ground', BOOL),
+	)
+
 	def __init__(self,
 		entity_id: int, # VarInt
 		yaw: int, # Angle
@@ -3250,22 +3304,18 @@ class PlayUpdateEntityRotationS2C(Packet):
 		self.pitch = pitch # New angle, not a delta.
 		self.on_ground = on_ground # 
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_varint(self.entity_id)
-		b.write_byte(self.yaw)
-		b.write_byte(self.pitch)
-		b.write_bool(self.on_ground)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		entity_id = r.read_varint()
-		yaw = r.read_byte()
-		pitch = r.read_byte()
-		on_ground = r.read_bool()
-		return cls(entity_id, yaw, pitch, on_ground)
-
 @final
 class PlayMoveVehicleS2C(Packet):
+	__slots__ = ('x', 'y', 'z', 'yaw', 'pitch')
+
+	FIELDS = (
+		('x', DOUBLE),
+		('y', DOUBLE),
+		('z', DOUBLE),
+		('yaw', FLOAT),
+		('pitch', FLOAT),
+	)
+
 	def __init__(self,
 		x: float, # Double
 		y: float, # Double
@@ -3279,39 +3329,29 @@ class PlayMoveVehicleS2C(Packet):
 		self.yaw = yaw # Absolute rotation on the vertical axis, in degrees.
 		self.pitch = pitch # Absolute rotation on the horizontal axis, in degrees.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_double(self.x)
-		b.write_double(self.y)
-		b.write_double(self.z)
-		b.write_float(self.yaw)
-		b.write_float(self.pitch)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		x = r.read_double()
-		y = r.read_double()
-		z = r.read_double()
-		yaw = r.read_float()
-		pitch = r.read_float()
-		return cls(x, y, z, yaw, pitch)
-
 @final
 class PlayOpenBookS2C(Packet):
+	__slots__ = ('hand',)
+
+	FIELDS = (
+		('hand', VARINT),
+	)
+
 	def __init__(self,
 		hand: int, # VarInt Enum
 	):
 		self.hand = hand # 0: Main hand, 1: Off hand .
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_varint(self.hand)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		hand = r.read_varint()
-		return cls(hand)
-
 @final
 class PlayOpenScreenS2C(Packet):
+	__slots__ = ('window_id', 'window_type', 'window_title')
+
+	FIELDS = (
+		('window_id', VARINT),
+		('window_type', VARINT),
+		('window_title', JSON),
+	)
+
 	def __init__(self,
 		window_id: int, # VarInt
 		window_type: int, # VarInt
@@ -3321,50 +3361,41 @@ class PlayOpenScreenS2C(Packet):
 		self.window_type = window_type # The window type to use for display. Contained in the minecraft:menu registry; see Inventory for the different values.
 		self.window_title = window_title # The title of the window.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_varint(self.window_id)
-		b.write_varint(self.window_type)
-		b.write_json(self.window_title)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		window_id = r.read_varint()
-		window_type = r.read_varint()
-		window_title = r.read_json()
-		return cls(window_id, window_type, window_title)
-
 @final
 class PlayOpenSignEditorS2C(Packet):
+	__slots__ = ('location',)
+
+	FIELDS = (
+		('location', POSITION),
+	)
+
 	def __init__(self,
 		location: tuple[int, int, int], # Position
 	):
 		self.location = location # 
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_pos_1_14(self.location)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		location = r.read_pos_1_14()
-		return cls(location)
-
 @final
 class PlayPingS2C(Packet):
+	__slots__ = ('id',)
+
+	FIELDS = (
+		('id', INT),
+	)
+
 	def __init__(self,
 		id: int, # Int
 	):
 		self.id = id # 
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_int(self.id)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		id = r.read_int()
-		return cls(id)
-
 @final
 class PlayPlaceGhostRecipeS2C(Packet):
+	__slots__ = ('window_id', 'recipe')
+
+	FIELDS = (
+		('window_id', BYTE),
+		('recipe', STRING),
+	)
+
 	def __init__(self,
 		window_id: int, # Byte
 		recipe: str, # Identifier
@@ -3372,18 +3403,16 @@ class PlayPlaceGhostRecipeS2C(Packet):
 		self.window_id = window_id # 
 		self.recipe = recipe # A recipe ID.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_byte(self.window_id)
-		b.write_string(self.recipe)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		window_id = r.read_byte()
-		recipe = r.read_string()
-		return cls(window_id, recipe)
-
 @final
 class PlayerAbilitiesS2C(Packet):
+	__slots__ = ('flags', 'flying_speed', 'field_of_view_modifier')
+
+	FIELDS = (
+		('flags', BYTE),
+		('flying_speed', FLOAT),
+		('field_of_view_modifier', FLOAT),
+	)
+
 	def __init__(self,
 		flags: int, # Byte
 		flying_speed: float, # Float
@@ -3393,20 +3422,16 @@ class PlayerAbilitiesS2C(Packet):
 		self.flying_speed = flying_speed # 0.05 by default.
 		self.field_of_view_modifier = field_of_view_modifier # Modifies the field of view, like a speed potion. A Notchian server will use the same value as the movement speed sent in the Update Attributes packet, which defaults to 0.1 for players.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_byte(self.flags)
-		b.write_float(self.flying_speed)
-		b.write_float(self.field_of_view_modifier)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		flags = r.read_byte()
-		flying_speed = r.read_float()
-		field_of_view_modifier = r.read_float()
-		return cls(flags, flying_speed, field_of_view_modifier)
-
 @final
 class PlayerChatMessage(Packet):
+	__slots__ = ('sender', 'index', 'message_signature_present', 'message_signature_bytes', 'message', 'timestamp', 'salt', 'previous_messages', 'unsigned_content_present', 'unsigned_content', 'filter_type', 'filter_type_bits', 'chat_type', 'network_name', 'network_target_name_present', 'network_target_name')
+
+	HEAD_FIELDS = (
+		('sender', UUID),
+		('index', VARINT),
+		('message_signature_present', BOOL),
+	)
+
 	def __init__(self,
 		sender: uuid.UUID, # UUID
 		index: int, # VarInt
@@ -3508,6 +3533,13 @@ class PlayerChatMessage(Packet):
 
 @final
 class PlayEndCombatS2C(Packet):
+	__slots__ = ('duration', 'entity_id')
+
+	FIELDS = (
+		('duration', VARINT),
+		('entity_id', INT),
+	)
+
 	def __init__(self,
 		duration: int, # VarInt
 		entity_id: int, # Int
@@ -3515,18 +3547,10 @@ class PlayEndCombatS2C(Packet):
 		self.duration = duration # Length of the combat in ticks.
 		self.entity_id = entity_id # ID of the primary opponent of the ended combat, or -1 if there is no obvious primary opponent.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_varint(self.duration)
-		b.write_int(self.entity_id)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		duration = r.read_varint()
-		entity_id = r.read_int()
-		return cls(duration, entity_id)
-
 @final
 class PlayEnterCombatS2C(Packet):
+	__slots__ = ()
+
 	_INSTANCE = None
 	def __new__(cls):
 		if cls._INSTANCE is None:
@@ -3545,7 +3569,15 @@ class PlayEnterCombatS2C(Packet):
 
 @final
 class PlayCombatDeathS2C(Packet):
-	def __init__(self,
+	__slots__ = ('player_id', 'entity_id', 'message')
+
+	FIELDS = (
+		('player_id', VARINT),
+		('entity_id', INT),
+		('message', JSON),
+	)
+
+	def __init__(self,
 		player_id: int, # VarInt
 		entity_id: int, # Int
 		message: dict, # Chat
@@ -3554,20 +3586,10 @@ class PlayCombatDeathS2C(Packet):
 		self.entity_id = entity_id # The killer entity's ID, or -1 if there is no obvious killer.
 		self.message = message # The death message.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_varint(self.player_id)
-		b.write_int(self.entity_id)
-		b.write_json(self.message)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		player_id = r.read_varint()
-		entity_id = r.read_int()
-		message = r.read_json()
-		return cls(player_id, entity_id, message)
-
 @final
 class PlayerInfoRemoveS2C(Packet):
+	__slots__ = ('players',)
+
 	def __init__(self,
 		players: list[uuid.UUID], # Array of UUID
 	):
@@ -3588,6 +3610,12 @@ class PlayerInfoRemoveS2C(Packet):
 
 @final
 class PlayerInfoUpdateS2C(Packet):
+	__slots__ = ('actions', 'action_array')
+
+	HEAD_FIELDS = (
+		('actions', BYTE),
+	)
+
 	def __init__(self,
 		actions: int, # Byte
 		action_array: list[Action], # Array Of Action
@@ -3612,6 +3640,18 @@ class PlayerInfoUpdateS2C(Packet):
 
 @final
 class PlayLookAtS2C(Packet):
+	__slots__ = ('feet_eyes', 'target_x', 'target_y', 'target_z', 'is_entity', 'entity_id', 'entity_feet_eyes')
+
+	FIELDS = (
+		('feet_eyes', VARINT),
+		('target_x', DOUBLE),
+		('target_y', DOUBLE),
+		('target_z', DOUBLE),
+		('is_entity', BOOL),
+		('entity_id', optional(VARINT, 'is_entity')),
+		('entity_feet_eyes', optional(VARINT, 'is_entity')),
+	)
+
 	def __init__(self,
 		feet_eyes: int, # VarInt Enum
 		target_x: float, # Double
@@ -3629,35 +3669,20 @@ class PlayLookAtS2C(Packet):
 		self.entity_id = entity_id # Only if is entity is true — the entity to face towards.
 		self.entity_feet_eyes = entity_feet_eyes # Whether to look at the entity's eyes or feet.  Same values and meanings as before, just for the entity's head/feet.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_varint(self.feet_eyes)
-		b.write_double(self.target_x)
-		b.write_double(self.target_y)
-		b.write_double(self.target_z)
-		b.write_bool(self.is_entity)
-		if self.is_entity:
-			assert self.entity_id is not None
-			assert self.entity_feet_eyes is not None
-			b.write_varint(self.entity_id)
-			b.write_varint(self.entity_feet_eyes)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		feet_eyes = r.read_varint()
-		target_x = r.read_double()
-		target_y = r.read_double()
-		target_z = r.read_double()
-		is_entity = r.read_bool()
-		if is_entity:
-			entity_id = r.read_varint()
-			entity_feet_eyes = r.read_varint()
-		else:
-			entity_id = None
-			entity_feet_eyes = None
-		return cls(feet_eyes, target_x, target_y, target_z, is_entity, entity_id, entity_feet_eyes)
-
 @final
 class PlaySynchronizePlayerPositionS2C(Packet):
+	__slots__ = ('x', 'y', 'z', 'yaw', 'pitch', 'flags', 'teleport_id')
+
+	HEAD_FIELDS = (
+		('x', DOUBLE),
+		('y', DOUBLE),
+		('z', DOUBLE),
+		('yaw', FLOAT),
+		('pitch', FLOAT),
+		('flags', BYTE),
+		('teleport_id', VARINT),
+	)
+
 	def __init__(self,
 		x: float, # Double
 		y: float, # Double
@@ -3701,6 +3726,20 @@ class PlaySynchronizePlayerPositionS2C(Packet):
 
 @final
 class PlayUpdateRecipeBookS2C(Packet):
+	__slots__ = ('action', 'crafting_recipe_book_open', 'crafting_recipe_book_filter_active', 'smelting_recipe_book_open', 'smelting_recipe_book_filter_active', 'blast_furnace_recipe_book_open', 'blast_furnace_recipe_book_filter_active', 'smoker_recipe_book_open', 'smoker_recipe_book_filter_active', 'recipe_ids', 'recipe_ids_2')
+
+	HEAD_FIELDS = (
+		('action', VARINT),
+		('crafting_recipe_book_open', BOOL),
+		('crafting_recipe_book_filter_active', BOOL),
+		('smelting_recipe_book_open', BOOL),
+		('smelting_recipe_book_filter_active', BOOL),
+		('blast_furnace_recipe_book_open', BOOL),
+		('blast_furnace_recipe_book_filter_active', BOOL),
+		('smoker_recipe_book_open', BOOL),
+		('smoker_recipe_book_filter_active', BOOL),
+	)
+
 	def __init__(self,
 		action: int, # VarInt
 		crafting_recipe_book_open: bool, # Boolean
@@ -3771,6 +3810,8 @@ class PlayUpdateRecipeBookS2C(Packet):
 
 @final
 class PlayRemoveEntitiesS2C(Packet):
+	__slots__ = ('entity_ids',)
+
 	def __init__(self,
 		entity_ids: list[int], # Array of VarInt
 	):
@@ -3788,6 +3829,13 @@ class PlayRemoveEntitiesS2C(Packet):
 
 @final
 class PlayRemoveEntityEffectS2C(Packet):
+	__slots__ = ('entity_id', 'effect_id')
+
+	FIELDS = (
+		('entity_id', VARINT),
+		('effect_id', VARINT),
+	)
+
 	def __init__(self,
 		entity_id: int, # VarInt
 		effect_id: int, # VarInt
@@ -3795,18 +3843,17 @@ class PlayRemoveEntityEffectS2C(Packet):
 		self.entity_id = entity_id # 
 		self.effect_id = effect_id # See this table.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_varint(self.entity_id)
-		b.write_varint(self.effect_id)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		entity_id = r.read_varint()
-		effect_id = r.read_varint()
-		return cls(entity_id, effect_id)
-
 @final
 class PlayResourcePackS2C(Packet):
+	__slots__ = ('url', 'hash', 'forced', 'has_prompt_message', 'prompt_message')
+
+	HEAD_FIELDS = (
+		('url', STRING),
+		('hash', STRING),
+		('forced', BOOL),
+		('has_prompt_message', BOOL),
+	)
+
 	def __init__(self,
 		url: str, # String (32767)
 		hash: str, # String (40)
@@ -3840,6 +3887,22 @@ class PlayResourcePackS2C(Packet):
 
 @final
 class PlayRespawnS2C(Packet):
+	__slots__ = ('dimension_type', 'dimension_name', 'hashed_seed', 'gamemode', 'previous_gamemode', 'is_debug', 'is_flat', 'copy_metadata', 'has_death_location', 'death_dimension_name', 'death_location')
+
+	FIELDS = (
+		('dimension_type', STRING),
+		('dimension_name', STRING),
+		('hashed_seed', LONG),
+		('gamemode', UBYTE),
+		('previous_gamemode', BYTE),
+		('is_debug', BOOL),
+		('is_flat', BOOL),
+		('copy_metadata', BOOL),
+		('has_death_location', BOOL),
+		('death_dimension_name', optional(STRING, 'has_death_location')),
+		('death_location', optional(POSITION, 'has_death_location')),
+	)
+
 	def __init__(self,
 		dimension_type: str, # Identifier
 		dimension_name: str, # Identifier
@@ -3865,43 +3928,15 @@ class PlayRespawnS2C(Packet):
 		self.death_dimension_name = death_dimension_name # Name of the dimension the player died in.
 		self.death_location = death_location # The location that the player died at.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_string(self.dimension_type)
-		b.write_string(self.dimension_name)
-		b.write_long(self.hashed_seed)
-		b.write_ubyte(self.gamemode)
-		b.write_byte(self.previous_gamemode)
-		b.write_bool(self.is_debug)
-		b.write_bool(self.is_flat)
-		b.write_bool(self.copy_metadata)
-		b.write_bool(self.has_death_location)
-		if self.has_death_location:
-			assert self.death_dimension_name is not None
-			assert self.death_location is not None
-			b.write_string(self.death_dimension_name)
-			b.write_pos_1_14(self.death_location)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		dimension_type = r.read_string()
-		dimension_name = r.read_string()
-		hashed_seed = r.read_long()
-		gamemode = r.read_ubyte()
-		previous_gamemode = r.read_byte()
-		is_debug = r.read_bool()
-		is_flat = r.read_bool()
-		copy_metadata = r.read_bool()
-		has_death_location = r.read_bool()
-		if has_death_location:
-			death_dimension_name = r.read_string()
-			death_location = r.read_pos_1_14()
-		else:
-			death_dimension_name = None
-			death_location = None
-		return cls(dimension_type, dimension_name, hashed_seed, gamemode, previous_gamemode, is_debug, is_flat, copy_metadata, has_death_location, death_dimension_name, death_location)
-
 @final
 class PlaySetHeadRotationS2C(Packet):
+	__slots__ = ('entity_id', 'head_yaw')
+
+	FIELDS = (
+		('entity_id', VARINT),
+		('head_yaw', ANGLE),
+	)
+
 	def __init__(self,
 		entity_id: int, # VarInt
 		head_yaw: int, # Angle
@@ -3909,18 +3944,15 @@ class PlaySetHeadRotationS2C(Packet):
 		self.entity_id = entity_id # 
 		self.head_yaw = head_yaw # New angle, not a delta.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_varint(self.entity_id)
-		b.write_byte(self.head_yaw)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		entity_id = r.read_varint()
-		head_yaw = r.read_byte()
-		return cls(entity_id, head_yaw)
-
 @final
 class PlayUpdateSectionBlocksS2C(Packet):
+	__slots__ = ('chunk_section_position', 'suppress_light_updates', 'blocks')
+
+	HEAD_FIELDS = (
+		('chunk_section_position', LONG),
+		('suppress_light_updates', BOOL),
+	)
+
 	def __init__(self,
 		chunk_section_position: int, # Long
 		suppress_light_updates: bool, # Boolean
@@ -3946,6 +3978,13 @@ class PlayUpdateSectionBlocksS2C(Packet):
 
 @final
 class PlaySelectAdvancementsTabS2C(Packet):
+	__slots__ = ('has_id', 'optional_identifier')
+
+	FIELDS = (
+		('has_id', BOOL),
+		('optional_identifier', STRING),
+	)
+
 	def __init__(self,
 		has_id: bool, # Boolean
 		optional_identifier: str, # Identifier
@@ -3953,18 +3992,14 @@ class PlaySelectAdvancementsTabS2C(Packet):
 		self.has_id = has_id # Indicates if the next field is present.
 		self.optional_identifier = optional_identifier # See below.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_bool(self.has_id)
-		b.write_string(self.optional_identifier)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		has_id = r.read_bool()
-		optional_identifier = r.read_string()
-		return cls(has_id, optional_identifier)
-
 @final
 class PlayServerDataS2C(Packet):
+	__slots__ = ('has_motd', 'motd', 'has_icon', 'icon', 'enforces_secure_chat')
+
+	HEAD_FIELDS = (
+		('has_motd', BOOL),
+	)
+
 	def __init__(self,
 		has_motd: bool, # Boolean
 		motd: dict | None, # Optional Chat
@@ -4000,21 +4035,26 @@ class PlayServerDataS2C(Packet):
 
 @final
 class PlaySetActionBarTextS2C(Packet):
+	__slots__ = ('action_bar_text',)
+
+	FIELDS = (
+		('action_bar_text', JSON),
+	)
+
 	def __init__(self,
 		action_bar_text: dict, # Chat
 	):
 		self.action_bar_text = action_bar_text # Displays a message above the hotbar (the same as position 2 in Player Chat Message.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_json(self.action_bar_text)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		action_bar_text = r.read_json()
-		return cls(action_bar_text)
-
 @final
 class PlaySetBorderCenterS2C(Packet):
+	__slots__ = ('x', 'z')
+
+	FIELDS = (
+		('x', DOUBLE),
+		('z', DOUBLE),
+	)
+
 	def __init__(self,
 		x: float, # Double
 		z: float, # Double
@@ -4022,18 +4062,16 @@ class PlaySetBorderCenterS2C(Packet):
 		self.x = x # 
 		self.z = z # 
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_double(self.x)
-		b.write_double(self.z)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		x = r.read_double()
-		z = r.read_double()
-		return cls(x, z)
-
 @final
 class PlaySetBorderLerpSizeS2C(Packet):
+	__slots__ = ('old_diameter', 'new_diameter', 'speed')
+
+	FIELDS = (
+		('old_diameter', DOUBLE),
+		('new_diameter', DOUBLE),
+		('speed', VARLONG),
+	)
+
 	def __init__(self,
 		old_diameter: float, # Double
 		new_diameter: float, # Double
@@ -4043,95 +4081,80 @@ class PlaySetBorderLerpSizeS2C(Packet):
 		self.new_diameter = new_diameter # Target length of a single side of the world border, in meters.
 		self.speed = speed # Number of real-time milliseconds until New Diameter is reached. It appears that Notchian server does not sync world border speed to game ticks, so it gets out of sync with server lag. If the world border is not moving, this is set to 0.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_double(self.old_diameter)
-		b.write_double(self.new_diameter)
-		b.write_varlong(self.speed)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		old_diameter = r.read_double()
-		new_diameter = r.read_double()
-		speed = r.read_varlong()
-		return cls(old_diameter, new_diameter, speed)
-
 @final
 class PlaySetBorderSizeS2C(Packet):
+	__slots__ = ('diameter',)
+
+	FIELDS = (
+		('diameter', DOUBLE),
+	)
+
 	def __init__(self,
 		diameter: float, # Double
 	):
 		self.diameter = diameter # Length of a single side of the world border, in meters.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_double(self.diameter)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		diameter = r.read_double()
-		return cls(diameter)
-
 @final
 class PlaySetBorderWarningDelayS2C(Packet):
+	__slots__ = ('warning_time',)
+
+	FIELDS = (
+		('warning_time', VARINT),
+	)
+
 	def __init__(self,
 		warning_time: int, # VarInt
 	):
 		self.warning_time = warning_time # In seconds as set by /worldborder warning time.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_varint(self.warning_time)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		warning_time = r.read_varint()
-		return cls(warning_time)
-
 @final
 class PlaySetBorderWarningDistanceS2C(Packet):
+	__slots__ = ('warning_blocks',)
+
+	FIELDS = (
+		('warning_blocks', VARINT),
+	)
+
 	def __init__(self,
 		warning_blocks: int, # VarInt
 	):
 		self.warning_blocks = warning_blocks # In meters.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_varint(self.warning_blocks)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		warning_blocks = r.read_varint()
-		return cls(warning_blocks)
-
 @final
 class PlaySetCameraS2C(Packet):
+	__slots__ = ('camera_id',)
+
+	FIELDS = (
+		('camera_id', VARINT),
+	)
+
 	def __init__(self,
 		camera_id: int, # VarInt
 	):
 		self.camera_id = camera_id # ID of the entity to set the client's camera to.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_varint(self.camera_id)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		camera_id = r.read_varint()
-		return cls(camera_id)
-
 @final
 class PlaySetHeldItemS2C(Packet):
+	__slots__ = ('slot',)
+
+	FIELDS = (
+		('slot', BYTE),
+	)
+
 	def __init__(self,
 		slot: int, # Byte
 	):
 		self.slot = slot # The slot which the player has selected (0–8).
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_byte(self.slot)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		slot = r.read_byte()
-		return cls(slot)
-
 @final
 class PlaySetCenterChunkS2C(Packet):
+	__slots__ = ('chunk_x', 'chunk_z')
+
+	FIELDS = (
+		('chunk_x', VARINT),
+		('chunk_z', VARINT),
+	)
+
 	def __init__(self,
 		chunk_x: int, # VarInt
 		chunk_z: int, # VarInt
@@ -4139,33 +4162,28 @@ class PlaySetCenterChunkS2C(Packet):
 		self.chunk_x = chunk_x # Chunk X coordinate of the player's position.
 		self.chunk_z = chunk_z # Chunk Z coordinate of the player's position.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_varint(self.chunk_x)
-		b.write_varint(self.chunk_z)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		chunk_x = r.read_varint()
-		chunk_z = r.read_varint()
-		return cls(chunk_x, chunk_z)
-
 @final
 class PlaySetRenderDistanceS2C(Packet):
+	__slots__ = ('view_distance',)
+
+	FIELDS = (
+		('view_distance', VARINT),
+	)
+
 	def __init__(self,
 		view_distance: int, # VarInt
 	):
 		self.view_distance = view_distance # Render distance (2-32).
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_varint(self.view_distance)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		view_distance = r.read_varint()
-		return cls(view_distance)
-
 @final
 class PlaySetDefaultSpawnPositionS2C(Packet):
+	__slots__ = ('location', 'angle')
+
+	FIELDS = (
+		('location', POSITION),
+		('angle', FLOAT),
+	)
+
 	def __init__(self,
 		location: tuple[int, int, int], # Position
 		angle: float, # Float
@@ -4173,18 +4191,15 @@ class PlaySetDefaultSpawnPositionS2C(Packet):
 		self.location = location # Spawn location.
 		self.angle = angle # The angle at which to respawn at.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_pos_1_14(self.location)
-		b.write_float(self.angle)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		location = r.read_pos_1_14()
-		angle = r.read_float()
-		return cls(location, angle)
-
 @final
 class PlayDisplayObjectiveS2C(Packet):
+	__slots__ = ('position', 'score_name')
+
+	FIELDS = (
+		('position', BYTE),
+		('score_name', STRING),
+	)
+
 	def __init__(self,
 		position: int, # Byte
 		score_name: str, # String (16)
@@ -4192,18 +4207,10 @@ class PlayDisplayObjectiveS2C(Packet):
 		self.position = position # The position of the scoreboard. 0: list, 1: sidebar, 2: below name, 3 - 18: team specific sidebar, indexed as 3 + team color.
 		self.score_name = score_name # The unique name for the scoreboard to be displayed.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_byte(self.position)
-		b.write_string(self.score_name)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		position = r.read_byte()
-		score_name = r.read_string()
-		return cls(position, score_name)
-
 @final
 class PlaySetEntityMetadataS2C(Packet):
+	__slots__ = ('entity_id', 'metadata')
+
 	def __init__(self,
 		entity_id: int, # VarInt
 		metadata: EntityMetadata, # Entity Metadata
@@ -4216,13 +4223,20 @@ class PlaySetEntityMetadataS2C(Packet):
 		self.metadata.to_bytes(b)
 
 	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
+	def parse_from(cls, r: PacketReader, *, passthrough: bool = False) -> Self:
 		entity_id = r.read_varint()
-		metadata = EntityMetadata.parse_from(r)
+		metadata = EntityMetadata.parse_from(r, passthrough=passthrough)
 		return cls(entity_id, metadata)
 
 @final
 class PlayLinkEntitiesS2C(Packet):
+	__slots__ = ('attached_entity_id', 'holding_entity_id')
+
+	FIELDS = (
+		('attached_entity_id', INT),
+		('holding_entity_id', INT),
+	)
+
 	def __init__(self,
 		attached_entity_id: int, # Int
 		holding_entity_id: int, # Int
@@ -4230,18 +4244,17 @@ class PlayLinkEntitiesS2C(Packet):
 		self.attached_entity_id = attached_entity_id # Attached entity's EID.
 		self.holding_entity_id = holding_entity_id # ID of the entity holding the lead. Set to -1 to detach.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_int(self.attached_entity_id)
-		b.write_int(self.holding_entity_id)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		attached_entity_id = r.read_int()
-		holding_entity_id = r.read_int()
-		return cls(attached_entity_id, holding_entity_id)
-
 @final
 class PlaySetEntityVelocityS2C(Packet):
+	__slots__ = ('entity_id', 'velocity_x', 'velocity_y', 'velocity_z')
+
+	FIELDS = (
+		('entity_id', VARINT),
+		('velocity_x', SHORT),
+		('velocity_y', SHORT),
+		('velocity_z', SHORT),
+	)
+
 	def __init__(self,
 		entity_id: int, # VarInt
 		velocity_x: int, # Short
@@ -4253,22 +4266,14 @@ class PlaySetEntityVelocityS2C(Packet):
 		self.velocity_y = velocity_y # Velocity on the Y axis.
 		self.velocity_z = velocity_z # Velocity on the Z axis.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_varint(self.entity_id)
-		b.write_short(self.velocity_x)
-		b.write_short(self.velocity_y)
-		b.write_short(self.velocity_z)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		entity_id = r.read_varint()
-		velocity_x = r.read_short()
-		velocity_y = r.read_short()
-		velocity_z = r.read_short()
-		return cls(entity_id, velocity_x, velocity_y, velocity_z)
-
 @final
 class PlaySetEquipmentS2C(Packet):
+	__slots__ = ('entity_id', 'equipments')
+
+	HEAD_FIELDS = (
+		('entity_id', VARINT),
+	)
+
 	def __init__(self,
 		entity_id: int, # VarInt
 		equipments: list[
@@ -4299,6 +4304,14 @@ class PlaySetEquipmentS2C(Packet):
 
 @final
 class PlaySetExperienceS2C(Packet):
+	__slots__ = ('experience_bar', 'total_experience', 'level')
+
+	FIELDS = (
+		('experience_bar', FLOAT),
+		('total_experience', VARINT),
+		('level', VARINT),
+	)
+
 	def __init__(self,
 		experience_bar: float, # Float
 		total_experience: int, # VarInt
@@ -4308,20 +4321,16 @@ class PlaySetExperienceS2C(Packet):
 		self.total_experience = total_experience # See Experience#Leveling up on the Minecraft Wiki for Total Experience to Level conversion.
 		self.level = level # 
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_float(self.experience_bar)
-		b.write_varint(self.total_experience)
-		b.write_varint(self.level)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		experience_bar = r.read_float()
-		total_experience = r.read_varint()
-		level = r.read_varint()
-		return cls(experience_bar, total_experience, level)
-
 @final
 class PlaySetHealthS2C(Packet):
+	__slots__ = ('health', 'food', 'food_saturation')
+
+	FIELDS = (
+		('health', FLOAT),
+		('food', VARINT),
+		('food_saturation', FLOAT),
+	)
+
 	def __init__(self,
 		health: float, # Float
 		food: int, # VarInt
@@ -4331,20 +4340,15 @@ class PlaySetHealthS2C(Packet):
 		self.food = food # 0–20.
 		self.food_saturation = food_saturation # Seems to vary from 0.0 to 5.0 in integer increments.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_float(self.health)
-		b.write_varint(self.food)
-		b.write_float(self.food_saturation)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		health = r.read_float()
-		food = r.read_varint()
-		food_saturation = r.read_float()
-		return cls(health, food, food_saturation)
-
 @final
 class PlayUpdateObjectivesS2C(Packet):
+	__slots__ = ('objective_name', 'mode', 'objective_value', 'type')
+
+	HEAD_FIELDS = (
+		('objective_name', STRING),
+		('mode', BYTE),
+	)
+
 	def __init__(self,
 		objective_name: str, # String (16)
 		mode: int, # Byte
@@ -4379,6 +4383,12 @@ class PlayUpdateObjectivesS2C(Packet):
 
 @final
 class PlaySetPassengersS2C(Packet):
+	__slots__ = ('entity_id', 'passengers')
+
+	HEAD_FIELDS = (
+		('entity_id', VARINT),
+	)
+
 	def __init__(self,
 		entity_id: int, # VarInt
 		passengers: list[int], # Array of VarInt
@@ -4403,6 +4413,13 @@ class PlaySetPassengersS2C(Packet):
 
 @final
 class PlayUpdateTeamsS2C(Packet):
+	__slots__ = ('team_name', 'mode', 'team_display_name', 'friendly_flags', 'name_tag_visibility', 'collision_rule', 'team_color', 'team_prefix', 'team_suffix', 'entities')
+
+	HEAD_FIELDS = (
+		('team_name', STRING),
+		('mode', BYTE),
+	)
+
 	def __init__(self,
 		team_name: str, # String (16)
 		mode: int, # Byte
@@ -4481,6 +4498,14 @@ class PlayUpdateTeamsS2C(Packet):
 
 @final
 class PlayUpdateScoreS2C(Packet):
+	__slots__ = ('entity_name', 'action', 'objective_name', 'value')
+
+	HEAD_FIELDS = (
+		('entity_name', STRING),
+		('action', VARINT),
+		('objective_name', STRING),
+	)
+
 	def __init__(self,
 		entity_name: str, # String (40)
 		action: int, # VarInt Enum
@@ -4510,36 +4535,39 @@ class PlayUpdateScoreS2C(Packet):
 
 @final
 class PlaySetSimulationDistanceS2C(Packet):
+	__slots__ = ('simulation_distance',)
+
+	FIELDS = (
+		('simulation_distance', VARINT),
+	)
+
 	def __init__(self,
 		simulation_distance: int, # VarInt
 	):
 		self.simulation_distance = simulation_distance # The distance that the client will process specific things, such as entities.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_varint(self.simulation_distance)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		simulation_distance = r.read_varint()
-		return cls(simulation_distance)
-
 @final
 class PlaySetSubtitleTextS2C(Packet):
+	__slots__ = ('subtitle_text',)
+
+	FIELDS = (
+		('subtitle_text', JSON),
+	)
+
 	def __init__(self,
 		subtitle_text: dict, # Chat
 	):
 		self.subtitle_text = subtitle_text # 
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_json(self.subtitle_text)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		subtitle_text = r.read_json()
-		return cls(subtitle_text)
-
 @final
 class PlayUpdateTimeS2C(Packet):
+	__slots__ = ('world_age', 'time_of_day')
+
+	FIELDS = (
+		('world_age', LONG),
+		('time_of_day', LONG),
+	)
+
 	def __init__(self,
 		world_age: int, # Long
 		time_of_day: int, # Long
@@ -4547,33 +4575,29 @@ class PlayUpdateTimeS2C(Packet):
 		self.world_age = world_age # In ticks; not changed by server commands.
 		self.time_of_day = time_of_day # The world (or region) time, in ticks. If negative the sun will stop moving at the Math.abs of the time.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_long(self.world_age)
-		b.write_long(self.time_of_day)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		world_age = r.read_long()
-		time_of_day = r.read_long()
-		return cls(world_age, time_of_day)
-
 @final
 class PlaySetTitleTextS2C(Packet):
+	__slots__ = ('title_text',)
+
+	FIELDS = (
+		('title_text', JSON),
+	)
+
 	def __init__(self,
 		title_text: dict, # Chat
 	):
 		self.title_text = title_text # 
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_json(self.title_text)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		title_text = r.read_json()
-		return cls(title_text)
-
 @final
 class PlaySetTitleAnimationTimesS2C(Packet):
+	__slots__ = ('fade_in', 'stay', 'fade_out')
+
+	FIELDS = (
+		('fade_in', INT),
+		('stay', INT),
+		('fade_out', INT),
+	)
+
 	def __init__(self,
 		fade_in: int, # Int
 		stay: int, # Int
@@ -4583,20 +4607,14 @@ class PlaySetTitleAnimationTimesS2C(Packet):
 		self.stay = stay # Ticks to keep the title displayed.
 		self.fade_out = fade_out # Ticks to spend fading out, not when to start fading out.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_int(self.fade_in)
-		b.write_int(self.stay)
-		b.write_int(self.fade_out)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		fade_in = r.read_int()
-		stay = r.read_int()
-		fade_out = r.read_int()
-		return cls(fade_in, stay, fade_out)
-
 @final
 class PlayEntitySoundEffectS2C(Packet):
+	__slots__ = ('sound_id', 'sound_name', 'has_fixed_range', 'range', 'sound_category', 'entity_id', 'volume', 'pitch', 'seed')
+
+	HEAD_FIELDS = (
+		('sound_id', VARINT),
+	)
+
 	def __init__(self,
 		sound_id: int, # VarInt
 		sound_name: str | None, # Optional Identifier
@@ -4657,6 +4675,12 @@ class PlayEntitySoundEffectS2C(Packet):
 
 @final
 class PlaySoundEffectS2C(Packet):
+	__slots__ = ('sound_id', 'sound_name', 'has_fixed_range', 'range', 'sound_category', 'effect_position_x', 'effect_position_y', 'effect_position_z', 'volume', 'pitch', 'seed')
+
+	HEAD_FIELDS = (
+		('sound_id', VARINT),
+	)
+
 	def __init__(self,
 		sound_id: int, # VarInt
 		sound_name: str | None, # Optional Identifier
@@ -4725,6 +4749,12 @@ class PlaySoundEffectS2C(Packet):
 
 @final
 class PlayStopSoundS2C(Packet):
+	__slots__ = ('flags', 'source', 'sound')
+
+	HEAD_FIELDS = (
+		('flags', BYTE),
+	)
+
 	def __init__(self,
 		flags: int, # Byte
 		source: int | None, # Optional VarInt Enum
@@ -4752,6 +4782,13 @@ class PlayStopSoundS2C(Packet):
 
 @final
 class PlaySystemChatMessageS2C(Packet):
+	__slots__ = ('content', 'overlay')
+
+	FIELDS = (
+		('content', JSON),
+		('overlay', BOOL),
+	)
+
 	def __init__(self,
 		content: dict, # Chat
 		overlay: bool, # Boolean
@@ -4759,18 +4796,15 @@ class PlaySystemChatMessageS2C(Packet):
 		self.content = content # Limited to 262144 bytes.
 		self.overlay = overlay # Whether the message is an actionbar or chat message.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_json(self.content)
-		b.write_bool(self.overlay)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		content = r.read_json()
-		overlay = r.read_bool()
-		return cls(content, overlay)
-
 @final
 class PlaySetTabListHeaderAndFooterS2C(Packet):
+	__slots__ = ('header', 'footer')
+
+	FIELDS = (
+		('header', JSON),
+		('footer', JSON),
+	)
+
 	def __init__(self,
 		header: dict, # Chat
 		footer: dict, # Chat
@@ -4778,18 +4812,14 @@ class PlaySetTabListHeaderAndFooterS2C(Packet):
 		self.header = header # To remove the header, send a empty text component: {"text":""}.
 		self.footer = footer # To remove the footer, send a empty text component: {"text":""}.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_json(self.header)
-		b.write_json(self.footer)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		header = r.read_json()
-		footer = r.read_json()
-		return cls(header, footer)
-
 @final
 class PlayTagQueryResponseS2C(Packet):
+	__slots__ = ('transaction_id', 'nbt')
+
+	HEAD_FIELDS = (
+		('transaction_id', VARINT),
+	)
+
 	def __init__(self,
 		transaction_id: int, # VarInt
 		nbt: NBT, # NBT Tag
@@ -4809,6 +4839,14 @@ class PlayTagQueryResponseS2C(Packet):
 
 @final
 class PlayPickupItemS2C(Packet):
+	__slots__ = ('collected_entity_id', 'collector_entity_id', 'pickup_item_count')
+
+	FIELDS = (
+		('collected_entity_id', VARINT),
+		('collector_entity_id', VARINT),
+		('pickup_item_count', VARINT),
+	)
+
 	def __init__(self,
 		collected_entity_id: int, # VarInt
 		collector_entity_id: int, # VarInt
@@ -4818,20 +4856,20 @@ class PlayPickupItemS2C(Packet):
 		self.collector_entity_id = collector_entity_id # 
 		self.pickup_item_count = pickup_item_count # Seems to be 1 for XP orbs, otherwise the number of items in the stack.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_varint(self.collected_entity_id)
-		b.write_varint(self.collector_entity_id)
-		b.write_varint(self.pickup_item_count)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		collected_entity_id = r.read_varint()
-		collector_entity_id = r.read_varint()
-		pickup_item_count = r.read_varint()
-		return cls(collected_entity_id, collector_entity_id, pickup_item_count)
-
 @final
 class PlayTeleportEntityS2C(Packet):
+	__slots__ = ('entity_id', 'x', 'y', 'z', 'yaw', 'pitch', 'on_ground')
+
+	FIELDS = (
+		('entity_id', VARINT),
+		('x', DOUBLE),
+		('y', DOUBLE),
+		('z', DOUBLE),
+		('yaw', ANGLE),
+		('pitch', ANGLE),
+		('on_ground', BOOL),
+	)
+
 	def __init__(self,
 		entity_id: int, # VarInt
 		x: float, # Double
@@ -4849,28 +4887,14 @@ class PlayTeleportEntityS2C(Packet):
 		self.pitch = pitch # (X Rot)New angle, not a delta.
 		self.on_ground = on_ground # 
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_varint(self.entity_id)
-		b.write_double(self.x)
-		b.write_double(self.y)
-		b.write_double(self.z)
-		b.write_byte(self.yaw)
-		b.write_byte(self.pitch)
-		b.write_bool(self.on_ground)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		entity_id = r.read_varint()
-		x = r.read_double()
-		y = r.read_double()
-		z = r.read_double()
-		yaw = r.read_byte()
-		pitch = r.read_byte()
-		on_ground = r.read_bool()
-		return cls(entity_id, x, y, z, yaw, pitch, on_ground)
-
 @final
 class PlayUpdateAdvancementsS2C(Packet):
+	__slots__ = ('reset_clear', 'advancement_mapping', 'identifiers', 'progress_mapping')
+
+	HEAD_FIELDS = (
+		('reset_clear', BOOL),
+	)
+
 	def __init__(self,
 		reset_clear: bool, # Boolean
 		advancement_mapping: dict[
@@ -4923,6 +4947,12 @@ class PlayUpdateAdvancementsS2C(Packet):
 
 @final
 class PlayUpdateAttributesS2C(Packet):
+	__slots__ = ('entity_id', 'properties')
+
+	HEAD_FIELDS = (
+		('entity_id', VARINT),
+	)
+
 	def __init__(self,
 		entity_id: int, # VarInt
 		properties: list[
@@ -4957,6 +4987,8 @@ class PlayUpdateAttributesS2C(Packet):
 
 @final
 class PlayFeatureFlagsS2C(Packet):
+	__slots__ = ('feature_flags',)
+
 	def __init__(self,
 		feature_flags: list[str], # Identifier Array
 	):
@@ -4977,6 +5009,17 @@ class PlayFeatureFlagsS2C(Packet):
 
 @final
 class PlayEntityEffectS2C(Packet):
+	__slots__ = ('entity_id', 'effect_id', 'amplifier', 'duration', 'flags', 'has_factor_data', 'factor_codec')
+
+	HEAD_FIELDS = (
+		('entity_id', VARINT),
+		('effect_id', VARINT),
+		('amplifier', BYTE),
+		('duration', VARINT),
+		('flags', BYTE),
+		('has_factor_data', BOOL),
+	)
+
 	def __init__(self,
 		entity_id: int, # VarInt
 		effect_id: int, # VarInt
@@ -5016,6 +5059,8 @@ class PlayEntityEffectS2C(Packet):
 
 @final
 class PlayUpdateRecipesS2C(Packet):
+	__slots__ = ('recipes',)
+
 	def __init__(self,
 		recipes: list[Recipe], # Array of Recipe
 	):
@@ -5036,6 +5081,8 @@ class PlayUpdateRecipesS2C(Packet):
 
 @final
 class PlayUpdateTagsS2C(Packet):
+	__slots__ = ('array_of_tags',)
+
 	def __init__(self,
 		array_of_tags: list[
 			tuple[
@@ -5068,21 +5115,26 @@ class PlayUpdateTagsS2C(Packet):
 
 @final
 class PlayConfirmTeleportationC2S(Packet):
+	__slots__ = ('teleport_id',)
+
+	FIELDS = (
+		('teleport_id', VARINT),
+	)
+
 	def __init__(self,
 		teleport_id: int, # VarInt
 	):
 		self.teleport_id = teleport_id # The ID given by the Synchronize Player Position packet.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_varint(self.teleport_id)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		teleport_id = r.read_varint()
-		return cls(teleport_id)
-
 @final
 class PlayQueryBlockEntityTagC2S(Packet):
+	__slots__ = ('transaction_id', 'location')
+
+	FIELDS = (
+		('transaction_id', VARINT),
+		('location', POSITION),
+	)
+
 	def __init__(self,
 		transaction_id: int, # VarInt
 		location: tuple[int, int, int], # Position
@@ -5090,48 +5142,42 @@ class PlayQueryBlockEntityTagC2S(Packet):
 		self.transaction_id = transaction_id # An incremental ID so that the client can verify that the response matches.
 		self.location = location # The location of the block to check.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_varint(self.transaction_id)
-		b.write_pos_1_14(self.location)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		transaction_id = r.read_varint()
-		location = r.read_pos_1_14()
-		return cls(transaction_id, location)
-
 @final
 class PlayChangeDifficultyC2S(Packet):
+	__slots__ = ('new_difficulty',)
+
+	FIELDS = (
+		('new_difficulty', BYTE),
+	)
+
 	def __init__(self,
 		new_difficulty: int, # Byte
 	):
 		self.new_difficulty = new_difficulty # 0: peaceful, 1: easy, 2: normal, 3: hard .
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_byte(self.new_difficulty)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		new_difficulty = r.read_byte()
-		return cls(new_difficulty)
-
 @final
 class PlayMessageAcknowledgmentC2S(Packet):
+	__slots__ = ('message_count',)
+
+	FIELDS = (
+		('message_count', VARINT),
+	)
+
 	def __init__(self,
 		message_count: int, # VarInt
 	):
 		self.message_count = message_count # 
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_varint(self.message_count)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		message_count = r.read_varint()
-		return cls(message_count)
-
 @final
 class PlayChatCommandC2S(Packet):
+	__slots__ = ('command', 'timestamp', 'salt', 'array_of_argument_signatures', 'message_count', 'acknowledged')
+
+	HEAD_FIELDS = (
+		('command', STRING),
+		('timestamp', LONG),
+		('salt', LONG),
+	)
+
 	def __init__(self,
 		command: str, # String (256)
 		timestamp: int, # Long
@@ -5180,6 +5226,15 @@ class PlayChatCommandC2S(Packet):
 
 @final
 class PlayChatMessageC2S(Packet):
+	__slots__ = ('message', 'timestamp', 'salt', 'has_signature', 'signature', 'message_count', 'acknowledged')
+
+	HEAD_FIELDS = (
+		('message', STRING),
+		('timestamp', LONG),
+		('salt', LONG),
+		('has_signature', BOOL),
+	)
+
 	def __init__(self,
 		message: str, # String (256 chars)
 		timestamp: int, # Long
@@ -5222,21 +5277,32 @@ class PlayChatMessageC2S(Packet):
 
 @final
 class PlayClientCommandC2S(Packet):
+	__slots__ = ('action_id',)
+
+	FIELDS = (
+		('action_id', VARINT),
+	)
+
 	def __init__(self,
 		action_id: int, # VarInt Enum
 	):
 		self.action_id = action_id # See below
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_varint(self.action_id)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		action_id = r.read_varint()
-		return cls(action_id)
-
 @final
 class PlayClientInformationC2S(Packet):
+	__slots__ = ('locale', 'view_distance', 'chat_mode', 'chat_colors', 'displayed_skin_parts', 'main_hand', 'enable_text_filtering', 'allow_server_listings')
+
+	FIELDS = (
+		('locale', STRING),
+		('view_distance', BYTE),
+		('chat_mode', VARINT),
+		('chat_colors', BOOL),
+		('displayed_skin_parts', UBYTE),
+		('main_hand', VARINT),
+		('enable_text_filtering', BOOL),
+		('allow_server_listings', BOOL),
+	)
+
 	def __init__(self,
 		locale: str, # String (16)
 		view_distance: int, # Byte
@@ -5256,30 +5322,15 @@ class PlayClientInformationC2S(Packet):
 		self.enable_text_filtering = enable_text_filtering # Enables filtering of text on signs and written book titles. Currently always false (i.e. the filtering is disabled)
 		self.allow_server_listings = allow_server_listings # Servers usually list online players, this option should let you not show up in that list.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_string(self.locale)
-		b.write_byte(self.view_distance)
-		b.write_varint(self.chat_mode)
-		b.write_bool(self.chat_colors)
-		b.write_ubyte(self.displayed_skin_parts)
-		b.write_varint(self.main_hand)
-		b.write_bool(self.enable_text_filtering)
-		b.write_bool(self.allow_server_listings)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		locale = r.read_string()
-		view_distance = r.read_byte()
-		chat_mode = r.read_varint()
-		chat_colors = r.read_bool()
-		displayed_skin_parts = r.read_ubyte()
-		main_hand = r.read_varint()
-		enable_text_filtering = r.read_bool()
-		allow_server_listings = r.read_bool()
-		return cls(locale, view_distance, chat_mode, chat_colors, displayed_skin_parts, main_hand, enable_text_filtering, allow_server_listings)
-
 @final
 class PlayCommandSuggestionsRequestC2S(Packet):
+	__slots__ = ('transaction_id', 'text')
+
+	FIELDS = (
+		('transaction_id', VARINT),
+		('text', STRING),
+	)
+
 	def __init__(self,
 		transaction_id: int, # VarInt
 		text: str, # String (32500)
@@ -5287,18 +5338,15 @@ class PlayCommandSuggestionsRequestC2S(Packet):
 		self.transaction_id = transaction_id # The id of the transaction that the server will send back to the client in the response of this packet. Client generates this and increments it each time it sends another tab completion that doesn't get a response.
 		self.text = text # All text behind the cursor without the / (e.g. to the left of the cursor in left-to-right languages like English).
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_varint(self.transaction_id)
-		b.write_string(self.text)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		transaction_id = r.read_varint()
-		text = r.read_string()
-		return cls(transaction_id, text)
-
 @final
 class PlayClickContainerButtonC2S(Packet):
+	__slots__ = ('window_id', 'button_id')
+
+	FIELDS = (
+		('window_id', BYTE),
+		('button_id', BYTE),
+	)
+
 	def __init__(self,
 		window_id: int, # Byte
 		button_id: int, # Byte
@@ -5306,18 +5354,18 @@ class PlayClickContainerButtonC2S(Packet):
 		self.window_id = window_id # The ID of the window sent by Open Screen.
 		self.button_id = button_id # Meaning depends on window type; see below.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_byte(self.window_id)
-		b.write_byte(self.button_id)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		window_id = r.read_byte()
-		button_id = r.read_byte()
-		return cls(window_id, button_id)
-
 @final
 class PlayClickContainerC2S(Packet):
+	__slots__ = ('window_id', 'state_id', 'slot', 'button', 'mode', 'array_of_slots', 'carried_item')
+
+	HEAD_FIELDS = (
+		('window_id', UBYTE),
+		('state_id', VARINT),
+		('slot', SHORT),
+		('button', BYTE),
+		('mode', VARINT),
+	)
+
 	def __init__(self,
 		window_id: int, # Unsigned Byte
 		state_id: int, # VarInt
@@ -5369,21 +5417,26 @@ class PlayClickContainerC2S(Packet):
 
 @final
 class PlayCloseContainerC2S(Packet):
+	__slots__ = ('window_id',)
+
+	FIELDS = (
+		('window_id', UBYTE),
+	)
+
 	def __init__(self,
 		window_id: int, # Unsigned Byte
 	):
 		self.window_id = window_id # This is the ID of the window that was closed. 0 for player inventory.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_ubyte(self.window_id)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		window_id = r.read_ubyte()
-		return cls(window_id)
-
 @final
 class PlayPluginMessageC2S(Packet):
+	__slots__ = ('channel', 'data')
+
+	FIELDS = (
+		('channel', STRING),
+		('data', REST),
+	)
+
 	def __init__(self,
 		channel: str, # Identifier
 		data: bytes, # Byte Array (32767)
@@ -5391,18 +5444,14 @@ class PlayPluginMessageC2S(Packet):
 		self.channel = channel # Name of the plugin channel used to send the data.
 		self.data = data # Any data, depending on the channel. minecraft: channels are documented here. The length of this array must be inferred from the packet length.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_string(self.channel)
-		b.write(self.data)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		channel = r.read_string()
-		data = r.read()
-		return cls(channel, data)
-
 @final
 class PlayEditBookC2S(Packet):
+	__slots__ = ('slot', 'entries', 'has_title', 'title')
+
+	HEAD_FIELDS = (
+		('slot', VARINT),
+	)
+
 	def __init__(self,
 		slot: int, # VarInt
 		entries: list[list[str]], # Array of Strings (8192 chars)
@@ -5442,6 +5491,13 @@ class PlayEditBookC2S(Packet):
 
 @final
 class PlayQueryEntityTagC2S(Packet):
+	__slots__ = ('transaction_id', 'entity_id')
+
+	FIELDS = (
+		('transaction_id', VARINT),
+		('entity_id', VARINT),
+	)
+
 	def __init__(self,
 		transaction_id: int, # VarInt
 		entity_id: int, # VarInt
@@ -5449,18 +5505,15 @@ class PlayQueryEntityTagC2S(Packet):
 		self.transaction_id = transaction_id # An incremental ID so that the client can verify that the response matches.
 		self.entity_id = entity_id # The ID of the entity to query.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_varint(self.transaction_id)
-		b.write_varint(self.entity_id)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		transaction_id = r.read_varint()
-		entity_id = r.read_varint()
-		return cls(transaction_id, entity_id)
-
 @final
 class PlayInteractC2S(Packet):
+	__slots__ = ('entity_id', 'type', 'target_x', 'target_y', 'target_z', 'hand', 'sneaking')
+
+	HEAD_FIELDS = (
+		('entity_id', VARINT),
+		('type', VARINT),
+	)
+
 	def __init__(self,
 		entity_id: int, # VarInt
 		type: int, # VarInt Enum
@@ -5511,6 +5564,14 @@ class PlayInteractC2S(Packet):
 
 @final
 class PlayJigsawGenerateC2S(Packet):
+	__slots__ = ('location', 'levels', 'keep_jigsaws')
+
+	FIELDS = (
+		('location', POSITION),
+		('levels', VARINT),
+		('keep_jigsaws', BOOL),
+	)
+
 	def __init__(self,
 		location: tuple[int, int, int], # Position
 		levels: int, # VarInt
@@ -5520,50 +5581,43 @@ class PlayJigsawGenerateC2S(Packet):
 		self.levels = levels # Value of the levels slider/max depth to generate.
 		self.keep_jigsaws = keep_jigsaws # 
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_pos_1_14(self.location)
-		b.write_varint(self.levels)
-		b.write_bool(self.keep_jigsaws)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		location = r.read_pos_1_14()
-		levels = r.read_varint()
-		keep_jigsaws = r.read_bool()
-		return cls(location, levels, keep_jigsaws)
-
 @final
 class PlayKeepAliveC2S(Packet):
+	__slots__ = ('keep_alive_id',)
+
+	FIELDS = (
+		('keep_alive_id', LONG),
+	)
+
 	def __init__(self,
 		keep_alive_id: int, # Long
 	):
 		self.keep_alive_id = keep_alive_id # 
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_long(self.keep_alive_id)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		keep_alive_id = r.read_long()
-		return cls(keep_alive_id)
-
 @final
 class PlayLockDifficultyC2S(Packet):
+	__slots__ = ('locked',)
+
+	FIELDS = (
+		('locked', BOOL),
+	)
+
 	def __init__(self,
 		locked: bool, # Boolean
 	):
 		self.locked = locked # 
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_bool(self.locked)
+@final
+class PlaySetPlayerPositionC2S(Packet):
+	__slots__ = ('x', 'feet_y', 'z', 'on_ground')
 
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		locked = r.read_bool()
-		return cls(locked)
+	FIELDS = (
+		('x', DOUBLE),
+		('feet_y', DOUBLE),
+		('z', DOUBLE),
+		('on_ground', BOOL),
+	)
 
-@final
-class PlaySetPlayerPositionC2S(Packet):
 	def __init__(self,
 		x: float, # Double
 		feet_y: float, # Double
@@ -5575,22 +5629,19 @@ class PlaySetPlayerPositionC2S(Packet):
 		self.z = z # Absolute position.
 		self.on_ground = on_ground # True if the client is on the ground, false otherwise.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_double(self.x)
-		b.write_double(self.feet_y)
-		b.write_double(self.z)
-		b.write_bool(self.on_ground)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		x = r.read_double()
-		feet_y = r.read_double()
-		z = r.read_double()
-		on_ground = r.read_bool()
-		return cls(x, feet_y, z, on_ground)
-
 @final
 class PlaySetPlayerPositionandRotationC2S(Packet):
+	__slots__ = ('x', 'feet_y', 'z', 'yaw', 'pitch', 'on_ground')
+
+	FIELDS = (
+		('x', DOUBLE),
+		('feet_y', DOUBLE),
+		('z', DOUBLE),
+		('yaw', FLOAT),
+		('pitch', FLOAT),
+		('on_ground', BOOL),
+	)
+
 	def __init__(self,
 		x: float, # Double
 		feet_y: float, # Double
@@ -5606,26 +5657,16 @@ class PlaySetPlayerPositionandRotationC2S(Packet):
 		self.pitch = pitch # Absolute rotation on the Y Axis, in degrees.
 		self.on_ground = on_ground # True if the client is on the ground, false otherwise.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_double(self.x)
-		b.write_double(self.feet_y)
-		b.write_double(self.z)
-		b.write_float(self.yaw)
-		b.write_float(self.pitch)
-		b.write_bool(self.on_ground)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		x = r.read_double()
-		feet_y = r.read_double()
-		z = r.read_double()
-		yaw = r.read_float()
-		pitch = r.read_float()
-		on_ground = r.read_bool()
-		return cls(x, feet_y, z, yaw, pitch, on_ground)
-
 @final
 class PlaySetPlayerRotationC2S(Packet):
+	__slots__ = ('yaw', 'pitch', 'on_ground')
+
+	FIELDS = (
+		('yaw', FLOAT),
+		('pitch', FLOAT),
+		('on_ground', BOOL),
+	)
+
 	def __init__(self,
 		yaw: float, # Float
 		pitch: float, # Float
@@ -5635,35 +5676,31 @@ class PlaySetPlayerRotationC2S(Packet):
 		self.pitch = pitch # Absolute rotation on the Y Axis, in degrees.
 		self.on_ground = on_ground # True if the client is on the ground, false otherwise.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_float(self.yaw)
-		b.write_float(self.pitch)
-		b.write_bool(self.on_ground)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		yaw = r.read_float()
-		pitch = r.read_float()
-		on_ground = r.read_bool()
-		return cls(yaw, pitch, on_ground)
-
 @final
 class PlaySetPlayerOnGroundC2S(Packet):
+	__slots__ = ('on_ground',)
+
+	FIELDS = (
+		('on_ground', BOOL),
+	)
+
 	def __init__(self,
 		on_ground: bool, # Boolean
 	):
 		self.on_ground = on_ground # True if the client is on the ground, false otherwise.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_bool(self.on_ground)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		on_ground = r.read_bool()
-		return cls(on_ground)
-
 @final
 class PlayMoveVehicleC2S(Packet):
+	__slots__ = ('x', 'y', 'z', 'yaw', 'pitch')
+
+	FIELDS = (
+		('x', DOUBLE),
+		('y', DOUBLE),
+		('z', DOUBLE),
+		('yaw', FLOAT),
+		('pitch', FLOAT),
+	)
+
 	def __init__(self,
 		x: float, # Double
 		y: float, # Double
@@ -5677,24 +5714,15 @@ class PlayMoveVehicleC2S(Packet):
 		self.yaw = yaw # Absolute rotation on the vertical axis, in degrees.
 		self.pitch = pitch # Absolute rotation on the horizontal axis, in degrees.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_double(self.x)
-		b.write_double(self.y)
-		b.write_double(self.z)
-		b.write_float(self.yaw)
-		b.write_float(self.pitch)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		x = r.read_double()
-		y = r.read_double()
-		z = r.read_double()
-		yaw = r.read_float()
-		pitch = r.read_float()
-		return cls(x, y, z, yaw, pitch)
-
 @final
 class PlayPaddleBoatC2S(Packet):
+	__slots__ = ('left_paddle_turning', 'right_paddle_turning')
+
+	FIELDS = (
+		('left_paddle_turning', BOOL),
+		('right_paddle_turning', BOOL),
+	)
+
 	def __init__(self,
 		left_paddle_turning: bool, # Boolean
 		right_paddle_turning: bool, # Boolean
@@ -5702,33 +5730,29 @@ class PlayPaddleBoatC2S(Packet):
 		self.left_paddle_turning = left_paddle_turning # 
 		self.right_paddle_turning = right_paddle_turning # 
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_bool(self.left_paddle_turning)
-		b.write_bool(self.right_paddle_turning)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		left_paddle_turning = r.read_bool()
-		right_paddle_turning = r.read_bool()
-		return cls(left_paddle_turning, right_paddle_turning)
-
 @final
 class PlayPickItemC2S(Packet):
+	__slots__ = ('slot_to_use',)
+
+	FIELDS = (
+		('slot_to_use', VARINT),
+	)
+
 	def __init__(self,
 		slot_to_use: int, # VarInt
 	):
 		self.slot_to_use = slot_to_use # See Inventory.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_varint(self.slot_to_use)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		slot_to_use = r.read_varint()
-		return cls(slot_to_use)
-
 @final
 class PlayPlaceRecipeC2S(Packet):
+	__slots__ = ('window_id', 'recipe', 'make_all')
+
+	FIELDS = (
+		('window_id', BYTE),
+		('recipe', STRING),
+		('make_all', BOOL),
+	)
+
 	def __init__(self,
 		window_id: int, # Byte
 		recipe: str, # Identifier
@@ -5738,35 +5762,30 @@ class PlayPlaceRecipeC2S(Packet):
 		self.recipe = recipe # A recipe ID.
 		self.make_all = make_all # Affects the amount of items processed; true if shift is down when clicked.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_byte(self.window_id)
-		b.write_string(self.recipe)
-		b.write_bool(self.make_all)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		window_id = r.read_byte()
-		recipe = r.read_string()
-		make_all = r.read_bool()
-		return cls(window_id, recipe, make_all)
-
 @final
 class PlayerAbilitiesC2S(Packet):
+	__slots__ = ('flags',)
+
+	FIELDS = (
+		('flags', BYTE),
+	)
+
 	def __init__(self,
 		flags: int, # Byte
 	):
 		self.flags = flags # Bit mask. 0x02: is flying.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_byte(self.flags)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		flags = r.read_byte()
-		return cls(flags)
-
 @final
 class PlayerActionC2S(Packet):
+	__slots__ = ('status', 'location', 'face', 'sequence')
+
+	FIELDS = (
+		('status', VARINT),
+		('location', POSITION),
+		('face', BYTE),
+		('sequence', VARINT),
+	)
+
 	def __init__(self,
 		status: int, # VarInt Enum
 		location: tuple[int, int, int], # Position
@@ -5778,22 +5797,16 @@ class PlayerActionC2S(Packet):
 		self.face = face # The face being hit (see below).
 		self.sequence = sequence # 
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_varint(self.status)
-		b.write_pos_1_14(self.location)
-		b.write_byte(self.face)
-		b.write_varint(self.sequence)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		status = r.read_varint()
-		location = r.read_pos_1_14()
-		face = r.read_byte()
-		sequence = r.read_varint()
-		return cls(status, location, face, sequence)
-
 @final
 class PlayerCommandC2S(Packet):
+	__slots__ = ('entity_id', 'action_id', 'jump_boost')
+
+	FIELDS = (
+		('entity_id', VARINT),
+		('action_id', VARINT),
+		('jump_boost', VARINT),
+	)
+
 	def __init__(self,
 		entity_id: int, # VarInt
 		action_id: int, # VarInt Enum
@@ -5803,20 +5816,16 @@ class PlayerCommandC2S(Packet):
 		self.action_id = action_id # The ID of the action, see below.
 		self.jump_boost = jump_boost # Only used by the “start jump with horse” action, in which case it ranges from 0 to 100. In all other cases it is 0.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_varint(self.entity_id)
-		b.write_varint(self.action_id)
-		b.write_varint(self.jump_boost)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		entity_id = r.read_varint()
-		action_id = r.read_varint()
-		jump_boost = r.read_varint()
-		return cls(entity_id, action_id, jump_boost)
-
 @final
 class PlayerInputC2S(Packet):
+	__slots__ = ('sideways', 'forward', 'flags')
+
+	FIELDS = (
+		('sideways', FLOAT),
+		('forward', FLOAT),
+		('flags', UBYTE),
+	)
+
 	def __init__(self,
 		sideways: float, # Float
 		forward: float, # Float
@@ -5826,35 +5835,28 @@ class PlayerInputC2S(Packet):
 		self.forward = forward # Positive forward.
 		self.flags = flags # Bit mask. 0x1: jump, 0x2: unmount.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_float(self.sideways)
-		b.write_float(self.forward)
-		b.write_ubyte(self.flags)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		sideways = r.read_float()
-		forward = r.read_float()
-		flags = r.read_ubyte()
-		return cls(sideways, forward, flags)
-
 @final
 class PlayPongC2S(Packet):
+	__slots__ = ('id',)
+
+	FIELDS = (
+		('id', INT),
+	)
+
 	def __init__(self,
 		id: int, # Int
 	):
 		self.id = id # id is the same as the ping packet
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_int(self.id)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		id = r.read_int()
-		return cls(id)
-
 @final
 class PlayerSessionC2S(Packet):
+	__slots__ = ('session_id', 'expires_at', 'public_key', 'key_signature')
+
+	HEAD_FIELDS = (
+		('session_id', UUID),
+		('expires_at', LONG),
+	)
+
 	def __init__(self,
 		session_id: uuid.UUID, # UUID
 		expires_at: int, # Long
@@ -5884,6 +5886,14 @@ class PlayerSessionC2S(Packet):
 
 @final
 class PlayChangeRecipeBookSettingsC2S(Packet):
+	__slots__ = ('book_id', 'book_open', 'filter_active')
+
+	FIELDS = (
+		('book_id', VARINT),
+		('book_open', BOOL),
+		('filter_active', BOOL),
+	)
+
 	def __init__(self,
 		book_id: int, # VarInt Enum
 		book_open: bool, # Boolean
@@ -5893,65 +5903,53 @@ class PlayChangeRecipeBookSettingsC2S(Packet):
 		self.book_open = book_open # 
 		self.filter_active = filter_active # 
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_varint(self.book_id)
-		b.write_bool(self.book_open)
-		b.write_bool(self.filter_active)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		book_id = r.read_varint()
-		book_open = r.read_bool()
-		filter_active = r.read_bool()
-		return cls(book_id, book_open, filter_active)
-
 @final
 class PlaySetSeenRecipeC2S(Packet):
+	__slots__ = ('recipe_id',)
+
+	FIELDS = (
+		('recipe_id', STRING),
+	)
+
 	def __init__(self,
 		recipe_id: str, # Identifier
 	):
 		self.recipe_id = recipe_id # 
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_string(self.recipe_id)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		recipe_id = r.read_string()
-		return cls(recipe_id)
-
 @final
 class PlayRenameItemC2S(Packet):
+	__slots__ = ('item_name',)
+
+	FIELDS = (
+		('item_name', STRING),
+	)
+
 	def __init__(self,
 		item_name: str, # String (32767)
 	):
 		self.item_name = item_name # The new name of the item.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_string(self.item_name)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		item_name = r.read_string()
-		return cls(item_name)
-
 @final
 class PlayResourcePackC2S(Packet):
+	__slots__ = ('result',)
+
+	FIELDS = (
+		('result', VARINT),
+	)
+
 	def __init__(self,
 		result: int, # VarInt Enum
 	):
 		self.result = result # 0: successfully loaded, 1: declined, 2: failed download, 3: accepted.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_varint(self.result)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		result = r.read_varint()
-		return cls(result)
-
 @final
 class PlaySeenAdvancementsC2S(Packet):
+	__slots__ = ('action', 'tab_id')
+
+	HEAD_FIELDS = (
+		('action', VARINT),
+	)
+
 	def __init__(self,
 		action: int, # VarInt Enum
 		tab_id: str | None, # Optional identifier
@@ -5973,21 +5971,28 @@ class PlaySeenAdvancementsC2S(Packet):
 
 @final
 class PlaySelectTradeC2S(Packet):
+	__slots__ = ('selected_slot',)
+
+	FIELDS = (
+		('selected_slot', VARINT),
+	)
+
 	def __init__(self,
 		selected_slot: int, # VarInt
 	):
 		self.selected_slot = selected_slot # The selected slot in the players current (trading) inventory. (Was a full Integer for the plugin message).
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_varint(self.selected_slot)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		selected_slot = r.read_varint()
-		return cls(selected_slot)
-
 @final
 class PlaySetBeaconEffectC2S(Packet):
+	__slots__ = ('has_primary_effect', 'primary_effect', 'has_secondary_effect', 'secondary_effect')
+
+	FIELDS = (
+		('has_primary_effect', BOOL),
+		('primary_effect', VARINT),
+		('has_secondary_effect', BOOL),
+		('secondary_effect', VARINT),
+	)
+
 	def __init__(self,
 		has_primary_effect: bool, # Boolean
 		primary_effect: int, # VarInt
@@ -5999,37 +6004,30 @@ class PlaySetBeaconEffectC2S(Packet):
 		self.has_secondary_effect = has_secondary_effect # 
 		self.secondary_effect = secondary_effect # A Potion ID. (Was a full Integer for the plugin message).
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_bool(self.has_primary_effect)
-		b.write_varint(self.primary_effect)
-		b.write_bool(self.has_secondary_effect)
-		b.write_varint(self.secondary_effect)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		has_primary_effect = r.read_bool()
-		primary_effect = r.read_varint()
-		has_secondary_effect = r.read_bool()
-		secondary_effect = r.read_varint()
-		return cls(has_primary_effect, primary_effect, has_secondary_effect, secondary_effect)
-
 @final
 class PlaySetHeldItemC2S(Packet):
+	__slots__ = ('slot',)
+
+	FIELDS = (
+		('slot', SHORT),
+	)
+
 	def __init__(self,
 		slot: int, # Short
 	):
 		self.slot = slot # The slot which the player has selected (0–8).
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_short(self.slot)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		slot = r.read_short()
-		return cls(slot)
-
 @final
 class PlayProgramCommandBlockC2S(Packet):
+	__slots__ = ('location', 'command', 'mode', 'flags')
+
+	FIELDS = (
+		('location', POSITION),
+		('command', STRING),
+		('mode', VARINT),
+		('flags', BYTE),
+	)
+
 	def __init__(self,
 		location: tuple[int, int, int], # Position
 		command: str, # String (32767)
@@ -6041,22 +6039,16 @@ class PlayProgramCommandBlockC2S(Packet):
 		self.mode = mode # One of SEQUENCE (0), AUTO (1), or REDSTONE (2).
 		self.flags = flags # 0x01: Track Output (if false, the output of the previous command will not be stored within the command block); 0x02: Is conditional; 0x04: Automatic.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_pos_1_14(self.location)
-		b.write_string(self.command)
-		b.write_varint(self.mode)
-		b.write_byte(self.flags)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		location = r.read_pos_1_14()
-		command = r.read_string()
-		mode = r.read_varint()
-		flags = r.read_byte()
-		return cls(location, command, mode, flags)
-
 @final
 class PlayProgramCommandBlockMinecartC2S(Packet):
+	__slots__ = ('entity_id', 'command', 'track_output')
+
+	FIELDS = (
+		('entity_id', VARINT),
+		('command', STRING),
+		('track_output', BOOL),
+	)
+
 	def __init__(self,
 		entity_id: int, # VarInt
 		command: str, # String (32767)
@@ -6066,20 +6058,14 @@ class PlayProgramCommandBlockMinecartC2S(Packet):
 		self.command = command # 
 		self.track_output = track_output # If false, the output of the previous command will not be stored within the command block.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_varint(self.entity_id)
-		b.write_string(self.command)
-		b.write_bool(self.track_output)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		entity_id = r.read_varint()
-		command = r.read_string()
-		track_output = r.read_bool()
-		return cls(entity_id, command, track_output)
-
 @final
 class PlaySetCreativeModeSlotC2S(Packet):
+	__slots__ = ('slot', 'clicked_item')
+
+	HEAD_FIELDS = (
+		('slot', SHORT),
+	)
+
 	def __init__(self,
 		slot: int, # Short
 		clicked_item: Slot, # Slot
@@ -6099,6 +6085,17 @@ class PlaySetCreativeModeSlotC2S(Packet):
 
 @final
 class PlayProgramJigsawBlockC2S(Packet):
+	__slots__ = ('location', 'name', 'target', 'pool', 'final_state', 'joint_type')
+
+	FIELDS = (
+		('location', POSITION),
+		('name', STRING),
+		('target', STRING),
+		('pool', STRING),
+		('final_state', STRING),
+		('joint_type', STRING),
+	)
+
 	def __init__(self,
 		location: tuple[int, int, int], # Position
 		name: str, # Identifier
@@ -6114,26 +6111,29 @@ class PlayProgramJigsawBlockC2S(Packet):
 		self.final_state = final_state # "Turns into" on the GUI, final_state in NBT.
 		self.joint_type = joint_type # rollable if the attached piece can be rotated, else aligned.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_pos_1_14(self.location)
-		b.write_string(self.name)
-		b.write_string(self.target)
-		b.write_string(self.pool)
-		b.write_string(self.final_state)
-		b.write_string(self.joint_type)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		location = r.read_pos_1_14()
-		name = r.read_string()
-		target = r.read_string()
-		pool = r.read_string()
-		final_state = r.read_string()
-		joint_type = r.read_string()
-		return cls(location, name, target, pool, final_state, joint_type)
-
 @final
 class PlayProgramStructureBlockC2S(Packet):
+	__slots__ = ('location', 'action', 'mode', 'name', 'offset_x', 'offset_y', 'offset_z', 'size_x', 'size_y', 'size_z', 'mirror', 'rotation', 'metadata', 'integrity', 'seed', 'flags')
+
+	FIELDS = (
+		('location', POSITION),
+		('action', VARINT),
+		('mode', VARINT),
+		('name', STRING),
+		('offset_x', BYTE),
+		('offset_y', BYTE),
+		('offset_z', BYTE),
+		('size_x', BYTE),
+		('size_y', BYTE),
+		('size_z', BYTE),
+		('mirror', VARINT),
+		('rotation', VARINT),
+		('metadata', STRING),
+		('integrity', FLOAT),
+		('seed', VARLONG),
+		('flags', BYTE),
+	)
+
 	def __init__(self,
 		location: tuple[int, int, int], # Position
 		action: int, # VarInt Enum
@@ -6169,46 +6169,18 @@ class PlayProgramStructureBlockC2S(Packet):
 		self.seed = seed # 
 		self.flags = flags # 0x01: Ignore entities; 0x02: Show air; 0x04: Show bounding box.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_pos_1_14(self.location)
-		b.write_varint(self.action)
-		b.write_varint(self.mode)
-		b.write_string(self.name)
-		b.write_byte(self.offset_x)
-		b.write_byte(self.offset_y)
-		b.write_byte(self.offset_z)
-		b.write_byte(self.size_x)
-		b.write_byte(self.size_y)
-		b.write_byte(self.size_z)
-		b.write_varint(self.mirror)
-		b.write_varint(self.rotation)
-		b.write_string(self.metadata)
-		b.write_float(self.integrity)
-		b.write_varlong(self.seed)
-		b.write_byte(self.flags)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		location = r.read_pos_1_14()
-		action = r.read_varint()
-		mode = r.read_varint()
-		name = r.read_string()
-		offset_x = r.read_byte()
-		offset_y = r.read_byte()
-		offset_z = r.read_byte()
-		size_x = r.read_byte()
-		size_y = r.read_byte()
-		size_z = r.read_byte()
-		mirror = r.read_varint()
-		rotation = r.read_varint()
-		metadata = r.read_string()
-		integrity = r.read_float()
-		seed = r.read_varlong()
-		flags = r.read_byte()
-		return cls(location, action, mode, name, offset_x, offset_y, offset_z, size_x, size_y, size_z, mirror, rotation, metadata, integrity, seed, flags)
-
 @final
 class PlayUpdateSignC2S(Packet):
+	__slots__ = ('location', 'line_1', 'line_2', 'line_3', 'line_4')
+
+	FIELDS = (
+		('location', POSITION),
+		('line_1', STRING),
+		('line_2', STRING),
+		('line_3', STRING),
+		('line_4', STRING),
+	)
+
 	def __init__(self,
 		location: tuple[int, int, int], # Position
 		line_1: str, # String (384)
@@ -6222,54 +6194,36 @@ class PlayUpdateSignC2S(Packet):
 		self.line_3 = line_3 # Third line of text in the sign.
 		self.line_4 = line_4 # Fourth line of text in the sign.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_pos_1_14(self.location)
-		b.write_string(self.line_1)
-		b.write_string(self.line_2)
-		b.write_string(self.line_3)
-		b.write_string(self.line_4)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		location = r.read_pos_1_14()
-		line_1 = r.read_string()
-		line_2 = r.read_string()
-		line_3 = r.read_string()
-		line_4 = r.read_string()
-		return cls(location, line_1, line_2, line_3, line_4)
-
 @final
 class PlaySwingArmC2S(Packet):
+	__slots__ = ('hand',)
+
+	FIELDS = (
+		('hand', VARINT),
+	)
+
 	def __init__(self,
 		hand: int, # VarInt Enum
 	):
 		self.hand = hand # Hand used for the animation. 0: main hand, 1: off hand.
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_varint(self.hand)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		hand = r.read_varint()
-		return cls(hand)
-
 @final
 class PlayTeleportToEntityC2S(Packet):
+	__slots__ = ('target_player',)
+
+	FIELDS = (
+		('target_player', UUID),
+	)
+
 	def __init__(self,
 		target_player: uuid.UUID, # UUID
 	):
 		self.target_player = target_player # UUID of the player to teleport to (can also be an entity UUID).
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_uuid(self.target_player)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		target_player = r.read_uuid()
-		return cls(target_player)
-
 @final
 class PlayUseItemOnC2S(Packet):
+	__slots__ = ('hand', 'location', 'face', 'cursor_position_x', 'cursor_position_y', 'cursor_position_z', 'inside_block', 'sequence')
+
 	def __init__(self,
 		hand: int, # VarInt Enum
 		location: tuple[int, int, int], # Position
@@ -6301,6 +6255,13 @@ class PlayUseItemOnC2S(Packet):
 
 @final
 class PlayUseItemC2S(Packet):
+	__slots__ = ('hand', 'sequence')
+
+	FIELDS = (
+		('hand', VARINT),
+		('sequence', VARINT),
+	)
+
 	def __init__(self,
 		hand: int, # VarInt Enum
 		sequence: int, # VarInt
@@ -6308,16 +6269,6 @@ class PlayUseItemC2S(Packet):
 		self.hand = hand # Hand used for the animation. 0: main hand, 1: off hand.
 		self.sequence = sequence # 
 
-	def to_bytes(self, b: PacketBuffer) -> None:
-		b.write_varint(self.hand)
-		b.write_varint(self.sequence)
-
-	@classmethod
-	def parse_from(cls, r: PacketReader) -> Self:
-		hand = r.read_varint()
-		sequence = r.read_varint()
-		return cls(hand, sequence)
-
 Packet.register(PacketRepo(762, # 1.19.4
 	PacketStatusMap()
 	.add(ConnStatus.HANDSHAKING, PacketIdMap()
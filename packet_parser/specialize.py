@@ -0,0 +1,392 @@
+
+import hashlib
+import json
+import marshal
+import os
+import struct
+import sys
+from typing import Any, Callable, Iterable
+
+from .fields import (
+	FieldType, Layout,
+	UUID, POSITION,
+	VARINT, VARLONG, STRING, JSON, BYTES, REST,
+	_decode_uuid, _decode_position, _encode_position,
+)
+
+__all__ = [
+	'generate_source',
+	'specialize',
+	'compile_peek',
+]
+
+_CACHE_MAGIC = b'PPSPEC1\n'
+
+class _Writer:
+	__slots__ = ('lines', 'indent')
+
+	def __init__(self):
+		self.lines: list[str] = []
+		self.indent = 0
+
+	def __call__(self, line: str) -> None:
+		self.lines.append('\t' * self.indent + line)
+
+def _groups(layout: Layout) -> list[tuple[str | None, list[tuple[int, str, FieldType]]]]:
+	# [(flag, [(index, name, type)])], consecutive fields guarded by the same flag form one group
+	groups: list[tuple[str | None, list[tuple[int, str, FieldType]]]] = []
+	for i, (name, typ) in enumerate(layout.fields):
+		if not groups or groups[-1][0] != typ.flag:
+			groups.append((typ.flag, []))
+		groups[-1][1].append((i, name, typ.element if typ.flag is not None else typ)) # type: ignore[arg-type]
+	return groups
+
+def _runs(fields: list[tuple[int, str, FieldType]]) -> list[list[tuple[int, str, FieldType]]]:
+	# consecutive fixed-width fields are merged into one run, each variable field is a run by itself
+	runs: list[list[tuple[int, str, FieldType]]] = []
+	for f in fields:
+		if f[2].fixed and runs and runs[-1][-1][2].fixed:
+			runs[-1].append(f)
+		else:
+			runs.append([f])
+	return runs
+
+class _Module:
+	"""
+	Collects the source of the specialized functions and the module level constants they use
+	"""
+
+	__slots__ = ('head', 'structs', 'types', 'body')
+
+	def __init__(self):
+		self.head: list[str] = []
+		self.structs: dict[str, str] = {}
+		self.types: dict[tuple[str, int], str] = {}
+		self.body: list[str] = []
+
+	def struct(self, fmt: str) -> str:
+		name = self.structs.get(fmt, None)
+		if name is None:
+			name = self.structs[fmt] = f'_S{len(self.structs)}'
+			self.head.append(f'{name} = _struct.Struct({repr(fmt)})')
+		return name
+
+	def field_type(self, cls_name: str, index: int) -> str:
+		# field types which are not inlined are looked up from the class when the module is executed
+		key = (cls_name, index)
+		name = self.types.get(key, None)
+		if name is None:
+			name = self.types[key] = f'_T{len(self.types)}'
+			self.head.append(f'{name} = _field_type({repr(cls_name)}, {index})')
+		return name
+
+def _fixed_decode(w: _Writer, run: list[tuple[int, str, FieldType]]) -> None:
+	for _, name, typ in run:
+		if typ is POSITION:
+			w(f'f_{name} = _decode_position(f_{name})')
+		elif typ is UUID:
+			w(f'f_{name} = _decode_uuid(f_{name})')
+
+def _unpack_varint(w: _Writer, target: str, bits: int) -> None:
+	w('_c = _buf[_o]')
+	w('_o += 1')
+	w(f'{target} = _c & 0x7f')
+	w('if _c & 0x80:')
+	w.indent += 1
+	w('_s = 7')
+	w('while True:')
+	w.indent += 1
+	w('_c = _buf[_o]')
+	w('_o += 1')
+	w(f'{target} |= (_c & 0x7f) << _s')
+	w('if not _c & 0x80:')
+	w('\tbreak')
+	w('_s += 7')
+	w(f'if _s >= {bits}:')
+	w('\traise ValueError(\'VarInt is too big\')')
+	w.indent -= 1
+	w(f'if {target} >> {bits - 1}:')
+	w(f'\t{target} -= {1 << bits}')
+	w.indent -= 1
+
+def _unpack_sized(w: _Writer, target: str, expr: str, what: str) -> None:
+	_unpack_varint(w, '_n', 32)
+	w('_e = _o + _n')
+	w('if _n < 0 or _e > len(_buf):')
+	w(f'\traise ValueError(f\'Invalid {what} length {{_n}}\')')
+	w(f'{target} = {expr}')
+	w('_o = _e')
+
+def _skip_varint(w: _Writer) -> None:
+	w('while _buf[_o] & 0x80:')
+	w('\t_o += 1')
+	w('_o += 1')
+
+def _emit_unpack(w: _Writer, mod: _Module, cls_name: str, layout: Layout,
+	last: int | None = None, needed: set[int] | None = None) -> None:
+	# decode the fields up to `last`, the fields which are not in `needed` are skipped over
+	for flag, fields in _groups(layout):
+		if last is not None:
+			fields = [f for f in fields if f[0] <= last]
+			if not fields:
+				break
+		if flag is not None:
+			w(f'if f_{flag}:')
+			w.indent += 1
+		for run in _runs(fields):
+			i, name, typ = run[0]
+			fmt = '>' + ''.join(t.fmt for _, _, t in run) if typ.fixed else '' # type: ignore[misc]
+			if needed is not None and not any(f[0] in needed for f in run):
+				if typ.fixed:
+					w(f'_o += {struct.calcsize(fmt)}')
+				elif typ is VARINT or typ is VARLONG:
+					_skip_varint(w)
+				elif typ is STRING or typ is JSON or typ is BYTES:
+					_unpack_varint(w, '_n', 32)
+					w('if _n < 0:')
+					w('\traise ValueError(f\'Invalid length {_n}\')')
+					w('_o += _n')
+				elif typ is not REST:
+					w(f'_o = {mod.field_type(cls_name, i)}.skip(_buf, _o)')
+			elif typ.fixed:
+				st = mod.struct(fmt)
+				targets = ', '.join(f'f_{n}' for _, n, _ in run)
+				w(f'{targets}{"," if len(run) == 1 else ""} = {st}.unpack_from(_buf, _o)')
+				w(f'_o += {struct.calcsize(fmt)}')
+				_fixed_decode(w, run)
+			elif typ is VARINT:
+				_unpack_varint(w, f'f_{name}', 32)
+			elif typ is VARLONG:
+				_unpack_varint(w, f'f_{name}', 64)
+			elif typ is STRING:
+				_unpack_sized(w, f'f_{name}', 'str(_buf[_o:_e], \'utf8\')', 'string')
+			elif typ is JSON:
+				_unpack_sized(w, f'f_{name}', '_json_loads(str(_buf[_o:_e], \'utf8\'))', 'string')
+			elif typ is BYTES:
+				_unpack_sized(w, f'f_{name}', 'bytes(_buf[_o:_e])', 'byte array')
+			elif typ is REST:
+				w(f'f_{name} = bytes(_buf[_o:])')
+				w('_o = len(_buf)')
+			else:
+				w(f'f_{name}, _o = {mod.field_type(cls_name, i)}.unpack_from(_buf, _o)')
+		if flag is not None:
+			w.indent -= 1
+			w('else:')
+			w('\t' + ' = '.join(f'f_{n}' for _, n, _ in fields) + ' = None')
+
+def _gen_unpack(mod: _Module, cls_name: str, layout: Layout) -> None:
+	w = _Writer()
+	w(f'def _unpack_{cls_name}(cls, _buf, _o=0):')
+	w.indent += 1
+	w('try:')
+	w.indent += 1
+	_emit_unpack(w, mod, cls_name, layout)
+	w.indent -= 1
+	w('except (IndexError, _struct.error):')
+	w('\traise ValueError(\'Truncated packet data\') from None')
+	w('return cls(' + ', '.join(f'f_{n}' for n in layout.names) + '), _o')
+	mod.body.append('\n'.join(w.lines))
+
+def _gen_parse(mod: _Module, cls_name: str, layout: Layout) -> None:
+	w = _Writer()
+	w(f'def _parse_{cls_name}(cls, _r):')
+	w.indent += 1
+	w('_read = _r.read')
+	for flag, fields in _groups(layout):
+		if flag is not None:
+			w(f'if f_{flag}:')
+			w.indent += 1
+		for run in _runs(fields):
+			i, name, typ = run[0]
+			if typ.fixed:
+				fmt = '>' + ''.join(t.fmt for _, _, t in run) # type: ignore[misc]
+				st = mod.struct(fmt)
+				targets = ', '.join(f'f_{n}' for _, n, _ in run)
+				w(f'{targets}{"," if len(run) == 1 else ""} = {st}.unpack(_read({struct.calcsize(fmt)}))')
+				_fixed_decode(w, run)
+			elif typ is VARINT:
+				w(f'f_{name} = _r.read_varint()')
+			elif typ is VARLONG:
+				w(f'f_{name} = _r.read_varlong()')
+			elif typ is STRING:
+				w(f'f_{name} = _r.read_string()')
+			elif typ is JSON:
+				w(f'f_{name} = _r.read_json()')
+			elif typ is BYTES:
+				w(f'f_{name} = _read(_r.read_varint())')
+			elif typ is REST:
+				w(f'f_{name} = _read()')
+			else:
+				w(f'f_{name} = {mod.field_type(cls_name, i)}.read(_r)')
+		if flag is not None:
+			w.indent -= 1
+			w('else:')
+			w('\t' + ' = '.join(f'f_{n}' for _, n, _ in fields) + ' = None')
+	w('return cls(' + ', '.join(f'f_{n}' for n in layout.names) + ')')
+	mod.body.append('\n'.join(w.lines))
+
+def _pack_varint(w: _Writer, expr: str, bits: int) -> None:
+	w(f'_v = {expr} & {(1 << bits) - 1}')
+	w('while _v > 0x7f:')
+	w('\t_out.append((_v & 0x7f) | 0x80)')
+	w('\t_v >>= 7')
+	w('_out.append(_v)')
+
+def _gen_write(mod: _Module, cls_name: str, layout: Layout) -> None:
+	w = _Writer()
+	w(f'def _write_{cls_name}(self, _b):')
+	w.indent += 1
+	# the payload is built in one buffer, which is flushed only before the fields encoded by the PacketBuffer
+	w('_out = bytearray()')
+	for flag, fields in _groups(layout):
+		if flag is not None:
+			w(f'if self.{flag}:')
+			w.indent += 1
+		for run in _runs(fields):
+			i, name, typ = run[0]
+			if typ.fixed:
+				st = mod.struct('>' + ''.join(t.fmt for _, _, t in run)) # type: ignore[misc]
+				args = []
+				for _, n, t in run:
+					if t is POSITION:
+						args.append(f'_encode_position(self.{n})')
+					elif t is UUID:
+						args.append(f'self.{n}.bytes')
+					else:
+						args.append(f'self.{n}')
+				w(f'_out += {st}.pack({", ".join(args)})')
+			elif typ is VARINT:
+				_pack_varint(w, f'self.{name}', 32)
+			elif typ is VARLONG:
+				_pack_varint(w, f'self.{name}', 64)
+			elif typ is STRING or typ is BYTES:
+				w(f'_e = self.{name}.encode(\'utf8\')' if typ is STRING else f'_e = self.{name}')
+				_pack_varint(w, 'len(_e)', 32)
+				w('_out += _e')
+			elif typ is REST:
+				w(f'_out += self.{name}')
+			else:
+				w('if _out:')
+				w('\t_b.write(_out)')
+				w('\t_out = bytearray()')
+				if typ is JSON:
+					w(f'_b.write_json(self.{name})')
+				else:
+					w(f'{mod.field_type(cls_name, i)}.write(_b, self.{name})')
+		if flag is not None:
+			w.indent -= 1
+	w('if _out:')
+	w('\t_b.write(_out)')
+	mod.body.append('\n'.join(w.lines))
+
+def generate_source(classes: Iterable[type]) -> str:
+	"""
+	Generate the source of one flat parse_from, unpack_from and encoder function for each class with a Layout
+	"""
+	mod = _Module()
+	for cls in classes:
+		layout: Layout = cls._LAYOUT # type: ignore[attr-defined]
+		for _, typ in layout.fields:
+			t = typ.element if typ.flag is not None else typ
+			assert t is not None
+			if t.fixed and (t.decode is not None or t.encode is not None) and t is not UUID and t is not POSITION:
+				raise ValueError(f'Cannot specialize {cls.__name__}: {t.name} has custom converters')
+		_gen_unpack(mod, cls.__name__, layout)
+		_gen_parse(mod, cls.__name__, layout)
+		_gen_write(mod, cls.__name__, layout)
+	return '\n'.join(mod.head) + '\n\n' + '\n\n'.join(mod.body) + '\n'
+
+def _load_cached(path: str, key: bytes) -> Any:
+	try:
+		with open(path, 'rb') as fd:
+			data = fd.read()
+	except OSError:
+		return None
+	head = _CACHE_MAGIC + key
+	if not data.startswith(head):
+		return None
+	try:
+		return marshal.loads(data[len(head):])
+	except (EOFError, ValueError, TypeError):
+		return None
+
+def _save_cached(path: str, key: bytes, code: Any) -> None:
+	if sys.dont_write_bytecode:
+		return
+	tmp = f'{path}.{os.getpid()}.tmp'
+	try:
+		os.makedirs(os.path.dirname(path), exist_ok=True)
+		with open(tmp, 'wb') as fd:
+			fd.write(_CACHE_MAGIC + key + marshal.dumps(code))
+		os.replace(tmp, path)
+	except OSError:
+		# e.g. the plugin is loaded from a packed archive, the functions are compiled again next time
+		try:
+			os.remove(tmp)
+		except OSError:
+			pass
+
+def _namespace(field_type: Callable[[str, int], FieldType]) -> dict[str, Any]:
+	return {
+		'_struct': struct,
+		'_json_loads': json.loads,
+		'_decode_uuid': _decode_uuid,
+		'_decode_position': _decode_position,
+		'_encode_position': _encode_position,
+		'_field_type': field_type,
+	}
+
+def specialize(classes: Iterable[type], protocol: int, cache_dir: str | None = None) -> None:
+	"""
+	Replace the table-driven parse_from, unpack_from and encoder of the classes with generated flat functions.
+	The compiled code is cached in `cache_dir` under the protocol version and reused while the layouts are unchanged.
+	"""
+	classes = [cls for cls in classes if getattr(cls, '_LAYOUT', None) is not None]
+	by_name = {cls.__name__: cls for cls in classes}
+	source = generate_source(classes)
+	key = hashlib.sha256(source.encode('utf8')).hexdigest().encode('ascii') + b'\n'
+	code = None
+	path = None
+	if cache_dir is not None:
+		path = os.path.join(cache_dir, f'packets_{protocol}.{sys.implementation.cache_tag}.spec')
+		code = _load_cached(path, key)
+	if code is None:
+		code = compile(source, f'<packets {protocol}>', 'exec')
+		if path is not None:
+			_save_cached(path, key, code)
+	namespace = _namespace(lambda name, i: by_name[name]._LAYOUT.fields[i][1]) # type: ignore[attr-defined]
+	exec(code, namespace)
+	for name, cls in by_name.items():
+		cls.unpack_from = classmethod(namespace[f'_unpack_{name}']) # type: ignore[attr-defined]
+		cls.parse_from = classmethod(namespace[f'_parse_{name}']) # type: ignore[attr-defined]
+		cls.to_bytes = namespace[f'_write_{name}'] # type: ignore[attr-defined]
+
+def compile_peek(layout: Layout, names: tuple[str, ...]) -> Callable[..., tuple]:
+	"""
+	Compile a function (buf, offset=0) which decodes only the named fields and returns them as a tuple.
+	It reads no further than the last of the fields, the fields before them are skipped over
+	unless they are flags of optional fields.
+	"""
+	try:
+		wanted = [layout.index[name] for name in names]
+	except KeyError as e:
+		raise ValueError(f'Unknown field {repr(e.args[0])}') from None
+	last = max(wanted, default=-1)
+	needed = set(wanted)
+	needed.update(f for f in layout.flags[:last + 1] if f >= 0)
+	mod = _Module()
+	w = _Writer()
+	w('def _peek(_buf, _o=0):')
+	w.indent += 1
+	w('try:')
+	w.indent += 1
+	_emit_unpack(w, mod, '', layout, last, needed)
+	w('pass')
+	w.indent -= 1
+	w('except (IndexError, _struct.error):')
+	w('\traise ValueError(\'Truncated packet data\') from None')
+	w('return (' + ''.join(f'f_{layout.names[i]}, ' for i in wanted) + ')')
+	source = '\n'.join(mod.head) + '\n\n' + '\n'.join(w.lines) + '\n'
+	namespace = _namespace(lambda name, i: layout.fields[i][1])
+	exec(compile(source, f'<peek {", ".join(names)}>', 'exec'), namespace)
+	return namespace['_peek']